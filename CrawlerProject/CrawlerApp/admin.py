@@ -1,7 +1,12 @@
 from django.contrib import admin
-from .models import NewsArticle
+from .models import NewsArticle, FeedState
 
 @admin.register(NewsArticle)
 class NewsArticleAdmin(admin.ModelAdmin):
     list_display = ("id", "title", "top_words")
-    search_fields = ("title", "extracted_words", "top_words")
\ No newline at end of file
+    search_fields = ("title", "extracted_words", "top_words")
+
+@admin.register(FeedState)
+class FeedStateAdmin(admin.ModelAdmin):
+    list_display = ("url", "etag", "last_modified", "checked_at", "changed_at")
+    search_fields = ("url",)
\ No newline at end of file
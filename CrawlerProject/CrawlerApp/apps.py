@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class CrawlerappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'CrawlerApp'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .dbtune import configure_sqlite
+        from .metrics import instrument_connection
+        connection_created.connect(configure_sqlite, dispatch_uid="CrawlerApp.dbtune")
+        connection_created.connect(instrument_connection, dispatch_uid="CrawlerApp.metrics")
@@ -0,0 +1,223 @@
+# CrawlerApp/bodies.py
+"""
+기사 본문 수집 + 본문 추출 (crawl_news --bodies)
+
+- 링크는 정규화(CrawlerApp.urlnorm)로 Google 리다이렉트를 먼저 풀고, 남은 HTTP 리다이렉트는 따라간다
+  Google News 중간 페이지(data-n-au 속성에 원문 주소)가 오면 한 번 더 이동
+- httpx.AsyncClient 하나를 커넥션 풀로 공유, 동시 요청 수 제한 + 호스트별 최소 요청 간격 (fetcher 와 같은 방식)
+- 응답은 스트리밍으로 받고 MAX_BYTES 에서 자른다 → 처리 중인 페이지 하나당 메모리 상한
+- 본문 추출은 lxml (스레드 풀): 잡음 태그 제거 → 알려진 본문 영역(네이버 #dic_area, articleBody, <article>)
+  → 없으면 문단 텍스트가 가장 많은 블록
+- ArticleBody 캐시: 이미 받은 링크/최종 주소는 다시 받지 않고, 같은 내용(sha256)은 추출도 다시 하지 않는다
+"""
+import asyncio
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import httpx
+
+from .fetcher import USER_AGENT, HostRateLimiter
+from .urlnorm import canonical_url
+
+MAX_BYTES = 2 * 1024 * 1024
+MIN_TEXT = 200  # 본문 영역으로 인정할 최소 글자 수
+
+DROP_TAGS = ("script", "style", "noscript", "iframe", "nav", "header", "footer", "aside", "form",
+             "button", "select", "svg", "figure", "figcaption")
+BODY_XPATHS = (
+    '//*[@id="dic_area"]',              # 네이버 뉴스
+    '//*[@id="articleBodyContents"]',   # 네이버 (예전)
+    '//*[@itemprop="articleBody"]',     # schema.org
+    '//article',
+)
+BLOCK_TAGS = ("div", "section", "article", "td", "main")
+_GOOGLE_TARGET_RE = re.compile(rb'data-n-au="(https?://[^"]+)"')
+_CHARSET_RE = re.compile(r"charset=([\w-]+)", re.I)
+_SPACE_RE = re.compile(r"[ \t\r\f\v]+")
+
+
+@dataclass
+class BodyResult:
+    link: str
+    final_url: str = ""
+    status: int = 0
+    text: str = ""
+    content_hash: str = ""
+    error: str = ""
+    nbytes: int = 0
+    fetch_time: float = 0.0
+    cached: bool = False  # 이번 실행에서 같은 주소/내용을 이미 처리함
+
+
+def _clean(text):
+    lines = (_SPACE_RE.sub(" ", ln).strip() for ln in text.splitlines())
+    return "\n".join(ln for ln in lines if ln)
+
+
+def _own_text(el):
+    """자식 블록을 뺀 이 요소의 텍스트 + 바로 아래 <p>/<br> 텍스트 길이"""
+    n = len((el.text or "").strip())
+    for child in el:
+        if child.tag == "p":
+            n += len(child.text_content().strip())
+        n += len((child.tail or "").strip())
+    return n
+
+
+def extract_text(content: bytes, charset=None) -> str:
+    """HTML → 본문 텍스트 (못 찾으면 빈 문자열)"""
+    from lxml import etree, html as lxml_html
+
+    try:
+        try:
+            parser = lxml_html.HTMLParser(encoding=charset) if charset else None
+        except LookupError:  # Content-Type 의 charset 이 모르는 이름 → lxml 이 문서에서 알아서 판단
+            parser = None
+        doc = lxml_html.fromstring(content, parser=parser)
+    except (etree.ParserError, ValueError, LookupError):
+        return ""
+    for el in doc.xpath(" | ".join(f"//{t}" for t in DROP_TAGS)):
+        el.drop_tree()
+    for xp in BODY_XPATHS:
+        for el in doc.xpath(xp):
+            text = _clean(el.text_content())
+            if len(text) >= MIN_TEXT:
+                return text
+    best, best_score = None, 0
+    for el in doc.iter(*BLOCK_TAGS):
+        score = _own_text(el)
+        if score > best_score:
+            best, best_score = el, score
+    return _clean(best.text_content()) if best is not None else ""
+
+
+def _charset(response):
+    m = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    return m.group(1) if m else None
+
+
+class BodyFetcher:
+    def __init__(self, client, *, concurrency=16, host_interval=0.0):
+        self.client = client
+        self.sem = asyncio.Semaphore(max(1, concurrency))
+        self.limiter = HostRateLimiter(host_interval)
+        self._by_url = {}   # 최종 주소 -> Future[BodyResult] (다른 링크가 같은 기사로 리다이렉트되는 경우)
+        self._by_hash = {}  # sha256 -> 추출한 본문
+
+    async def _download(self, url):
+        """→ (최종 주소, 상태 코드, 본문 bytes, charset). MAX_BYTES 넘는 부분은 버린다"""
+        await self.limiter.wait(urlsplit(url).netloc)
+        async with self.client.stream("GET", url) as r:
+            final = canonical_url(str(r.url))
+            if r.status_code != 200:
+                return final, r.status_code, b"", None
+            ctype = r.headers.get("Content-Type", "text/html")
+            if "html" not in ctype and "xml" not in ctype:
+                return final, r.status_code, b"", None
+            buf = bytearray()
+            async for chunk in r.aiter_bytes():
+                buf += chunk
+                if len(buf) >= MAX_BYTES:
+                    del buf[MAX_BYTES:]
+                    break
+            return final, r.status_code, bytes(buf), _charset(r)
+
+    async def fetch(self, link):
+        res = BodyResult(link)
+        t0 = time.perf_counter()
+        async with self.sem:
+            try:
+                final, status, content, charset = await self._download(link)
+                if content and urlsplit(final).hostname == "news.google.com":
+                    m = _GOOGLE_TARGET_RE.search(content)
+                    if m:
+                        final, status, content, charset = await self._download(m.group(1).decode())
+            except Exception as e:  # httpx.HTTPError, InvalidURL(잘못된 data-n-au 주소) 등 → 이 링크만 실패
+                res.error = f"{type(e).__name__}: {e}"
+                res.fetch_time = time.perf_counter() - t0
+                return res
+        res.final_url, res.status, res.nbytes = final, status, len(content)
+        res.fetch_time = time.perf_counter() - t0
+        if status != 200:
+            res.error = f"HTTP {status}"
+            return res
+        res.content_hash = hashlib.sha256(content).hexdigest()
+        if res.content_hash in self._by_hash:
+            res.text, res.cached = self._by_hash[res.content_hash], True
+            return res
+        try:
+            res.text = await asyncio.to_thread(extract_text, content, charset)
+        except Exception as e:
+            res.error = f"{type(e).__name__}: {e}"
+            return res
+        self._by_hash[res.content_hash] = res.text
+        return res
+
+    async def fetch_once(self, link):
+        """같은 최종 주소로 가는 링크는 한 번만 받는다 (정규화한 링크 기준으로 먼저 합침)"""
+        fut = self._by_url.get(link)
+        if fut is not None:
+            res = await asyncio.shield(fut)
+            return BodyResult(link, res.final_url, res.status, res.text, res.content_hash, res.error,
+                              res.nbytes, 0.0, True)
+        fut = self._by_url[link] = asyncio.get_running_loop().create_future()
+        try:
+            res = await self.fetch(link)
+        except BaseException as e:
+            # fetch 는 링크별 오류를 BodyResult.error 로 돌려준다. 여기 오는 건 취소 정도
+            # → 기다리던 쪽에는 오류 결과만 넘기고(취소를 퍼뜨리지 않음), 다음 호출은 다시 받도록 지운다
+            del self._by_url[link]
+            fut.set_result(BodyResult(link, error=f"{type(e).__name__}: {e}"))
+            raise
+        fut.set_result(res)
+        if res.final_url and res.final_url not in self._by_url:
+            self._by_url[res.final_url] = fut
+        return res
+
+
+async def afetch_bodies(links, *, concurrency=16, host_interval=0.0, timeout=10.0, transport=None):
+    """링크 목록 → BodyResult 목록 (같은 순서)"""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True,
+                                 headers={"User-Agent": USER_AGENT}, transport=transport) as client:
+        fetcher = BodyFetcher(client, concurrency=concurrency, host_interval=host_interval)
+        return await asyncio.gather(*(fetcher.fetch_once(canonical_url(l)) for l in links))
+
+
+def fetch_bodies(links, **kw):
+    """afetch_bodies 의 동기 버전 (crawl_news 처럼 이벤트 루프 밖에서 호출)"""
+    return asyncio.run(afetch_bodies(list(links), **kw))
+
+
+def body_texts(links, **kw):
+    """
+    정규화한 링크 목록 → {링크: 본문 텍스트}. ArticleBody 에 있으면 캐시에서, 없으면 받아서 저장
+    실패한 링크는 결과에서 빠진다 (4xx 는 저장해서 다시 시도하지 않음, 네트워크 오류/5xx 는 다음 실행에서 재시도)
+    """
+    from .models import ArticleBody
+
+    links = list(dict.fromkeys(links))
+    texts = {}
+    for i in range(0, len(links), 500):
+        chunk = links[i:i + 500]
+        texts.update(ArticleBody.objects.filter(link__in=chunk).values_list("link", "text"))
+        # 예전에 다른 링크가 리다이렉트돼 도착한 주소
+        for final, text in (ArticleBody.objects.filter(final_url__in=[l for l in chunk if l not in texts])
+                            .values_list("final_url", "text")):
+            texts.setdefault(final, text)
+    todo = [l for l in links if l not in texts]
+    if not todo:
+        return texts
+
+    rows = []
+    for res in fetch_bodies(todo, **kw):
+        if res.status == 200:
+            texts[res.link] = res.text
+        if res.status == 200 or 400 <= res.status < 500:
+            rows.append(ArticleBody(link=res.link, final_url=res.final_url, status=res.status,
+                                    content_hash=res.content_hash, text=res.text, nbytes=res.nbytes))
+    ArticleBody.objects.bulk_create(rows, batch_size=500, ignore_conflicts=True)
+    return texts
@@ -0,0 +1,119 @@
+# CrawlerApp/cache.py
+"""
+프로세스 전역 LRU + TTL 캐시 (single-flight)
+
+같은 키를 동시에 요청하면 첫 요청만 fetch 함수를 실행하고
+나머지는 그 결과(concurrent.futures.Future)를 같이 기다린다.
+Future가 스레드 안전해서 동기 뷰/비동기 뷰(이벤트 루프가 달라도)가 같이 기다릴 수 있다.
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+_MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, maxsize=256, ttl=300.0, cache_empty=False, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_empty = cache_empty  # 빈 결과(업스트림 오류 등)도 저장할지
+        self._clock = clock
+        self._data = OrderedDict()  # key -> (만료 시각, 값)
+        self._inflight = {}         # key -> Future
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.shared = 0
+
+    def _get(self, key):
+        item = self._data.get(key)
+        if item is None:
+            return _MISSING
+        expires, value = item
+        if expires <= self._clock():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def _set(self, key, value):
+        self._data[key] = (self._clock() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def _claim(self, key):
+        """(캐시 값 또는 _MISSING, Future, 내가 fetch 해야 하는지)"""
+        with self._lock:
+            value = self._get(key)
+            if value is not _MISSING:
+                self.hits += 1
+                return value, None, False
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                self.misses += 1
+                fut = self._inflight[key] = Future()
+            else:
+                self.shared += 1
+            return _MISSING, fut, leader
+
+    def _resolve(self, key, fut, value=_MISSING, exc=None):
+        with self._lock:
+            if exc is None and (value or self.cache_empty):
+                self._set(key, value)
+            self._inflight.pop(key, None)
+        if exc is None:
+            fut.set_result(value)
+        else:
+            # 취소/인터럽트는 기다리던 쪽에 일반 오류로 넘긴다
+            fut.set_exception(exc if isinstance(exc, Exception) else RuntimeError(f"fetch aborted: {exc!r}"))
+
+    def get_or_fetch(self, key, fetch):
+        """캐시에 있으면 바로, 없으면 fetch() 한 번만 실행해서 결과를 공유"""
+        value, fut, leader = self._claim(key)
+        if value is not _MISSING:
+            return value
+        if not leader:
+            return fut.result()
+        try:
+            value = fetch()
+        except BaseException as e:
+            self._resolve(key, fut, exc=e)
+            raise
+        self._resolve(key, fut, value)
+        return value
+
+    async def aget_or_fetch(self, key, afetch):
+        """get_or_fetch 의 비동기 버전 (afetch 는 코루틴 함수)"""
+        value, fut, leader = self._claim(key)
+        if value is not _MISSING:
+            return value
+        if not leader:
+            return await asyncio.wrap_future(fut)
+        try:
+            value = await afetch()
+        except BaseException as e:
+            self._resolve(key, fut, exc=e)
+            raise
+        self._resolve(key, fut, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.shared = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses + self.shared
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared": self.shared,  # single-flight 로 합쳐진 요청
+                "hit_ratio": round((self.hits + self.shared) / total, 4) if total else 0.0,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+            }
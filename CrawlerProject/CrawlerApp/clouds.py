@@ -0,0 +1,138 @@
+# CrawlerApp/clouds.py
+"""
+워드클라우드 렌더링 + 내용 주소 캐시 (/api/wordcloud)
+
+- 캐시 키 = (단어, 가중치) 목록 + 크기 + 형식의 sha256 → 같은 데이터면 절대 다시 그리지 않음
+  (데이터가 바뀌면 키가 바뀌므로 재크롤링 없이 새 이미지가 나온다)
+- 디스크(WORDCLOUD_CACHE_DIR)에 PNG/SVG 파일로 저장, 전체 크기가 WORDCLOUD_CACHE_MAX_BYTES 를 넘으면
+  가장 오래 안 쓴 파일부터 한도의 EVICT_TO 비율까지 삭제 (읽을 때마다 mtime 갱신 = LRU)
+  디렉터리 전체 훑기는 프로세스가 쓴 양으로 센 사용량 추정치가 한도를 넘을 때만 (새 파일 쓸 때마다 하지 않음)
+- 그 앞에 작은 메모리 캐시(TTLCache): 같은 키 동시 요청은 한 번만 렌더링
+- wordcloud 패키지는 첫 렌더링 때 import, 폰트/마스크는 크기별 WordCloud 객체에 한 번만 로딩
+"""
+import asyncio
+import hashlib
+import io
+import json
+import os
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+
+from .cache import TTLCache
+
+FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+# 렌더링 옵션을 바꾸면 올려서 예전 캐시 파일을 무효화
+RENDER_VERSION = 1
+EVICT_TO = 0.8  # 정리할 때 한도의 이 비율까지 줄여서 다음 정리까지 여유를 둔다
+
+_memory = TTLCache(maxsize=64, ttl=600)
+_render_lock = threading.Lock()  # WordCloud 객체는 렌더링 중 상태를 들고 있어서 공유 시 직렬화
+_usage_lock = threading.Lock()
+_usage = None  # 캐시 디렉터리 크기 추정치 (처음 쓸 때 한 번 훑고, 이후 쓴 만큼 더함)
+
+
+def cache_key(weights, width, height, fmt):
+    """weights: [(단어, 가중치), ...] → 내용 주소 (가중치 순서와 무관)"""
+    payload = json.dumps([RENDER_VERSION, width, height, fmt, sorted((str(w), float(n)) for w, n in weights)],
+                         ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _path(key, fmt):
+    return os.path.join(settings.WORDCLOUD_CACHE_DIR, key[:2], f"{key}.{fmt}")
+
+
+@lru_cache(maxsize=1)
+def _mask():
+    if not settings.WORDCLOUD_MASK:
+        return None
+    import numpy as np
+    from PIL import Image
+    return np.array(Image.open(settings.WORDCLOUD_MASK))
+
+
+@lru_cache(maxsize=16)
+def _generator(width, height):
+    from wordcloud import WordCloud
+    return WordCloud(font_path=settings.WORDCLOUD_FONT_PATH, background_color="white",
+                     width=width, height=height, mask=_mask(), prefer_horizontal=0.8, random_state=0)
+
+
+def render(weights, width, height, fmt):
+    with _render_lock:
+        wc = _generator(width, height).generate_from_frequencies({str(w): float(n) for w, n in weights})
+        if fmt == "svg":
+            return wc.to_svg().encode("utf-8")
+        buf = io.BytesIO()
+        wc.to_image().save(buf, format="PNG", optimize=True)
+        return buf.getvalue()
+
+
+def _scan():
+    files = []
+    for root, _, names in os.walk(settings.WORDCLOUD_CACHE_DIR):
+        for name in names:
+            p = os.path.join(root, name)
+            try:
+                st = os.stat(p)
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+    return files
+
+
+def _evict(keep, added):
+    """
+    새 파일(added 바이트)을 쓴 뒤 호출. 사용량 추정치가 한도 이하이면 바로 끝
+    넘으면 디렉터리를 훑어 실제 크기로 다시 맞추고, mtime 이 오래된 파일부터 한도 × EVICT_TO 까지 삭제
+    """
+    global _usage
+    limit = settings.WORDCLOUD_CACHE_MAX_BYTES
+    with _usage_lock:
+        if _usage is not None:
+            _usage += added
+            if _usage <= limit:
+                return
+        files = _scan()
+        total = sum(size for _, size, _ in files)
+        if total > limit:
+            for _, size, p in sorted(files):
+                if total <= limit * EVICT_TO:
+                    break
+                if p == keep:
+                    continue
+                try:
+                    os.remove(p)
+                    total -= size
+                except FileNotFoundError:
+                    pass
+        _usage = total
+
+
+def load_or_render(key, weights, width, height, fmt):
+    path = _path(key, fmt)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path)  # LRU: 최근 사용
+        return data
+    except FileNotFoundError:
+        pass
+    data = render(weights, width, height, fmt)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    _evict(keep=path, added=len(data))
+    return data
+
+
+async def aget_cloud(weights, width, height, fmt, key=None):
+    """→ (이미지 바이트, 캐시 키). 렌더링/디스크 I/O 는 스레드에서 (key 는 cache_key 로 미리 구했으면 전달)"""
+    key = key or cache_key(weights, width, height, fmt)
+    data = await _memory.aget_or_fetch(
+        key, lambda: asyncio.to_thread(load_or_render, key, weights, width, height, fmt))
+    return data, key
@@ -0,0 +1,36 @@
+# CrawlerApp/dbtune.py
+"""
+SQLite 연결 설정 (connection_created 시그널, CrawlerappConfig.ready 에서 연결)
+
+- 새 연결마다 settings.SQLITE_PRAGMAS 를 적용 (값이 비어 있으면 그 PRAGMA 는 건너뜀)
+- 기본값은 WAL + synchronous=NORMAL: crawl_news 가 쓰는 동안에도 웹 뷰의 읽기가 막히지 않고
+  쓰기 충돌은 busy_timeout 동안 기다린다 ("database is locked" 대신)
+- journal_mode=WAL 은 DB 파일에 기록되는 설정이라 한 번 바뀌면 계속 유지된다
+"""
+import re
+
+from django.conf import settings
+
+_NAME_RE = re.compile(r"^[a-z_]+$")
+_VALUE_RE = re.compile(r"^-?\w+$")
+
+
+def pragma_statements(pragmas):
+    """{이름: 값} → PRAGMA 문 목록 (이름/값은 식별자·숫자만 허용)"""
+    stmts = []
+    for name, value in pragmas.items():
+        if value is None or value == "":
+            continue
+        value = str(value)
+        if not _NAME_RE.match(name) or not _VALUE_RE.match(value):
+            raise ValueError(f"invalid SQLite pragma: {name}={value}")
+        stmts.append(f"PRAGMA {name} = {value}")
+    return stmts
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as c:
+        for stmt in pragma_statements(settings.SQLITE_PRAGMAS):
+            c.execute(stmt)
@@ -0,0 +1,178 @@
+# CrawlerApp/fetcher.py
+"""
+RSS 피드 동시 수집 엔진 (crawl_news --concurrency)
+
+- httpx.AsyncClient 하나를 커넥션 풀로 공유
+- 전역 sleep 대신 호스트별 최소 요청 간격(rate limit)
+- feedparser 파싱은 이벤트 루프 밖(스레드 풀)에서 실행
+- states를 넘기면 ETag/Last-Modified 조건부 요청, 304나 본문 해시가 같으면 파싱 생략
+- iter_feeds()는 동기 제너레이터라서 ORM 작업은 호출한 스레드에서 그대로 하면 된다
+"""
+import asyncio
+import hashlib
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import feedparser
+import httpx
+
+USER_AGENT = "Mozilla/5.0 (compatible; CrawlerProject/1.0; +https://github.com/ui2030/Crawler-Project)"
+
+
+@dataclass
+class FeedResult:
+    url: str
+    status: int = 0
+    entries: list = field(default_factory=list)
+    error: str = ""
+    fetch_time: float = 0.0
+    parse_time: float = 0.0
+    etag: str = ""
+    last_modified: str = ""
+    content_hash: str = ""
+    unchanged: bool = False  # 304 또는 직전과 같은 본문
+
+
+class HostRateLimiter:
+    """같은 호스트에는 interval 초 이상 간격을 두고 요청한다."""
+
+    def __init__(self, interval: float):
+        self.interval = max(0.0, interval)
+        self._locks = {}
+        self._last = {}
+
+    async def wait(self, host: str):
+        if not self.interval:
+            return
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self._last.get(host, 0.0) + self.interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last[host] = time.monotonic()
+
+
+def _conditional_headers(state):
+    headers = {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+async def _fetch_one(client, url, limiter, sem, stop, state):
+    async with sem:
+        if stop.is_set():
+            return None
+        t0 = time.perf_counter()
+        try:
+            await limiter.wait(urlsplit(url).netloc)
+            t0 = time.perf_counter()
+            r = await client.get(url, headers=_conditional_headers(state))
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
+            # 잘못된 피드 주소(InvalidURL 은 HTTPError 가 아님)도 그 피드만 실패로 보고 나머지는 계속
+            return FeedResult(url, error=f"{type(e).__name__}: {e}", fetch_time=time.perf_counter() - t0)
+    res = FeedResult(url, status=r.status_code, fetch_time=time.perf_counter() - t0,
+                     etag=r.headers.get("ETag", state.get("etag", "")),
+                     last_modified=r.headers.get("Last-Modified", state.get("last_modified", "")),
+                     content_hash=state.get("content_hash", ""))
+    if r.status_code == 304:
+        res.unchanged = True
+        return res
+    if r.status_code != 200:
+        res.error = f"HTTP {r.status_code}"
+        return res
+
+    res.content_hash = hashlib.sha256(r.content).hexdigest()
+    if res.content_hash == state.get("content_hash"):
+        res.unchanged = True
+        return res
+
+    t1 = time.perf_counter()
+    d = await asyncio.to_thread(feedparser.parse, r.content, response_headers=dict(r.headers))
+    res.parse_time = time.perf_counter() - t1
+    res.entries = d.entries or []
+    return res
+
+
+async def fetch_feeds(urls, *, states=None, concurrency=8, host_interval=0.5, timeout=10.0,
+                      transport=None, stop=None):
+    """
+    완료되는 순서대로 FeedResult를 내보내는 async 제너레이터
+    states: {url: {"etag":..., "last_modified":..., "content_hash":...}}
+    """
+    states = states or {}
+    stop = stop or threading.Event()
+    concurrency = max(1, concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    limiter = HostRateLimiter(host_interval)
+    sem = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True,
+                                 headers={"User-Agent": USER_AGENT}, transport=transport) as client:
+        tasks = [asyncio.create_task(_fetch_one(client, u, limiter, sem, stop, states.get(u, {}))) for u in urls]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                res = await fut
+                if res is not None:
+                    yield res
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_DONE = object()
+
+
+def iter_feeds(urls, **kw):
+    """
+    fetch_feeds()를 별도 스레드의 이벤트 루프에서 돌리고 결과를 동기적으로 넘겨준다.
+    소비자가 중간에 멈추면(break / close) 진행 중인 요청까지 바로 취소된다.
+    """
+    out = queue.Queue()
+    stop = threading.Event()
+    cancel = []  # 이벤트 루프 스레드의 main 작업 취소 함수
+
+    def runner():
+        async def main():
+            task = asyncio.current_task()
+            cancel.append(lambda: task.get_loop().call_soon_threadsafe(task.cancel))
+            if stop.is_set():
+                return
+            async for res in fetch_feeds(urls, stop=stop, **kw):
+                out.put(res)
+                if stop.is_set():
+                    break
+        try:
+            asyncio.run(main())
+        except asyncio.CancelledError:  # 소비자가 멈춤
+            pass
+        except BaseException as e:  # 소비자 쪽에서 다시 raise
+            out.put(e)
+        finally:
+            out.put(_DONE)
+
+    t = threading.Thread(target=runner, name="feed-fetcher", daemon=True)
+    t.start()
+    try:
+        while True:
+            item = out.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # 남은 응답을 기다리는 중이면 stop 을 볼 때까지 기다리지 않고 취소 (fetch_feeds 의 finally 가 정리)
+        for fn in cancel:
+            try:
+                fn()
+            except RuntimeError:  # 루프가 이미 끝남
+                pass
+        t.join()
@@ -0,0 +1,138 @@
+# CrawlerApp/ingest.py
+"""
+기사 적재 단계 (crawl_news / views.api_articles 공용)
+
+- 링크는 정규화(CrawlerApp.urlnorm)해서 저장하고, 이미 본 링크는 Bloom 필터(CrawlerApp.linkfilter)로
+  DB 조회 없이 걸러낸다 (필터를 끄면 배치마다 link IN (...) 쿼리 한 번)
+- 새 행만 bulk_create(ignore_conflicts=True)로 한 트랜잭션에 넣는다
+- 최종 중복 방지는 link UNIQUE 인덱스(0003_newsarticle_link_unique)가 맡는다
+- 같은 트랜잭션에서 상위 단어 롤업(WordDailyCount)도 증분 반영
+- 링크는 달라도 제목이 거의 같은 기사(SimHash 근사 중복, CrawlerApp.neardup)는
+  새 행으로 넣지 않고 대표 기사에 ArticleDuplicate 로 묶는다 (롤업에도 세지 않음)
+"""
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from . import linkfilter, metrics, neardup, rollups
+from .models import ArticleDuplicate, NewsArticle
+from .urlnorm import canonical_url
+
+BATCH_SIZE = 500  # SQLite 변수 개수 제한(기본 999/32766) 안쪽
+
+
+def _chunks(iterable, n):
+    it = iter(iterable)
+    while batch := list(islice(it, n)):
+        yield batch
+
+
+def _ingest_batch(batch, remaining=None):
+    rows = {}
+    now = timezone.now()
+    for item in batch:
+        link = canonical_url(item["link"])
+        if link and link not in rows:  # 배치 안 중복 제거
+            rows[link] = {"created_at": now, **item, "link": link}
+    if not rows:
+        return []
+
+    existing = linkfilter.seen_links(rows)  # 기사 + 근사 중복으로 묶인 링크
+    new = [NewsArticle(**row) for link, row in rows.items() if link not in existing]
+    for a in new:
+        sig = neardup.simhash(a.title)
+        a.simhash = neardup.to_signed(sig) if sig else None  # 토큰이 없는 제목은 비교하지 않음
+    dups = []
+    if settings.DEDUP_ENABLED and new:
+        new, dups = _split_near_duplicates(new)
+    if remaining is not None:
+        new = new[:remaining]
+        kept = set(map(id, new))
+        dups = [d for d in dups if not isinstance(d[1], NewsArticle) or id(d[1]) in kept]
+    metrics.ARTICLES.inc("known", amount=len(existing))
+    metrics.ARTICLES.inc("near_duplicate", amount=len(dups))
+    if not new and not dups:
+        return []
+    with transaction.atomic():
+        new = _insert(new)
+        rollups.add_articles(new)
+        if settings.DEDUP_ENABLED:
+            _save_duplicates(dups)
+    metrics.ARTICLES.inc("inserted", amount=len(new))
+    if settings.DEDUP_ENABLED:
+        neardup.remember([(neardup.to_unsigned(a.simhash), a.id) for a in new if a.simhash is not None and a.id])
+    return new
+
+
+def _split_near_duplicates(articles):
+    """
+    → (새로 넣을 기사, [(중복 기사, 대표 기사 id 또는 이번 배치의 대표 NewsArticle, 거리), ...])
+    최근 기사 색인과 이번 배치 안에서 모두 찾는다
+    """
+    keep, dups = [], []
+    local = neardup.SimHashIndex(settings.DEDUP_MAX_DISTANCE)
+    for a in articles:
+        if a.simhash is None:
+            keep.append(a)
+            continue
+        sig = neardup.to_unsigned(a.simhash)
+        hit = neardup.lookup(sig)
+        if hit is None:
+            hit = local.query(sig)
+            if hit is not None:
+                hit = (keep[hit[0]], hit[1])
+        if hit is None:
+            local.add(sig, len(keep))
+            keep.append(a)
+        else:
+            dups.append((a, hit[0], hit[1]))
+    return keep, dups
+
+
+def _insert(new):
+    """
+    bulk_create(ignore_conflicts=True) 후 실제로 들어간 행만 id 를 채워서 반환
+    (다른 프로세스가 먼저 넣은 링크는 조용히 빠지므로 롤업/색인에 세면 안 된다)
+    트랜잭션 안에서 호출: 쓰기 잠금(IMMEDIATE)을 잡은 뒤라 최대 id 이후 행은 모두 이번 insert 의 것
+    """
+    if not new:
+        return new
+    last = NewsArticle.objects.order_by("-id").values_list("id", flat=True).first() or 0
+    NewsArticle.objects.bulk_create(new, ignore_conflicts=True)
+    ids = dict(NewsArticle.objects.filter(id__gt=last).values_list("link", "id"))
+    inserted = []
+    for a in new:
+        a.id = ids.get(a.link)
+        if a.id:
+            inserted.append(a)
+    return inserted
+
+
+def _save_duplicates(dups):
+    # 대표 기사가 이번 배치 기사면 _insert 가 채운 id 로 연결 (동시 적재로 빠진 대표는 id 가 없어 건너뜀)
+    rows = []
+    for a, leader, distance in dups:
+        leader_id = leader.id if isinstance(leader, NewsArticle) else leader
+        if leader_id:
+            rows.append(ArticleDuplicate(article_id=leader_id, title=a.title, link=a.link,
+                                         distance=distance, created_at=a.created_at))
+    if rows:
+        ArticleDuplicate.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+def ingest_articles(items, *, limit=None, batch_size=BATCH_SIZE):
+    """
+    items: {'title', 'link', 'extracted_words', 'top_words'[, 'created_at']} dict 이터러블
+    실제로 새로 저장한 NewsArticle 목록을 반환 (pk 채움. 근사 중복으로 묶인 기사,
+    다른 프로세스가 먼저 넣어 ignore_conflicts 로 빠진 기사는 제외)
+    """
+    inserted = []
+    with metrics.span("insert"):
+        for batch in _chunks(items, batch_size):
+            remaining = None if limit is None else limit - len(inserted)
+            if remaining is not None and remaining <= 0:
+                break
+            inserted.extend(_ingest_batch(batch, remaining))
+    return inserted
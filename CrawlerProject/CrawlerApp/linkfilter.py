@@ -0,0 +1,221 @@
+# CrawlerApp/linkfilter.py
+"""
+"이미 본 링크" Bloom 필터 (ingest / crawl_news 공용)
+
+- 키는 정규화한 링크(CrawlerApp.urlnorm.canonical_url), 기사 + 근사 중복(ArticleDuplicate) 링크 모두
+- 필터에 없으면 확실히 새 링크 → DB 조회 없이 적재, 있으면 양성만 기존 IN 조회로 확인 (LINK_BLOOM_VERIFY, 기본)
+  LINK_BLOOM_VERIFY=0 이면 양성을 확인 없이 이미 본 링크로 버린다 → 오탐률 LINK_BLOOM_ERROR 만큼 새 기사를
+  영영 놓치므로, 버린 양성 수를 경고 로그 + crawler_link_bloom_total{result="unverified"} 로 남긴다
+- 비트 배열은 numpy, 해시는 blake2b 128비트를 둘로 나눈 이중 해싱 (h1 + i*h2)
+- LINK_BLOOM_PATH 에 저장해 두고 프로세스 시작 시 읽는다. 저장 이후 들어온 행(id > 저장 시점 최대 id)만
+  DB 에서 따라잡고, 파일이 없거나 DB 가 바뀌었거나 용량을 넘으면 테이블 전체로 다시 만든다
+- 다른 프로세스가 넣은 기사도 놓치지 않도록 검사 전마다 id 범위 조회 한 번으로 따라잡는다
+"""
+import atexit
+import hashlib
+import logging
+import math
+import os
+import threading
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+
+from . import metrics
+from .urlnorm import canonical_url
+
+_FORMAT = 1
+logger = logging.getLogger(__name__)
+
+
+def _hashes(links):
+    h = np.empty((len(links), 2), dtype=np.uint64)
+    for i, link in enumerate(links):
+        h[i] = np.frombuffer(hashlib.blake2b(link.encode("utf-8"), digest_size=16).digest(), dtype="<u8")
+    return h
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate, bits=None, count=0):
+        self.capacity = int(capacity)
+        self.error_rate = float(error_rate)
+        m = max(64, int(math.ceil(-self.capacity * math.log(self.error_rate) / math.log(2) ** 2)))
+        self.m = (m + 7) // 8 * 8
+        self.k = max(1, round(self.m / self.capacity * math.log(2)))
+        self.bits = bits if bits is not None else np.zeros(self.m // 8, dtype=np.uint8)
+        self.count = count
+
+    def _positions(self, links):
+        h = _hashes(links)
+        i = np.arange(self.k, dtype=np.uint64)
+        return (h[:, :1] + i * h[:, 1:]) % np.uint64(self.m)  # (len(links), k), uint64 덧셈은 2^64 로 순환
+
+    def add_many(self, links):
+        if not links:
+            return
+        pos = self._positions(links).ravel()
+        np.bitwise_or.at(self.bits, (pos >> np.uint64(3)).astype(np.intp),
+                         (np.uint8(1) << (pos & np.uint64(7)).astype(np.uint8)))
+        self.count += len(links)
+
+    def contains_many(self, links):
+        """→ bool 배열 (True = 이미 들어 있을 수 있음)"""
+        if not links:
+            return np.zeros(0, dtype=bool)
+        pos = self._positions(links)
+        got = self.bits[(pos >> np.uint64(3)).astype(np.intp)] >> (pos & np.uint64(7)).astype(np.uint8)
+        return (got & 1).all(axis=1)
+
+    def __contains__(self, link):
+        return bool(self.contains_many([link])[0])
+
+
+class LinkFilter:
+    """Bloom 필터 + DB 따라잡기 상태 (저장 시점의 기사/중복 테이블 최대 id)"""
+
+    def __init__(self, bloom, article_max=0, dup_max=0):
+        self.bloom = bloom
+        self.article_max = article_max
+        self.dup_max = dup_max
+        self.dirty = False
+
+    @classmethod
+    def build(cls, capacity=None):
+        """테이블 전체로 새로 만든다"""
+        from .models import ArticleDuplicate, NewsArticle
+        total = NewsArticle.objects.count() + ArticleDuplicate.objects.count()
+        capacity = max(capacity or settings.LINK_BLOOM_CAPACITY, 2 * total)
+        f = cls(BloomFilter(capacity, settings.LINK_BLOOM_ERROR))
+        f.catch_up(canonicalize=True)
+        return f
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            fmt, capacity, count, article_max, dup_max = (int(x) for x in data["meta"])
+            error_rate = float(data["error_rate"])
+            bits = data["bits"]
+        if fmt != _FORMAT or error_rate != settings.LINK_BLOOM_ERROR:
+            return None
+        bloom = BloomFilter(capacity, error_rate, bits=bits, count=count)
+        if bloom.bits.shape != (bloom.m // 8,):
+            return None
+        return cls(bloom, article_max, dup_max)
+
+    def save(self, path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            np.savez(fh, bits=self.bloom.bits, error_rate=np.float64(self.bloom.error_rate),
+                     meta=np.array([_FORMAT, self.bloom.capacity, self.bloom.count,
+                                    self.article_max, self.dup_max], dtype=np.int64))
+        os.replace(tmp, path)
+        self.dirty = False
+
+    def catch_up(self, canonicalize=False):
+        """마지막으로 본 id 이후에 들어온 링크를 추가. canonicalize: 정규화 이전에 저장된 링크도 정규화해서 넣는다"""
+        from .models import ArticleDuplicate, NewsArticle
+        for model, attr in ((NewsArticle, "article_max"), (ArticleDuplicate, "dup_max")):
+            last = getattr(self, attr)
+            rows = model.objects.filter(id__gt=last).order_by("id").values_list("id", "link")
+            links = []
+            for ident, link in rows.iterator(chunk_size=5000):
+                links.append(canonical_url(link) if canonicalize else link)
+                last = ident
+                if len(links) >= 50000:
+                    self.bloom.add_many(links)
+                    links = []
+            self.bloom.add_many(links)
+            if last != getattr(self, attr):
+                setattr(self, attr, last)
+                self.dirty = True
+
+    def stale(self):
+        """DB 가 바뀌었으면(저장된 최대 id 보다 작음) 다시 만들어야 한다"""
+        from .models import ArticleDuplicate, NewsArticle
+        a = NewsArticle.objects.order_by("-id").values_list("id", flat=True).first() or 0
+        d = ArticleDuplicate.objects.order_by("-id").values_list("id", flat=True).first() or 0
+        return a < self.article_max or d < self.dup_max
+
+
+# -------------------- 프로세스 전역 필터 --------------------
+_filter = None
+_lock = threading.Lock()
+
+
+def _path():
+    """저장 위치. 기본은 DB 파일 옆 (CRAWLER_DB_PATH 로 DB 를 바꾸면 필터도 따로), 메모리 DB 면 None"""
+    if settings.LINK_BLOOM_PATH:
+        return settings.LINK_BLOOM_PATH
+    name = str(connection.settings_dict["NAME"])
+    if connection.vendor != "sqlite" or name == ":memory:" or "mode=memory" in name:
+        return None
+    return f"{name}.links.bloom"
+
+
+def _get():
+    """_lock 안에서 호출. 파일에서 읽거나 새로 만든 뒤 DB 를 따라잡은 필터"""
+    global _filter
+    if _filter is None:
+        f = None
+        if _path():
+            try:
+                f = LinkFilter.load(_path())
+            except (OSError, KeyError, ValueError):
+                f = None
+        if f is None or f.stale():
+            f = LinkFilter.build()
+            f.dirty = True
+        else:
+            f.catch_up()
+        _filter = f
+    else:
+        _filter.catch_up()
+    if _filter.bloom.count > _filter.bloom.capacity:  # 오탐률 유지를 위해 두 배 용량으로 재구성
+        _filter = LinkFilter.build(2 * _filter.bloom.capacity)
+        _filter.dirty = True
+    return _filter
+
+
+def seen_links(links):
+    """정규화한 링크 목록 → 이미 본(것으로 보는) 링크 set"""
+    from .models import ArticleDuplicate, NewsArticle
+    links = list(links)
+    if not links:
+        return set()
+    if settings.LINK_BLOOM_ENABLED:
+        with _lock:
+            hit = _get().bloom.contains_many(links)
+        candidates = [l for l, h in zip(links, hit) if h]
+        metrics.LINK_BLOOM.inc("negative", amount=len(links) - len(candidates))
+        if not candidates:
+            return set()
+        if not settings.LINK_BLOOM_VERIFY:
+            metrics.LINK_BLOOM.inc("unverified", amount=len(candidates))
+            logger.warning("link bloom: skipped %d positive link(s) without DB check (LINK_BLOOM_VERIFY=0)",
+                           len(candidates))
+            return set(candidates)
+    else:
+        candidates = links
+    found = set(NewsArticle.objects.filter(link__in=candidates).values_list("link", flat=True))
+    found |= set(ArticleDuplicate.objects.filter(link__in=candidates).values_list("link", flat=True))
+    if settings.LINK_BLOOM_ENABLED:
+        metrics.LINK_BLOOM.inc("seen", amount=len(found))
+        metrics.LINK_BLOOM.inc("false_positive", amount=len(candidates) - len(found))
+    return found
+
+
+def save():
+    """필터를 LINK_BLOOM_PATH 에 저장 (바뀐 게 없으면 생략)"""
+    with _lock:
+        if _filter is not None and _filter.dirty and _path():
+            _filter.save(_path())
+
+
+def reset():
+    global _filter
+    with _lock:
+        _filter = None
+
+
+atexit.register(save)
@@ -0,0 +1,21 @@
+# CrawlerApp/management/commands/compute_trending.py
+from django.core.management.base import BaseCommand
+from CrawlerApp import trending
+from CrawlerApp.models import TrendingWord
+
+class Command(BaseCommand):
+    help = "Recompute trending words (TrendingWord) from hourly title token counts. Run from cron after crawl_news."
+
+    def add_arguments(self, p):
+        p.add_argument("--show", type=int, default=10, help="출력할 상위 단어 수")
+
+    def handle(self, *args, **o):
+        stats = trending.compute()
+        self.stdout.write(
+            f"Scored {stats['terms']} terms in {stats['total_s']:.3f}s "
+            f"(load {stats['load_s']:.3f}s, score {stats['score_s'] * 1000:.1f}ms), pruned {stats['pruned']} buckets"
+        )
+        for t in TrendingWord.objects.order_by("rank")[:o["show"]]:
+            self.stdout.write(f"{t.rank:>3}. {t.word:<20} z={t.score:6.1f} ratio={t.ratio:5.1f} "
+                              f"recent={t.recent} expected={t.expected:.1f}")
+        self.stdout.write(self.style.SUCCESS(f"Saved {stats['trending']} trending words"))
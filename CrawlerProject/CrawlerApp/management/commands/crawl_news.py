@@ -1,17 +1,18 @@
 # CrawlerApp/management/commands/crawl_news.py
-import re, time, feedparser
-from collections import Counter
+import time
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from django.db import IntegrityError
-from CrawlerApp.models import NewsArticle
+from CrawlerApp import linkfilter, trending
+from CrawlerApp.metrics import span
+from CrawlerApp.bodies import body_texts
+from CrawlerApp.fetcher import iter_feeds
+from CrawlerApp.ingest import ingest_articles
+from CrawlerApp.models import FeedState
+from CrawlerApp.tokenizer import join_tokens, pick_top_word, tokenize, tokenize_text
+from CrawlerApp.urlnorm import canonical_url
 
-STOPWORDS = {"기사","사진","영상","단독","속보","전체","보기","또","그리고","하지만"}
-
-def pick_top_word(title: str) -> str:
-    words = re.findall(r"[가-힣A-Za-z0-9]{2,}", title)
-    words = [w for w in words if w not in STOPWORDS]
-    return Counter(words).most_common(1)[0][0] if words else ""
+SEEN_IDS_MAX = 1000  # 피드별로 기억할 최근 항목 ID 수
+PROFILE_COLUMNS = ("fetch", "parse", "tokenize", "bodies", "insert")
 
 class Command(BaseCommand):
     help = "Fetch news via RSS and insert into CrawlerApp_newsarticle (SQLite)."
@@ -19,7 +20,21 @@ class Command(BaseCommand):
     def add_arguments(self, p):
         p.add_argument("--limit", type=int, default=50)
         p.add_argument("--feeds", type=str, default="")
-        p.add_argument("--sleep", type=float, default=0.5)
+        p.add_argument("--sleep", type=float, default=0.5,
+                       help="같은 호스트에 대한 최소 요청 간격(초)")
+        p.add_argument("--concurrency", type=int, default=1,
+                       help="동시에 가져올 피드 수 (1이면 순차)")
+        p.add_argument("--timeout", type=float, default=10.0)
+        p.add_argument("--no-cache", action="store_true",
+                       help="ETag/Last-Modified/본문 해시를 무시하고 전부 다시 받기")
+        p.add_argument("--bodies", action="store_true",
+                       help="기사 본문도 받아서 extracted_words 에 본문 토큰까지 저장 (CrawlerApp.bodies)")
+        p.add_argument("--body-concurrency", type=int, default=16,
+                       help="동시에 받을 기사 본문 수")
+        p.add_argument("--trending", action="store_true",
+                       help="적재 후 급상승 단어(TrendingWord) 다시 계산 (compute_trending 과 같음)")
+        p.add_argument("--profile", action="store_true",
+                       help="피드별 fetch/parse/tokenize/bodies/insert 시간(ms) 표 출력")
 
     def handle(self, *args, **o):
         feeds = []
@@ -29,35 +44,115 @@ class Command(BaseCommand):
         if not feeds:
             feeds = ["https://news.google.com/rss?hl=ko&gl=KR&ceid=KR:ko"]
 
-        inserted = 0
-        for url in feeds:
-            d = feedparser.parse(url)
-            for e in d.entries:
-                title = getattr(e, "title", "").strip()
-                link  = getattr(e, "link", "").strip()
-                if not title or not link:
-                    continue
-                # 중복 방지
-                if NewsArticle.objects.filter(link=link).exists():
-                    continue
+        # 피드별 조건부 요청 상태
+        states = {} if o["no_cache"] else {s.url: s for s in FeedState.objects.filter(url__in=feeds)}
+        done_states = []
+
+        inserted = fetched = items = errors = unchanged = bodies = 0
+        profile = []  # [(피드, 상태, {단계: 초}, 항목 수, 새 기사 수)]
+        t0 = time.perf_counter()
+        results = iter_feeds(feeds, concurrency=o["concurrency"], host_interval=o["sleep"],
+                             timeout=o["timeout"],
+                             states={u: {"etag": s.etag, "last_modified": s.last_modified,
+                                         "content_hash": s.content_hash} for u, s in states.items()})
+        for res in results:
+            fetched += 1
+            times = {"fetch": res.fetch_time, "parse": res.parse_time}
+            if res.error:
+                errors += 1
+                profile.append((res.url, "error", times, 0, 0))
+                self.stderr.write(f"[skip] {res.url}: {res.error}")
+                continue
+            state = states.get(res.url) or FeedState(url=res.url)
+            state.checked_at = timezone.now()
+            if res.unchanged:
+                # 304 / 같은 본문 → 파싱·DB 작업 없음
+                unchanged += 1
+                profile.append((res.url, "unchanged", times, 0, 0))
+                done_states.append(state)
+                continue
 
-                try:
-                    NewsArticle.objects.create(
-                        title=title,
-                        link=link,
-                        extracted_words=title,   # 필요하면 실제 토큰으로 변경
-                        top_words=pick_top_word(title),
-                        created_at=timezone.now(),  # DateTimeField(null=True)와 매핑
-                    )
-                    inserted += 1
-                except IntegrityError:
-                    # UNIQUE 인덱스 있는 경우 안전하게 스킵
+            items += len(res.entries)
+            seen = set(state.seen_ids or [])
+            entry_ids, candidates = [], {}
+            for e in res.entries:
+                title = getattr(e, "title", "").strip()
+                link  = canonical_url(getattr(e, "link", ""))
+                eid = getattr(e, "id", "") or link
+                if eid:
+                    entry_ids.append(eid)
+                if not title or not link or eid in seen:
                     continue
+                candidates.setdefault(link, title)
+            # 이미 본 링크는 토큰화 전에 Bloom 필터로 거른다
+            known = linkfilter.seen_links(candidates)
+            with span("tokenize") as s:
+                rows = [{
+                    "title": title,
+                    "link": link,
+                    "extracted_words": join_tokens(tokenize(title)),
+                    "top_words": pick_top_word(title),
+                } for link, title in candidates.items() if link not in known]
+            times["tokenize"] = s.elapsed
+            if o["bodies"] and rows:
+                with span("bodies") as s:
+                    texts = body_texts([r["link"] for r in rows], concurrency=o["body_concurrency"],
+                                       host_interval=o["sleep"], timeout=o["timeout"])
+                    for r in rows:
+                        text = texts.get(r["link"])
+                        if text:
+                            r["extracted_words"] = join_tokens([*tokenize(r["title"]), *tokenize_text(text)])
+                            bodies += 1
+                times["bodies"] = s.elapsed
 
-                if inserted >= o["limit"]:
-                    break
+            # 피드 단위 일괄 적재 (IN 조회 1번 + bulk_create 1번)
+            t1 = time.perf_counter()  # ingest_articles 안에서 "insert" 단계로 기록됨
+            new = len(ingest_articles(rows, limit=o["limit"] - inserted))
+            times["insert"] = time.perf_counter() - t1
+            inserted += new
+            profile.append((res.url, "ok", times, len(res.entries), new))
             if inserted >= o["limit"]:
+                # 남은 항목이 있을 수 있으니 상태는 저장하지 않는다(다음 실행에서 이어서)
+                results.close()  # 남은 요청 취소
                 break
-            time.sleep(o["sleep"])
 
-        self.stdout.write(self.style.SUCCESS(f"Inserted {inserted} new items"))
\ No newline at end of file
+            state.etag, state.last_modified = res.etag, res.last_modified
+            state.content_hash = res.content_hash
+            state.seen_ids = entry_ids[:SEEN_IDS_MAX]
+            state.changed_at = state.checked_at
+            done_states.append(state)
+
+        linkfilter.save()
+        if done_states:
+            FeedState.objects.bulk_create(
+                done_states, update_conflicts=True, unique_fields=["url"],
+                update_fields=["etag", "last_modified", "content_hash", "seen_ids",
+                               "checked_at", "changed_at"],
+            )
+
+        elapsed = max(time.perf_counter() - t0, 1e-9)
+        self.stdout.write(
+            f"Fetched {fetched} feeds ({unchanged} unchanged, {errors} errors), {items} items in {elapsed:.2f}s "
+            f"- {fetched / elapsed:.1f} feeds/s, {items / elapsed:.1f} items/s"
+        )
+        if o["bodies"]:
+            self.stdout.write(f"Article bodies: {bodies}")
+        if o["profile"]:
+            self._write_profile(profile)
+        if o["trending"]:
+            stats = trending.compute()
+            self.stdout.write(f"Trending: {stats['trending']} words from {stats['terms']} terms "
+                              f"in {stats['total_s']:.3f}s")
+        self.stdout.write(self.style.SUCCESS(f"Inserted {inserted} new items"))
+
+    def _write_profile(self, profile):
+        """피드별 단계 시간 (ms), 오래 걸린 피드부터. fetch 는 동시 요청이라 다른 단계와 겹친다"""
+        header = f"{'feed':<50} {'status':<9}" + "".join(f"{c:>9}" for c in PROFILE_COLUMNS) + f"{'items':>7}{'new':>6}"
+        self.stdout.write(header)
+        totals = dict.fromkeys(PROFILE_COLUMNS, 0.0)
+        for url, status, times, n_items, n_new in sorted(profile, key=lambda p: -sum(p[2].values())):
+            for c in PROFILE_COLUMNS:
+                totals[c] += times.get(c, 0.0)
+            cols = "".join(f"{times.get(c, 0.0) * 1000:>9.1f}" for c in PROFILE_COLUMNS)
+            self.stdout.write(f"{url[-50:]:<50} {status:<9}{cols}{n_items:>7}{n_new:>6}")
+        self.stdout.write(f"{'total':<50} {'':<9}" + "".join(f"{totals[c] * 1000:>9.1f}" for c in PROFILE_COLUMNS))
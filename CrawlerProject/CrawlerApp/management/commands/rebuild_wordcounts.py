@@ -0,0 +1,33 @@
+# CrawlerApp/management/commands/rebuild_wordcounts.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from CrawlerApp.models import NewsArticle, WordDailyCount, WordHourlyCount, WordTopK
+from CrawlerApp import rollups
+
+class Command(BaseCommand):
+    help = ("Rebuild the per-day word count rollup (WordDailyCount), top-k sketches (WordTopK) "
+            "and hourly title counts (WordHourlyCount) from CrawlerApp_newsarticle.")
+
+    def add_arguments(self, p):
+        p.add_argument("--chunk", type=int, default=5000)
+
+    def handle(self, *args, **o):
+        qs = NewsArticle.objects.only("title", "created_at", "top_words", "extracted_words")
+        total = 0
+        with transaction.atomic():
+            WordDailyCount.objects.all().delete()
+            WordTopK.objects.all().delete()
+            WordHourlyCount.objects.all().delete()
+            buf = []
+            for a in qs.iterator(chunk_size=o["chunk"]):
+                buf.append(a)
+                if len(buf) >= o["chunk"]:
+                    rollups.add_articles(buf)
+                    total += len(buf)
+                    buf = []
+            rollups.add_articles(buf)
+            total += len(buf)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt word counts from {total} articles ({WordDailyCount.objects.count()} buckets)"
+        ))
@@ -0,0 +1,216 @@
+# CrawlerApp/metrics.py
+"""
+요청/단계별 계측 (외부 의존성 없는 간단한 구현)
+
+- span("db" | "upstream" | "parse" | "tokenize" | "insert") : 걸린 시간을 crawler_span_seconds 히스토그램에 넣고
+  요청 처리 중이면 그 요청의 단계별 합계에도 더한다 (단계는 겹칠 수 있음: insert 안의 쿼리는 db 에도 잡힌다)
+- DB 쿼리는 connection_created 때 execute_wrapper 를 붙여서 전부 "db" 단계로 잰다 (CrawlerappConfig.ready)
+- metrics_middleware : 뷰 이름/메서드/상태 코드별 요청 수·지연 + Server-Timing 응답 헤더
+- render() : Prometheus 텍스트 형식 (/metrics). 값은 프로세스별 → gunicorn 워커가 여럿이면 워커마다 따로 보인다
+- 요청별 합계는 contextvars 로 들고 다녀서 async 뷰 → sync_to_async 스레드의 쿼리도 같은 요청에 합쳐진다
+  (StreamingHttpResponse 처럼 응답을 보내는 중에 도는 쿼리는 헤더가 이미 나간 뒤라 히스토그램에만 남음)
+"""
+import bisect
+import contextvars
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.utils.decorators import sync_and_async_middleware
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+_lock = threading.Lock()
+_registry = {}  # 이름 -> Counter / Histogram (등록 순서대로 출력)
+_request_timings = contextvars.ContextVar("request_timings", default=None)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=""):
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _num(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name, self.help, self.labelnames = name, help, tuple(labels)
+        self._values = {}  # 라벨 값 tuple -> 누적값
+
+    def inc(self, *labels, amount=1):
+        with _lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        return self._values.get(labels, 0)
+
+    def lines(self):
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_num(value)}"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=BUCKETS):
+        self.name, self.help, self.labelnames = name, help, tuple(labels)
+        self.buckets = tuple(buckets)
+        self._values = {}  # 라벨 값 tuple -> [버킷별 개수(누적 아님), 합계, 개수]
+
+    def observe(self, value, *labels):
+        i = bisect.bisect_left(self.buckets, value)
+        with _lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, *labels):
+        state = self._values.get(labels)
+        return state[2] if state else 0
+
+    def lines(self):
+        for labels, (counts, total, n) in sorted(self._values.items()):
+            cum = 0
+            for bound, c in zip((*map(repr, self.buckets), "+Inf"), counts):
+                cum += c
+                le = 'le="%s"' % bound
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cum}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_num(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {n}"
+
+
+def _register(metric):
+    with _lock:
+        existing = _registry.setdefault(metric.name, metric)
+    return existing
+
+
+def counter(name, help, labels=()):
+    return _register(Counter(name, help, labels))
+
+
+def histogram(name, help, labels=(), buckets=BUCKETS):
+    return _register(Histogram(name, help, labels, buckets))
+
+
+def render():
+    """등록된 지표 전체 → Prometheus 텍스트 형식"""
+    out = []
+    with _lock:
+        metrics = list(_registry.values())
+    for m in metrics:
+        out.append(f"# HELP {m.name} {m.help}")
+        out.append(f"# TYPE {m.name} {m.kind}")
+        with _lock:
+            out.extend(m.lines())
+    return "\n".join(out) + "\n"
+
+
+SPAN_SECONDS = histogram("crawler_span_seconds", "Time spent per instrumented stage.", ["span"])
+HTTP_REQUESTS = counter("crawler_http_requests_total", "HTTP requests by view, method and status.",
+                        ["view", "method", "status"])
+HTTP_SECONDS = histogram("crawler_http_request_duration_seconds", "HTTP request latency by view.", ["view"])
+ARTICLES = counter("crawler_articles_total", "Articles seen at ingest by outcome.", ["outcome"])
+LIVE_FETCHES = counter("crawler_live_fetch_total", "Live Google News lookups by result.", ["result"])
+LINK_BLOOM = counter("crawler_link_bloom_total",
+                     "Link Bloom filter lookups by result (negative, seen, false_positive, unverified).", ["result"])
+
+
+class span:
+    """
+    with span("tokenize") as s: ...  →  s.elapsed (초)
+    async 코드에서도 await 를 감싸는 일반 with 로 쓰면 된다 (벽시계 시간)
+    """
+    __slots__ = ("name", "t0", "elapsed")
+
+    def __init__(self, name):
+        self.name = name
+        self.elapsed = 0.0
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.t0
+        SPAN_SECONDS.observe(self.elapsed, self.name)
+        timings = _request_timings.get()
+        if timings is not None:
+            t = timings.get(self.name)
+            if t is None:
+                timings[self.name] = [self.elapsed, 1]
+            else:
+                t[0] += self.elapsed
+                t[1] += 1
+        return False
+
+
+def _db_wrapper(execute, sql, params, many, context):
+    with span("db"):
+        return execute(sql, params, many, context)
+
+
+def instrument_connection(sender, connection, **kwargs):
+    """connection_created 수신: 이 연결의 모든 쿼리를 "db" 단계로 잰다"""
+    if _db_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_db_wrapper)
+
+
+def server_timing(timings, total):
+    """{단계: [초, 횟수]} → Server-Timing 헤더 값 (ms)"""
+    parts = [f'{name};dur={t * 1000:.1f};desc="{n}x"' for name, (t, n) in timings.items()]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def _finish(request, response, timings, t0):
+    elapsed = time.perf_counter() - t0
+    match = getattr(request, "resolver_match", None)
+    view = match.view_name if match else "unmatched"  # URL 이 안 맞은 요청(404)은 한 라벨로
+    method = request.method if request.method in METHODS else "other"
+    HTTP_REQUESTS.inc(view, method, str(response.status_code))
+    HTTP_SECONDS.observe(elapsed, view)
+    if settings.METRICS_SERVER_TIMING:
+        response["Server-Timing"] = server_timing(timings, elapsed)
+    return response
+
+
+@sync_and_async_middleware
+def metrics_middleware(get_response):
+    """MIDDLEWARE 맨 앞에 둔다 (다른 미들웨어 시간까지 total 에 포함)"""
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            timings, t0 = {}, time.perf_counter()
+            token = _request_timings.set(timings)
+            try:
+                response = await get_response(request)
+            finally:
+                _request_timings.reset(token)
+            return _finish(request, response, timings, t0)
+        return middleware
+
+    def middleware(request):
+        timings, t0 = {}, time.perf_counter()
+        token = _request_timings.set(timings)
+        try:
+            response = get_response(request)
+        finally:
+            _request_timings.reset(token)
+        return _finish(request, response, timings, t0)
+    return middleware
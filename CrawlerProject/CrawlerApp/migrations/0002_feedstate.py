@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('CrawlerApp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=1000, unique=True)),
+                ('etag', models.CharField(blank=True, default='', max_length=255)),
+                ('last_modified', models.CharField(blank=True, default='', max_length=64)),
+                ('content_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('seen_ids', models.JSONField(blank=True, default=list)),
+                ('checked_at', models.DateTimeField(null=True)),
+                ('changed_at', models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.AlterModelOptions(
+            name='newsarticle',
+            options={'managed': False},
+        ),
+        migrations.AlterModelTable(
+            name='newsarticle',
+            table='CrawlerApp_newsarticle',
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    link에 UNIQUE 인덱스 추가 (ingest 단계의 bulk_create(ignore_conflicts=True) 기반)
+    테이블이 managed=False라 RunSQL로 만들고, 기존 중복 행은 가장 먼저 들어온 것만 남긴다.
+    """
+
+    dependencies = [
+        ('CrawlerApp', '0002_feedstate'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                'DELETE FROM "CrawlerApp_newsarticle" WHERE "id" NOT IN '
+                '(SELECT MIN("id") FROM "CrawlerApp_newsarticle" GROUP BY "link")',
+                'CREATE UNIQUE INDEX IF NOT EXISTS "CrawlerApp_newsarticle_link_uniq" '
+                'ON "CrawlerApp_newsarticle" ("link")',
+            ],
+            reverse_sql='DROP INDEX IF EXISTS "CrawlerApp_newsarticle_link_uniq"',
+            state_operations=[
+                migrations.AlterField(
+                    model_name='newsarticle',
+                    name='link',
+                    field=models.URLField(unique=True),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import migrations, transaction
+from django.db.utils import OperationalError
+
+FTS = "CrawlerApp_newsarticle_fts"
+TABLE = "CrawlerApp_newsarticle"
+COLS = "title, extracted_words, top_words"
+
+CREATE_SQL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS "{FTS}" USING fts5(
+        {COLS}, content='{TABLE}', content_rowid='id', prefix='2 3'
+    )""",
+    # 원본 테이블 INSERT/DELETE/UPDATE 를 그대로 따라가는 트리거
+    f"""CREATE TRIGGER IF NOT EXISTS "{FTS}_ai" AFTER INSERT ON "{TABLE}" BEGIN
+        INSERT INTO "{FTS}"(rowid, {COLS}) VALUES (new.id, new.title, new.extracted_words, new.top_words);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS "{FTS}_ad" AFTER DELETE ON "{TABLE}" BEGIN
+        INSERT INTO "{FTS}"("{FTS}", rowid, {COLS}) VALUES ('delete', old.id, old.title, old.extracted_words, old.top_words);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS "{FTS}_au" AFTER UPDATE ON "{TABLE}" BEGIN
+        INSERT INTO "{FTS}"("{FTS}", rowid, {COLS}) VALUES ('delete', old.id, old.title, old.extracted_words, old.top_words);
+        INSERT INTO "{FTS}"(rowid, {COLS}) VALUES (new.id, new.title, new.extracted_words, new.top_words);
+    END""",
+    # 기존 행 백필
+    f"""INSERT INTO "{FTS}"("{FTS}") VALUES ('rebuild')""",
+]
+
+DROP_SQL = [
+    f'DROP TRIGGER IF EXISTS "{FTS}_ai"',
+    f'DROP TRIGGER IF EXISTS "{FTS}_ad"',
+    f'DROP TRIGGER IF EXISTS "{FTS}_au"',
+    f'DROP TABLE IF EXISTS "{FTS}"',
+]
+
+
+def create_fts(apps, schema_editor):
+    conn = schema_editor.connection
+    if conn.vendor != "sqlite":
+        return
+    try:
+        with transaction.atomic(using=conn.alias), conn.cursor() as c:
+            for sql in CREATE_SQL:
+                c.execute(sql)
+    except OperationalError:
+        # FTS5 없이 빌드된 SQLite → 뷰는 LIKE 검색으로 폴백
+        pass
+
+
+def drop_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as c:
+        for sql in DROP_SQL:
+            c.execute(sql)
+
+
+class Migration(migrations.Migration):
+    """api_articles / api_topwords 검색용 FTS5 색인 (CrawlerApp.search 참고)"""
+
+    dependencies = [
+        ('CrawlerApp', '0003_newsarticle_link_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts, drop_fts),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('CrawlerApp', '0004_newsarticle_fts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('top', 'top_words'), ('token', 'extracted_words tokens')], max_length=8)),
+                ('day', models.DateField()),
+                ('word', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'day', 'word'), name='worddailycount_kind_day_word_uniq')],
+            },
+        ),
+    ]
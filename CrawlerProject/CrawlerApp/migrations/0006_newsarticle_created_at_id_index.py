@@ -0,0 +1,30 @@
+from django.db import migrations
+
+TABLE = "CrawlerApp_newsarticle"
+INDEX = "CrawlerApp_newsarticle_created_at_id_idx"
+
+
+def create_index(apps, schema_editor):
+    conn = schema_editor.connection
+    with conn.cursor() as c:
+        cols = [col.name for col in conn.introspection.get_table_description(c, TABLE)]
+        if "created_at" not in cols:
+            # 0001 에는 없고 Projectfix_created_at.py 로만 붙이던 컬럼 (새로 만든 DB 대비)
+            c.execute(f'ALTER TABLE "{TABLE}" ADD COLUMN "created_at" datetime NULL')
+        c.execute(f'CREATE INDEX IF NOT EXISTS "{INDEX}" ON "{TABLE}" ("created_at", "id")')
+
+
+def drop_index(apps, schema_editor):
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX}"')
+
+
+class Migration(migrations.Migration):
+    """api_articles 키셋 페이지네이션 / 최신순 정렬용 (created_at, id) 복합 인덱스"""
+
+    dependencies = [
+        ('CrawlerApp', '0005_worddailycount'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,39 @@
+import re
+
+from django.db import migrations
+
+# 마이그레이션 시점의 CrawlerApp.tokenizer 규칙을 그대로 고정
+TOKEN_RE = re.compile(r"[가-힣A-Za-z0-9]{2,}")
+STOPWORDS = {"기사", "사진", "영상", "단독", "속보", "전체", "보기", "또", "그리고", "그러나", "하지만"}
+BATCH = 2000
+
+
+def tokenize_existing(apps, schema_editor):
+    """
+    extracted_words 를 "제목 토큰을 공백으로 이은 문자열"로 통일
+    (crawl_news 는 예전에 제목 원문을 그대로 넣었다)
+    """
+    NewsArticle = apps.get_model("CrawlerApp", "NewsArticle")
+    last_id = 0
+    while True:
+        batch = list(NewsArticle.objects.filter(id__gt=last_id).order_by("id").only("id", "title")[:BATCH])
+        if not batch:
+            break
+        for a in batch:
+            a.extracted_words = " ".join(
+                w for w in TOKEN_RE.findall(a.title.lower()) if w not in STOPWORDS
+            )
+        NewsArticle.objects.bulk_update(batch, ["extracted_words"])
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+    """기존 행의 extracted_words 를 저장 토큰 형태로 변환 (이후 rebuild_wordcounts 권장)"""
+
+    dependencies = [
+        ('CrawlerApp', '0006_newsarticle_created_at_id_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(tokenize_existing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:26
+
+import hashlib
+import re
+from collections import Counter
+
+import django.db.models.deletion
+import numpy as np
+from django.db import migrations, models
+
+TABLE = "CrawlerApp_newsarticle"
+BATCH = 2000
+
+# 마이그레이션 시점의 CrawlerApp.tokenizer / CrawlerApp.neardup 규칙을 그대로 고정
+TOKEN_RE = re.compile(r"[가-힣A-Za-z0-9]{2,}")
+STOPWORDS = {"기사", "사진", "영상", "단독", "속보", "전체", "보기", "또", "그리고", "그러나", "하지만"}
+SHINGLE = 3
+
+
+def simhash(title):
+    head, sep, tail = (title or "").rpartition(" - ")
+    if sep and head and len(tail) <= 30:
+        title = head
+    text = "".join(w for w in TOKEN_RE.findall(title.lower()) if w not in STOPWORDS)
+    if len(text) < SHINGLE:
+        feats = Counter([text]) if text else Counter()
+    else:
+        feats = Counter(text[i:i + SHINGLE] for i in range(len(text) - SHINGLE + 1))
+    if not feats:
+        return 0
+    hashes = np.array([int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "little")
+                       for f in feats], dtype=np.uint64)
+    weights = np.fromiter(feats.values(), dtype=np.int64, count=len(feats))
+    bits = np.unpackbits(hashes.view(np.uint8), bitorder="little").reshape(-1, 64).astype(np.int64)
+    sig = int(np.packbits(weights @ (2 * bits - 1) > 0, bitorder="little").view(np.uint64)[0])
+    return sig - (1 << 64) if sig >= 1 << 63 else sig
+
+
+def add_simhash(apps, schema_editor):
+    conn = schema_editor.connection
+    with conn.cursor() as c:
+        cols = [col.name for col in conn.introspection.get_table_description(c, TABLE)]
+        if "simhash" not in cols:
+            c.execute(f'ALTER TABLE "{TABLE}" ADD COLUMN "simhash" bigint NULL')
+
+
+def fill_simhash(apps, schema_editor):
+    NewsArticle = apps.get_model("CrawlerApp", "NewsArticle")
+    last_id = 0
+    while True:
+        batch = list(NewsArticle.objects.filter(id__gt=last_id).order_by("id").only("id", "title")[:BATCH])
+        if not batch:
+            break
+        for a in batch:
+            a.simhash = simhash(a.title)
+        NewsArticle.objects.bulk_update(batch, ["simhash"])
+        last_id = batch[-1].id
+
+
+class Migration(migrations.Migration):
+    """근사 중복 탐지: 기사 제목 SimHash 컬럼(기존 행 채움) + 중복 묶음 테이블"""
+
+    dependencies = [
+        ('CrawlerApp', '0007_newsarticle_tokenize_extracted_words'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[migrations.RunPython(add_simhash, migrations.RunPython.noop)],
+            state_operations=[
+                migrations.AddField(
+                    model_name='newsarticle',
+                    name='simhash',
+                    field=models.BigIntegerField(null=True),
+                ),
+            ],
+        ),
+        migrations.RunPython(fill_simhash, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='ArticleDuplicate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=255)),
+                ('link', models.URLField(max_length=1000, unique=True)),
+                ('distance', models.PositiveSmallIntegerField(default=0)),
+                ('created_at', models.DateTimeField(null=True)),
+                ('article', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='duplicates', to='CrawlerApp.newsarticle')),
+            ],
+        ),
+    ]
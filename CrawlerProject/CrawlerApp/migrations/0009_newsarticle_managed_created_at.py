@@ -0,0 +1,159 @@
+from datetime import datetime, timezone as dt_timezone
+from email.utils import parsedate_to_datetime
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.utils.dateparse import parse_date, parse_datetime
+
+TABLE = "CrawlerApp_newsarticle"
+NEW_TABLE = f"{TABLE}__new"
+FTS = "CrawlerApp_newsarticle_fts"
+INDEX = "newsarticle_created_id_idx"
+BATCH = 2000
+
+COLUMNS = '"id", "title", "link", "extracted_words", "top_words", "created_at", "simhash"'
+FTS_COLS = "title, extracted_words, top_words"
+
+# Django 가 managed 모델로 만들 때와 같은 정의 (created_at: datetime NOT NULL)
+CREATE_SQL = f"""CREATE TABLE "{NEW_TABLE}" (
+    "id" integer NOT NULL PRIMARY KEY AUTOINCREMENT,
+    "title" varchar(255) NOT NULL,
+    "link" varchar(200) NOT NULL UNIQUE,
+    "extracted_words" text NOT NULL,
+    "top_words" text NOT NULL,
+    "created_at" datetime NOT NULL,
+    "simhash" bigint NULL
+)"""
+
+# 0004 의 FTS 동기화 트리거 (테이블을 다시 만들면 같이 지워진다)
+TRIGGER_SQL = [
+    f"""CREATE TRIGGER IF NOT EXISTS "{FTS}_ai" AFTER INSERT ON "{TABLE}" BEGIN
+        INSERT INTO "{FTS}"(rowid, {FTS_COLS}) VALUES (new.id, new.title, new.extracted_words, new.top_words);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS "{FTS}_ad" AFTER DELETE ON "{TABLE}" BEGIN
+        INSERT INTO "{FTS}"("{FTS}", rowid, {FTS_COLS}) VALUES ('delete', old.id, old.title, old.extracted_words, old.top_words);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS "{FTS}_au" AFTER UPDATE ON "{TABLE}" BEGIN
+        INSERT INTO "{FTS}"("{FTS}", rowid, {FTS_COLS}) VALUES ('delete', old.id, old.title, old.extracted_words, old.top_words);
+        INSERT INTO "{FTS}"(rowid, {FTS_COLS}) VALUES (new.id, new.title, new.extracted_words, new.top_words);
+    END""",
+]
+
+
+def parse_created(value):
+    """예전 TEXT 값 → aware datetime. 시간대 없는 값은 UTC (Projectfix 의 datetime('now'), Django 저장값 모두 UTC)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        s = str(value).strip()
+        dt = parse_datetime(s)
+        if dt is None:
+            d = parse_date(s)
+            dt = datetime(d.year, d.month, d.day) if d else None
+        if dt is None:
+            try:
+                dt = parsedate_to_datetime(s)  # RSS pubDate 형식
+            except (TypeError, ValueError):
+                return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=dt_timezone.utc)
+    return dt
+
+
+def convert_created_at(apps, schema_editor):
+    """
+    created_at 텍스트를 Django 저장 형식(UTC 'YYYY-MM-DD HH:MM:SS[.ffffff]')으로 통일
+    비어 있거나 읽을 수 없는 값은 마이그레이션 시각으로 채운다 (Projectfix_created_at.py 와 같은 처리)
+    """
+    conn = schema_editor.connection
+    now = django.utils.timezone.now()
+    last_id = 0
+    with conn.cursor() as c:
+        while True:
+            c.execute(f'SELECT "id", "created_at" FROM "{TABLE}" WHERE "id" > %s ORDER BY "id" LIMIT %s',
+                      [last_id, BATCH])
+            rows = c.fetchall()
+            if not rows:
+                break
+            updates = []
+            for pk, raw in rows:
+                value = conn.ops.adapt_datetimefield_value(parse_created(raw) or now)
+                if value != raw:
+                    updates.append((value, pk))
+            if updates:
+                c.executemany(f'UPDATE "{TABLE}" SET "created_at" = %s WHERE "id" = %s', updates)
+            last_id = rows[-1][0]
+
+
+def rebuild_table(apps, schema_editor):
+    """
+    SQLite 는 컬럼 타입/NOT NULL 을 바꿀 수 없어서 새 테이블로 옮긴다
+    (id 는 그대로 → FTS rowid / ArticleDuplicate.article_id 유지, AUTOINCREMENT 시퀀스도 이어받음)
+    """
+    conn = schema_editor.connection
+    with conn.cursor() as c:
+        c.execute("SELECT seq FROM sqlite_sequence WHERE name = %s", [TABLE])
+        row = c.fetchone()
+        c.execute(f'DROP TABLE IF EXISTS "{NEW_TABLE}"')
+        c.execute(CREATE_SQL)
+        c.execute(f'INSERT INTO "{NEW_TABLE}" ({COLUMNS}) SELECT {COLUMNS} FROM "{TABLE}"')
+        c.execute(f'DROP TABLE "{TABLE}"')  # 0003 UNIQUE / 0006 인덱스, FTS 트리거도 같이 삭제
+        c.execute(f'ALTER TABLE "{NEW_TABLE}" RENAME TO "{TABLE}"')
+        if row:
+            c.execute("UPDATE sqlite_sequence SET seq = MAX(seq, %s) WHERE name = %s", [row[0], TABLE])
+        c.execute(f'CREATE INDEX "{INDEX}" ON "{TABLE}" ("created_at", "id")')
+        c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS])
+        if c.fetchone():
+            for sql in TRIGGER_SQL:
+                c.execute(sql)
+
+
+class Migration(migrations.Migration):
+    """
+    NewsArticle 을 managed 모델로 전환
+    - 상태를 실제 테이블에 맞춤 (id 는 integer AUTOINCREMENT, created_at 은 Projectfix/0006 이 붙인 컬럼)
+    - created_at 텍스트 값을 배치로 변환하고 빈 값을 채운 뒤
+    - datetime NOT NULL 컬럼 + (created_at, id) 인덱스로 테이블을 다시 만든다
+    """
+
+    dependencies = [
+        ('CrawlerApp', '0008_articleduplicate_newsarticle_simhash'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='newsarticle',
+                    name='id',
+                    field=models.AutoField(primary_key=True, serialize=False),
+                ),
+                migrations.AddField(
+                    model_name='newsarticle',
+                    name='created_at',
+                    field=models.DateTimeField(null=True),
+                ),
+            ],
+        ),
+        migrations.RunPython(convert_created_at, migrations.RunPython.noop),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[migrations.RunPython(rebuild_table, migrations.RunPython.noop)],
+            state_operations=[
+                migrations.AlterModelOptions(
+                    name='newsarticle',
+                    options={},
+                ),
+                migrations.AlterField(
+                    model_name='newsarticle',
+                    name='created_at',
+                    field=models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                migrations.AddIndex(
+                    model_name='newsarticle',
+                    index=models.Index(fields=['created_at', 'id'], name='newsarticle_created_id_idx'),
+                ),
+            ],
+        ),
+    ]
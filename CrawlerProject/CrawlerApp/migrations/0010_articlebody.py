@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:38
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('CrawlerApp', '0009_newsarticle_managed_created_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleBody',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('link', models.URLField(max_length=1000, unique=True)),
+                ('final_url', models.URLField(db_index=True, max_length=1000)),
+                ('status', models.PositiveSmallIntegerField(default=200)),
+                ('content_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('text', models.TextField(blank=True, default='')),
+                ('nbytes', models.PositiveIntegerField(default=0)),
+                ('fetched_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:52
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('CrawlerApp', '0010_articlebody'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordTopK',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('top', 'top_words'), ('token', 'extracted_words tokens')], max_length=8)),
+                ('window', models.CharField(max_length=7)),
+                ('capacity', models.PositiveIntegerField()),
+                ('total', models.BigIntegerField(default=0)),
+                ('data', models.BinaryField()),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'window'), name='wordtopk_kind_window_uniq')],
+            },
+        ),
+    ]
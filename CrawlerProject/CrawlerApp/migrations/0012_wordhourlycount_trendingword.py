@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('CrawlerApp', '0011_wordtopk'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrendingWord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveIntegerField(unique=True)),
+                ('word', models.CharField(max_length=255)),
+                ('score', models.FloatField()),
+                ('ratio', models.FloatField()),
+                ('recent', models.IntegerField()),
+                ('expected', models.FloatField()),
+                ('computed_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WordHourlyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.IntegerField()),
+                ('word', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['word', 'hour', 'count'], name='wordhourly_word_hour_cnt_idx')],
+                'constraints': [models.UniqueConstraint(fields=('hour', 'word'), name='wordhourlycount_hour_word_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+def backfill_hint(apps, schema_editor):
+    """
+    기존 DB 를 마이그레이션하면 롤업/요약 테이블(0005, 0011, 0012)이 빈 채로 남는다
+    → 기사는 있는데 WordDailyCount 가 비어 있으면 업그레이드 후 한 번 `python manage.py rebuild_wordcounts` 실행 안내
+    (롤업 규칙은 현재 코드(rollups.add_articles) 기준이라 마이그레이션 안에서 돌리지 않는다)
+    """
+    NewsArticle = apps.get_model("CrawlerApp", "NewsArticle")
+    WordDailyCount = apps.get_model("CrawlerApp", "WordDailyCount")
+    if WordDailyCount.objects.exists() or not NewsArticle.objects.exists():
+        return
+    print("\n  word count rollups are empty; "
+          "run `python manage.py rebuild_wordcounts` once after migrating to fill them")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('CrawlerApp', '0012_wordhourlycount_trendingword'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_hint, migrations.RunPython.noop),
+    ]
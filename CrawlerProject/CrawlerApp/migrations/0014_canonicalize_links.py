@@ -0,0 +1,74 @@
+from django.db import migrations
+
+from CrawlerApp.urlnorm import canonical_url
+
+BATCH = 2000
+
+
+def canonicalize_links(apps, schema_editor):
+    """
+    저장된 링크를 정규화한 형태(CrawlerApp.urlnorm.canonical_url)로 다시 쓴다
+    (0013 이전 행은 원래 링크 그대로라, 정규화한 링크로 조회하는 ingest / linkfilter 와 맞지 않아 다시 적재됐다)
+    - NewsArticle: 정규화 후 같은 링크가 되는 행은 0003 처럼 가장 작은 id 만 남기고,
+      나머지는 원래 링크 그대로 ArticleDuplicate(distance=0)로 옮긴다. 그 행에 묶여 있던 중복도 남는 행으로
+    - ArticleDuplicate: 링크 정규화, 정규화 후 겹치면 가장 작은 id 만 남긴다
+    정규화 규칙은 실행 시점의 urlnorm 을 쓴다 (규칙이 바뀌면 저장된 링크도 다시 맞춰야 하므로)
+    """
+    NewsArticle = apps.get_model("CrawlerApp", "NewsArticle")
+    ArticleDuplicate = apps.get_model("CrawlerApp", "ArticleDuplicate")
+    WordDailyCount = apps.get_model("CrawlerApp", "WordDailyCount")
+
+    keeper = {}  # 정규화한 링크 -> 남길 기사 id
+    changed, moved, merged = [], [], {}
+    for a in NewsArticle.objects.order_by("id").only("id", "title", "link", "created_at").iterator(chunk_size=BATCH):
+        link = canonical_url(a.link)
+        if link in keeper:
+            merged[a.id] = keeper[link]
+            moved.append(ArticleDuplicate(article_id=keeper[link], title=a.title, link=a.link,
+                                          distance=0, created_at=a.created_at))
+            continue
+        keeper[link] = a.id
+        if link != a.link:
+            a.link = link
+            changed.append(a)
+    del keeper
+
+    # 묶여 있던 중복을 먼저 옮긴다 (기사 삭제가 CASCADE 로 같이 지우지 않게)
+    for old, new in merged.items():
+        ArticleDuplicate.objects.filter(article_id=old).update(article_id=new)
+    # 지울 행을 먼저 지워야 남는 행의 링크를 바꿀 때 UNIQUE 에 걸리지 않는다
+    ids = list(merged)
+    for i in range(0, len(ids), BATCH):
+        NewsArticle.objects.filter(id__in=ids[i:i + BATCH]).delete()
+    NewsArticle.objects.bulk_update(changed, ["link"], batch_size=BATCH)
+
+    seen, dup_changed, dup_drop = set(), [], []
+    for d in ArticleDuplicate.objects.order_by("id").only("id", "link").iterator(chunk_size=BATCH):
+        link = canonical_url(d.link)
+        if link in seen:
+            dup_drop.append(d.id)
+            continue
+        seen.add(link)
+        if link != d.link:
+            d.link = link
+            dup_changed.append(d)
+    for i in range(0, len(dup_drop), BATCH):
+        ArticleDuplicate.objects.filter(id__in=dup_drop[i:i + BATCH]).delete()
+    ArticleDuplicate.objects.bulk_update(dup_changed, ["link"], batch_size=BATCH)
+    # 옮긴 기사는 원래 링크로 (정규화 링크는 남긴 기사가 갖고 있음)
+    ArticleDuplicate.objects.bulk_create(moved, batch_size=BATCH, ignore_conflicts=True)
+
+    if merged and WordDailyCount.objects.exists():
+        print(f"\n  merged {len(merged)} articles with the same canonical link; "
+              f"run `python manage.py rebuild_wordcounts` to drop them from the word counts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('CrawlerApp', '0013_backfill_wordcounts'),
+    ]
+
+    operations = [
+        migrations.RunPython(canonicalize_links, migrations.RunPython.noop),
+    ]
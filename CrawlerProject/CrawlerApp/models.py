@@ -1,16 +1,132 @@
 from django.db import models
+from django.utils import timezone
 
 class NewsArticle(models.Model):
     id = models.AutoField(primary_key=True)
     title = models.CharField(max_length=255)
-    link = models.URLField()
+    link = models.URLField(unique=True)
     extracted_words = models.TextField()
     top_words = models.TextField()
-    created_at = models.DateTimeField(null=True)  # ← 앞서 추가한 컬럼과 이름 동일
+    created_at = models.DateTimeField(default=timezone.now)
+    simhash = models.BigIntegerField(null=True)  # 제목 SimHash (부호 있는 64비트로 저장, CrawlerApp.neardup)
 
     class Meta:
         db_table = 'CrawlerApp_newsarticle'
-        managed = False
+        indexes = [
+            # 최근 N일 필터 / 최신순 정렬 / 키셋 페이지네이션 (CrawlerApp.pagination)
+            models.Index(fields=["created_at", "id"], name="newsarticle_created_id_idx"),
+        ]
 
     def __str__(self):
-        return self.title[:60]
\ No newline at end of file
+        return self.title[:60]
+
+class ArticleDuplicate(models.Model):
+    """ingest 때 근사 중복으로 판정되어 대표 기사(article)에 묶인 기사"""
+    # DB 외래키 제약 없이 만든 테이블 (0008 당시 NewsArticle 이 unmanaged), 삭제 전파는 Django 가 처리
+    article = models.ForeignKey(NewsArticle, on_delete=models.CASCADE, related_name="duplicates",
+                                db_constraint=False)
+    title = models.CharField(max_length=255)
+    link = models.URLField(max_length=1000, unique=True)
+    distance = models.PositiveSmallIntegerField(default=0)  # 대표 기사와의 해밍 거리
+    created_at = models.DateTimeField(null=True)
+
+    def __str__(self):
+        return f"{self.title[:60]} ~ #{self.article_id}"
+
+class ArticleBody(models.Model):
+    """crawl_news --bodies 로 받은 기사 본문 캐시 (CrawlerApp.bodies)"""
+    link = models.URLField(max_length=1000, unique=True)  # 정규화한 링크
+    final_url = models.URLField(max_length=1000, db_index=True)  # 리다이렉트를 따라간 최종 주소
+    status = models.PositiveSmallIntegerField(default=200)
+    content_hash = models.CharField(max_length=64, blank=True, default="")  # 받은 HTML 의 sha256
+    text = models.TextField(blank=True, default="")  # 추출한 본문
+    nbytes = models.PositiveIntegerField(default=0)
+    fetched_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return self.link
+
+class FeedState(models.Model):
+    """crawl_news 조건부 요청용 피드별 상태 (ETag / Last-Modified / 본문 해시 / 최근 항목 ID)"""
+    url = models.URLField(max_length=1000, unique=True)
+    etag = models.CharField(max_length=255, blank=True, default="")
+    last_modified = models.CharField(max_length=64, blank=True, default="")
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    seen_ids = models.JSONField(default=list, blank=True)
+    checked_at = models.DateTimeField(null=True)
+    changed_at = models.DateTimeField(null=True)
+
+    def __str__(self):
+        return self.url
+
+
+class WordDailyCount(models.Model):
+    """일자별 단어 집계 롤업 (index / api_topwords 상위 단어용, CrawlerApp.rollups 참고)"""
+    TOP = "top"      # 기사당 top_words 1개
+    TOKEN = "token"  # extracted_words 전체 토큰
+    KIND_CHOICES = [(TOP, "top_words"), (TOKEN, "extracted_words tokens")]
+
+    kind = models.CharField(max_length=8, choices=KIND_CHOICES)
+    day = models.DateField()
+    word = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "day", "word"], name="worddailycount_kind_day_word_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.kind} {self.word}={self.count}"
+
+
+class WordTopK(models.Model):
+    """종류 × 구간별 상위 단어 스트리밍 요약 (Space-Saving, CrawlerApp.topk 참고)"""
+    kind = models.CharField(max_length=8, choices=WordDailyCount.KIND_CHOICES)
+    window = models.CharField(max_length=7)  # "all" 또는 "YYYY-MM"
+    capacity = models.PositiveIntegerField()  # 유지하는 카운터 수 m
+    total = models.BigIntegerField(default=0)  # 지금까지 들어온 단어 수 N (오차 상한 N/m)
+    data = models.BinaryField()
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "window"], name="wordtopk_kind_window_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.window} (m={self.capacity}, N={self.total})"
+
+
+class WordHourlyCount(models.Model):
+    """시간별 제목 토큰 집계 (급상승 단어용, CrawlerApp.trending 참고). 기준 구간보다 오래된 행은 compute 때 삭제"""
+    hour = models.IntegerField()  # 유닉스 시간 // 3600 (UTC)
+    word = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)  # 이 단어가 제목에 나온 기사 수
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["hour", "word"], name="wordhourlycount_hour_word_uniq"),
+        ]
+        indexes = [
+            # trending.load_stats 의 GROUP BY word 를 정렬 없이 색인만 읽어서 처리 (covering)
+            models.Index(fields=["word", "hour", "count"], name="wordhourly_word_hour_cnt_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.hour} {self.word}={self.count}"
+
+
+class TrendingWord(models.Model):
+    """미리 계산한 급상승 단어 (compute_trending 이 통째로 교체, /api/trending 은 읽기만)"""
+    rank = models.PositiveIntegerField(unique=True)
+    word = models.CharField(max_length=255)
+    score = models.FloatField()  # z 점수
+    ratio = models.FloatField()  # (최근 + 1) / (기대값 + 1)
+    recent = models.IntegerField()  # 최근 구간 기사 수
+    expected = models.FloatField()  # 기준 구간 평균으로 본 최근 구간 기대값
+    computed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"#{self.rank} {self.word} z={self.score:.1f}"
+
@@ -0,0 +1,207 @@
+# CrawlerApp/neardup.py
+"""
+제목 근사 중복 탐지 (SimHash + 밴드 LSH)
+
+- 서명: 정규화한 제목(언론사 꼬리 " - 매체명" 제거, 토큰화)의 글자 3-gram 으로 만든 64비트 SimHash
+- 색인: 64비트를 16비트 밴드 4개로 나눠 밴드 값별로 정렬해 둔 numpy 배열
+  해밍 거리 3 이하인 두 서명은 비둘기집 원리로 최소 한 밴드가 완전히 같다 → 그 밴드 후보만 비교
+- 추가는 작은 세그먼트로 쌓고 크기가 비슷해지면 병합 (LSM 방식, 추가 비용 O(log n) 상각)
+- ingest 단계에서 최근 DEDUP_WINDOW_DAYS 일 기사로 색인을 만들어 두고
+  가까운 서명이 있으면 새 행 대신 ArticleDuplicate 로 묶는다
+"""
+import hashlib
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+from .tokenizer import tokenize
+
+BANDS = 4
+BAND_BITS = 16
+SHINGLE = 3
+SEGMENT_MIN = 1024  # 이만큼 쌓이면 정렬된 세그먼트로 만든다
+
+_MASK64 = (1 << 64) - 1
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def normalize_title(title: str) -> str:
+    """'제목 - 매체명' 형태의 언론사 꼬리를 떼고 토큰만 남긴 문자열"""
+    head, sep, tail = (title or "").rpartition(" - ")
+    if sep and head and len(tail) <= 30:
+        title = head
+    return " ".join(tokenize(title))
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(title: str) -> int:
+    """제목 → 64비트 SimHash (부호 없는 정수). 특징이 없으면 0"""
+    text = normalize_title(title).replace(" ", "")
+    if len(text) < SHINGLE:
+        feats = Counter([text]) if text else Counter()
+    else:
+        feats = Counter(text[i:i + SHINGLE] for i in range(len(text) - SHINGLE + 1))
+    if not feats:
+        return 0
+    hashes = np.array([_feature_hash(f) for f in feats], dtype=np.uint64)
+    weights = np.fromiter(feats.values(), dtype=np.int64, count=len(feats))
+    bits = np.unpackbits(hashes.view(np.uint8), bitorder="little").reshape(-1, 64).astype(np.int64)
+    v = weights @ (2 * bits - 1)  # 비트별 가중 투표
+    return int(np.packbits(v > 0, bitorder="little").view(np.uint64)[0])
+
+
+def to_signed(sig: int) -> int:
+    """BigIntegerField(부호 있는 64비트)에 저장할 값"""
+    return sig - (1 << 64) if sig >= 1 << 63 else sig
+
+
+def to_unsigned(value: int) -> int:
+    return value & _MASK64
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _popcount(x):
+    return _POPCOUNT[x.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+class _Segment:
+    """정렬된 밴드 색인을 가진 불변 서명 묶음"""
+
+    def __init__(self, sigs, ids):
+        self.sigs = sigs
+        self.ids = ids
+        self.keys, self.order = [], []
+        for b in range(BANDS):
+            k = ((sigs >> np.uint64(b * BAND_BITS)) & np.uint64((1 << BAND_BITS) - 1)).astype(np.uint16)
+            order = np.argsort(k, kind="stable")
+            self.keys.append(k[order])
+            self.order.append(order)
+
+    def __len__(self):
+        return len(self.sigs)
+
+    def candidates(self, sig):
+        found = []
+        for b in range(BANDS):
+            # 파이썬 int 그대로 넘기면 uint16 배열 전체가 int64 로 변환된다
+            k = np.uint16((sig >> (b * BAND_BITS)) & ((1 << BAND_BITS) - 1))
+            lo = np.searchsorted(self.keys[b], k, "left")
+            hi = np.searchsorted(self.keys[b], k, "right")
+            if hi > lo:
+                found.append(self.order[b][lo:hi])
+        if not found:
+            return None
+        return np.unique(np.concatenate(found))
+
+
+class SimHashIndex:
+    def __init__(self, max_distance=3):
+        if max_distance >= BANDS:
+            raise ValueError(f"max_distance must be < {BANDS} for exact band lookup")
+        self.max_distance = max_distance
+        self._segments = []
+        self._pending_sigs, self._pending_ids = [], []
+
+    def __len__(self):
+        return sum(map(len, self._segments)) + len(self._pending_sigs)
+
+    @classmethod
+    def build(cls, sigs, ids, max_distance=3):
+        """대량 적재 (세그먼트 하나로 한 번에 정렬)"""
+        index = cls(max_distance)
+        if len(sigs):
+            index._segments.append(_Segment(np.asarray(sigs, dtype=np.uint64), np.asarray(ids, dtype=np.int64)))
+        return index
+
+    def add(self, sig, ident):
+        self._pending_sigs.append(sig)
+        self._pending_ids.append(ident)
+        if len(self._pending_sigs) >= SEGMENT_MIN:
+            self._flush()
+
+    def _flush(self):
+        seg = _Segment(np.array(self._pending_sigs, dtype=np.uint64), np.array(self._pending_ids, dtype=np.int64))
+        self._pending_sigs, self._pending_ids = [], []
+        self._segments.append(seg)
+        # 마지막 두 세그먼트 크기가 비슷하면 병합 (세그먼트 수는 O(log n))
+        while len(self._segments) > 1 and len(self._segments[-2]) <= 2 * len(self._segments[-1]):
+            b, a = self._segments.pop(), self._segments.pop()
+            self._segments.append(_Segment(np.concatenate([a.sigs, b.sigs]), np.concatenate([a.ids, b.ids])))
+
+    def query(self, sig):
+        """가장 가까운 (id, 거리) — max_distance 이내가 없으면 None"""
+        best = None
+        for s, ident in zip(self._pending_sigs, self._pending_ids):
+            d = hamming(s, sig)
+            if d <= self.max_distance and (best is None or d < best[1]):
+                best = (ident, d)
+        for seg in self._segments:
+            cand = seg.candidates(sig)
+            if cand is None:
+                continue
+            d = _popcount(seg.sigs[cand] ^ np.uint64(sig))
+            i = int(np.argmin(d))
+            if d[i] <= self.max_distance and (best is None or d[i] < best[1]):
+                best = (int(seg.ids[cand[i]]), int(d[i]))
+        return best
+
+
+# -------------------- 프로세스 전역 색인 --------------------
+_index = None
+_built_at = 0.0
+_lock = threading.Lock()
+
+
+def _load_index():
+    from .models import NewsArticle
+    since = timezone.now() - timedelta(days=settings.DEDUP_WINDOW_DAYS)
+    rows = (NewsArticle.objects
+            .filter(simhash__isnull=False, created_at__gte=since)
+            .values_list("simhash", "id"))
+    sigs, ids = [], []
+    for value, ident in rows.iterator(chunk_size=5000):
+        sigs.append(to_unsigned(value))
+        ids.append(ident)
+    return SimHashIndex.build(sigs, ids, settings.DEDUP_MAX_DISTANCE)
+
+
+def get_index():
+    """최근 기사 서명 색인. DEDUP_INDEX_TTL 초마다 DB에서 다시 만든다 (다른 프로세스가 넣은 기사/기간 만료 반영)"""
+    global _index, _built_at
+    with _lock:
+        if _index is None or time.monotonic() - _built_at > settings.DEDUP_INDEX_TTL:
+            _index = _load_index()
+            _built_at = time.monotonic()
+        return _index
+
+
+def lookup(sig):
+    """최근 기사 중 가장 가까운 (id, 거리) 또는 None"""
+    index = get_index()
+    with _lock:
+        return index.query(sig)
+
+
+def remember(pairs):
+    """방금 저장한 기사 [(서명, id), ...] 를 색인에 추가"""
+    index = get_index()
+    with _lock:
+        for sig, ident in pairs:
+            index.add(sig, ident)
+
+
+def reset_index():
+    global _index
+    with _lock:
+        _index = None
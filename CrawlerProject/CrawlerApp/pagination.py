@@ -0,0 +1,52 @@
+# CrawlerApp/pagination.py
+"""
+(created_at, id) 키셋 페이지네이션
+
+정렬은 항상 -created_at, -id (created_at 은 NOT NULL, 0009 마이그레이션).
+커서는 마지막 행의 (created_at, id)를 base64로 감싼 불투명 문자열이라
+OFFSET 없이 (created_at, id) 복합 인덱스만 타고 다음 페이지로 넘어간다.
+"""
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+ORDERING = ("-created_at", "-id")
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at, pk) -> str:
+    raw = json.dumps([created_at.isoformat(), pk], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created, pk = json.loads(raw)
+        created_at = parse_datetime(created)
+        if created_at is None or not isinstance(pk, int):
+            raise ValueError(cursor)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(cursor) from e
+    return created_at, pk
+
+
+def after_cursor(qs, cursor):
+    """cursor 다음 행부터 (ORDERING 기준)"""
+    if not cursor:
+        return qs
+    created_at, pk = decode_cursor(cursor)
+    return qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+
+def next_cursor(rows, limit):
+    """rows 를 limit+1개 조회했을 때: 다음 페이지가 있으면 커서, 없으면 None"""
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(last["created_at"], last["id"])
@@ -0,0 +1,61 @@
+# CrawlerApp/rollups.py
+"""
+상위 단어 롤업 (WordDailyCount)
+
+- ingest 단계에서 새 기사가 들어올 때마다 (종류, 날짜, 단어)별 카운트를 증분 반영
+  같은 카운트로 전체/월 구간 상위 단어 요약(CrawlerApp.topk)도 갱신, 시간별 제목 토큰(CrawlerApp.trending)도 여기서
+- index / api_topwords 는 최근 N일 버킷 몇 개만 합산 (기사 테이블 GROUP BY 없음)
+- 기존 데이터는 `python manage.py rebuild_wordcounts` 로 채운다 (업그레이드 후 한 번, 롤업이 비어 있으면 마이그레이션 0013 이 안내)
+"""
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Sum
+from django.utils import timezone
+
+from . import topk, trending
+from .models import WordDailyCount
+from .tokenizer import split_tokens
+
+def count_articles(articles) -> Counter:
+    """NewsArticle 목록 → Counter{(kind, day, word): n}"""
+    c = Counter()
+    for a in articles:
+        day = timezone.localdate(a.created_at)
+        if a.top_words:
+            c[(WordDailyCount.TOP, day, a.top_words)] += 1
+        for tok in split_tokens(a.extracted_words):
+            c[(WordDailyCount.TOKEN, day, tok)] += 1
+    return c
+
+
+def add_counts(counts: Counter):
+    """카운트를 롤업 테이블에 더한다 (UPSERT, executemany 한 번)"""
+    if not counts:
+        return
+    table = connection.ops.quote_name(WordDailyCount._meta.db_table)
+    sql = (f'INSERT INTO {table} ("kind", "day", "word", "count") VALUES (%s, %s, %s, %s) '
+           f'ON CONFLICT ("kind", "day", "word") DO UPDATE SET "count" = "count" + excluded."count"')
+    adapt = connection.ops.adapt_datefield_value
+    with connection.cursor() as c:
+        c.executemany(sql, [(k, adapt(d), w, n) for (k, d, w), n in counts.items()])
+
+
+def add_articles(articles):
+    counts = count_articles(articles)
+    add_counts(counts)
+    if settings.TOPK_ENABLED:
+        topk.add_counts(counts)
+    if settings.TRENDING_ENABLED:
+        trending.add_articles(articles)
+
+
+def top_words(days, kind=WordDailyCount.TOP, n=20):
+    """최근 days일(오늘 포함 달력 기준 days개 버킷, 0이면 전체) 상위 n개 [(word, cnt), ...]"""
+    qs = WordDailyCount.objects.filter(kind=kind)
+    if days > 0:
+        qs = qs.filter(day__gte=timezone.localdate() - timedelta(days=days - 1))
+    agg = qs.values("word").annotate(cnt=Sum("count")).order_by("-cnt")[:n]
+    return [(row["word"], row["cnt"]) for row in agg]
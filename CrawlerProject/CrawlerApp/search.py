@@ -0,0 +1,95 @@
+# CrawlerApp/search.py
+"""
+기사 검색 (api_articles / api_topwords 공용)
+
+- 0004_newsarticle_fts 마이그레이션이 FTS5 가상 테이블(CrawlerApp_newsarticle_fts)과
+  동기화 트리거를 만들고 기존 행을 백필한다
+- 검색어(동의어 포함)는 접두어 MATCH 식으로 바꿔서 bm25 랭킹으로 조회
+  (한국어는 조사가 뒤에 붙으니 "반도체"* 가 "반도체가", "반도체주"까지 잡는다)
+- FTS5를 쓸 수 없는 DB에서만 예전 LIKE '%t%' 조건으로 폴백
+"""
+import re
+
+from django.db import connection, connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "CrawlerApp_newsarticle_fts"
+ARTICLE_TABLE = "CrawlerApp_newsarticle"
+
+# FTS5 unicode61 토크나이저가 자르는 단위와 맞춘다
+_FTS_TOKEN = re.compile(r"\w+")
+
+_fts_tables = {}
+
+
+def fts_available(using=None) -> bool:
+    alias = using or "default"
+    if alias not in _fts_tables:
+        conn = connections[alias]
+        _fts_tables[alias] = (
+            conn.vendor == "sqlite" and FTS_TABLE in conn.introspection.table_names()
+        )
+    return _fts_tables[alias]
+
+
+def match_expression(terms) -> str:
+    """['반도체', 'sk 하이닉스'] → '"반도체"* OR ("sk"* AND "하이닉스"*)'"""
+    parts = []
+    for t in terms:
+        toks = _FTS_TOKEN.findall(t.lower())
+        if not toks:
+            continue
+        phrase = " AND ".join('"%s"*' % tok.replace('"', '""') for tok in toks)
+        parts.append(f"({phrase})" if len(toks) > 1 else phrase)
+    return " OR ".join(parts)
+
+
+def like_condition(terms) -> Q:
+    """FTS5가 없을 때 쓰는 예전 조건 (전 테이블 LIKE 스캔)"""
+    cond = Q()
+    for t in terms:
+        cond |= (Q(title__icontains=t) |
+                 Q(extracted_words__icontains=t) |
+                 Q(top_words__icontains=t))
+    return cond
+
+
+def filter_matching(qs, terms):
+    """NewsArticle 쿼리셋을 검색어 매칭 행으로 좁힌다"""
+    expr = match_expression(terms)
+    if not expr:
+        return qs.none()
+    if fts_available(qs.db):
+        return qs.filter(id__in=RawSQL(
+            f'SELECT rowid FROM "{FTS_TABLE}" WHERE "{FTS_TABLE}" MATCH %s', [expr]
+        ))
+    return qs.filter(like_condition(terms))
+
+
+def ranked_titles(terms, since=None, limit=1000, field="title"):
+    """검색어와 가장 관련 높은(bm25) 기사 limit개의 field 값 (기본: 제목)"""
+    from .models import NewsArticle
+
+    expr = match_expression(terms)
+    if not expr:
+        return []
+    if not fts_available():
+        qs = NewsArticle.objects.filter(like_condition(terms))
+        if since is not None:
+            qs = qs.filter(created_at__gte=since)
+        return list(qs.values_list(field, flat=True)[:limit])
+
+    column = connection.ops.quote_name(NewsArticle._meta.get_field(field).column)
+    sql = (f'SELECT a.{column} FROM "{FTS_TABLE}" f '
+           f'JOIN "{ARTICLE_TABLE}" a ON a."id" = f.rowid '
+           f'WHERE "{FTS_TABLE}" MATCH %s')
+    params = [expr]
+    if since is not None:
+        sql += ' AND a."created_at" >= %s'
+        params.append(connection.ops.adapt_datetimefield_value(since))
+    sql += " ORDER BY f.rank LIMIT %s"
+    params.append(limit)
+    with connection.cursor() as c:
+        c.execute(sql, params)
+        return [row[0] for row in c.fetchall()]
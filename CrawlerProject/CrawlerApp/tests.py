@@ -1,3 +1,450 @@
-from django.test import TestCase
+# CrawlerApp/tests.py
+import asyncio
+import base64
+import importlib
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import quote, urlencode
 
-# Create your tests here.
+import httpx
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from . import linkfilter, metrics, views
+from .cache import TTLCache
+from .fetcher import iter_feeds
+from .ingest import ingest_articles
+from .models import ArticleDuplicate, NewsArticle
+from .urlnorm import _MAX_UNWRAP, canonical_url
+
+canonicalize_migration = importlib.import_module("CrawlerApp.migrations.0014_canonicalize_links")
+
+
+def _item(title, link):
+    return {"title": title, "link": link, "extracted_words": title, "top_words": title.split()[0]}
+
+
+def _google_news_id(url):
+    """원문 주소가 든 옛 형식 Google News 기사 ID (08 13 22 → "CBMi")"""
+    raw = url.encode("utf-8")
+    assert len(raw) < 0x80  # 길이 varint 1바이트
+    return base64.urlsafe_b64encode(b"\x08\x13\x22" + bytes([len(raw)]) + raw).decode().rstrip("=")
+
+
+def _google_redirect(url, depth):
+    for _ in range(depth):
+        url = "https://www.google.com/url?q=" + quote(url, safe="")
+    return url
+
+
+class CanonicalUrlTests(SimpleTestCase):
+    def test_google_news_article_id_is_unwrapped(self):
+        token = _google_news_id("https://news.example.com/economy/1/?utm_source=gn")
+        self.assertTrue(token.startswith("CBMi"))
+        url = f"https://news.google.com/rss/articles/{token}?oc=5&hl=ko&gl=KR&ceid=KR:ko"
+        self.assertEqual(canonical_url(url), "https://news.example.com/economy/1")
+
+    def test_encrypted_google_news_id_keeps_google_link(self):
+        # 새 형식 ID(주소가 들어 있지 않음)는 풀 수 없으니 Google 주소 그대로, 추적 파라미터만 뗀다
+        token = base64.urlsafe_b64encode(b"\x08\x13\x22\x10AU_yqLOpaque0000").decode().rstrip("=")
+        url = f"https://news.google.com/rss/articles/{token}?oc=5&hl=ko&gl=KR&ceid=KR:ko"
+        self.assertEqual(canonical_url(url), f"https://news.google.com/rss/articles/{token}")
+
+    def test_google_news_params_are_stripped_only_on_google_news(self):
+        self.assertEqual(canonical_url("https://news.google.com/topics/X?hl=ko&gl=KR&ceid=KR:ko&oc=3&q=a"),
+                         "https://news.google.com/topics/X?q=a")
+        self.assertEqual(canonical_url("https://a.com/list?hl=ko&gl=KR"), "https://a.com/list?gl=KR&hl=ko")
+
+    def test_tracking_params_host_port_fragment(self):
+        self.assertEqual(canonical_url(" HTTPS://News.Example.COM.:443/a/?b=2&utm_medium=x&a=1&fbclid=z#top "),
+                         "https://news.example.com/a?a=1&b=2")
+        self.assertEqual(canonical_url("http://a.com:8080/x"), "http://a.com:8080/x")
+
+    def test_trailing_slash(self):
+        self.assertEqual(canonical_url("https://a.com/n/1/"), "https://a.com/n/1")
+        self.assertEqual(canonical_url("https://a.com/n/1//"), "https://a.com/n/1")
+        self.assertEqual(canonical_url("https://a.com"), "https://a.com/")
+        self.assertEqual(canonical_url("https://a.com/"), "https://a.com/")
+
+    def test_non_http_links_are_only_stripped(self):
+        self.assertEqual(canonical_url("  mailto:x@a.com "), "mailto:x@a.com")
+        self.assertEqual(canonical_url("https://[::1"), "https://[::1")
+        self.assertEqual(canonical_url(None), "")
+
+    def test_unwrap_bound(self):
+        target = "https://News.Example.com/a/1/?utm_source=x"
+        # _MAX_UNWRAP 번까지 감싼 주소는 끝까지 풀리고, 마지막으로 푼 주소도 정규화된다
+        self.assertEqual(canonical_url(_google_redirect(target, _MAX_UNWRAP)), "https://news.example.com/a/1")
+        # 한 겹 더 감싸면 더 풀지 않고 남은 리다이렉트 주소 자체를 정규화한다
+        self.assertEqual(canonical_url(_google_redirect(target, _MAX_UNWRAP + 1)),
+                         "https://www.google.com/url?" + urlencode({"q": target}))
+
+
+class BloomFilterTests(SimpleTestCase):
+    def test_no_false_negatives_and_error_rate(self):
+        capacity = 5000
+        bloom = linkfilter.BloomFilter(capacity, settings.LINK_BLOOM_ERROR)
+        added = [f"https://a.com/news/{i}" for i in range(capacity)]
+        bloom.add_many(added)
+        self.assertTrue(bloom.contains_many(added).all())
+        self.assertIn(added[0], bloom)
+
+        probes = [f"https://b.com/other/{i}" for i in range(20 * capacity)]
+        rate = bloom.contains_many(probes).mean()
+        self.assertLess(rate, 1.5 * settings.LINK_BLOOM_ERROR)
+
+    def test_empty(self):
+        bloom = linkfilter.BloomFilter(100, 0.01)
+        bloom.add_many([])
+        self.assertEqual(bloom.count, 0)
+        self.assertEqual(bloom.contains_many([]).shape, (0,))
+        self.assertNotIn("https://a.com/", bloom)
+
+
+@override_settings(LINK_BLOOM_PATH="", DEDUP_ENABLED=False, TOPK_ENABLED=False, TRENDING_ENABLED=False)
+class LegacyLinkTests(TestCase):
+    """0014 이전에 원래 링크 그대로 저장된 행 → 정규화 후 같은 기사가 다시 들어오지 않아야 한다"""
+
+    def setUp(self):
+        linkfilter.reset()
+        self.addCleanup(linkfilter.reset)
+
+    def test_legacy_raw_link_is_not_reinserted(self):
+        raw = "https://News.Example.com/economy/1/?utm_source=rss&id=7#top"
+        NewsArticle.objects.create(title="금리 인하 발표", link=raw, extracted_words="금리 인하 발표", top_words="금리")
+        canonicalize_migration.canonicalize_links(apps, None)
+        self.assertEqual(NewsArticle.objects.get().link, "https://news.example.com/economy/1?id=7")
+
+        new = ingest_articles([_item("금리 인하 발표", raw)])
+        self.assertEqual(new, [])
+        self.assertEqual(NewsArticle.objects.count(), 1)
+
+    def test_colliding_links_keep_lowest_id(self):
+        first = NewsArticle.objects.create(title="반도체 수출", link="https://a.com/n/1?utm_medium=x",
+                                           extracted_words="반도체 수출", top_words="반도체")
+        second = NewsArticle.objects.create(title="반도체 수출 증가", link="https://a.com/n/1/",
+                                            extracted_words="반도체 수출 증가", top_words="반도체")
+        ArticleDuplicate.objects.create(article_id=second.id, title="반도체 수출!", link="https://b.com/x?fbclid=1")
+        canonicalize_migration.canonicalize_links(apps, None)
+
+        self.assertEqual(list(NewsArticle.objects.values_list("id", "link")), [(first.id, "https://a.com/n/1")])
+        self.assertEqual(
+            sorted(ArticleDuplicate.objects.values_list("article_id", "link")),
+            [(first.id, "https://a.com/n/1/"), (first.id, "https://b.com/x")],
+        )
+
+
+@override_settings(LINK_BLOOM_PATH="", LINK_BLOOM_ENABLED=True)
+class LinkFilterPersistTests(TestCase):
+    """<db>.links.bloom 저장 → 다음 프로세스에서 읽고, 저장 이후 행만 따라잡는다"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db = os.path.join(tmp.name, "db.sqlite3")
+        patcher = mock.patch.dict(connection.settings_dict, {"NAME": self.db})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        linkfilter.reset()
+        self.addCleanup(linkfilter.reset)
+
+    def _article(self, link):
+        return NewsArticle.objects.create(title=link, link=link, extracted_words="", top_words="")
+
+    def test_round_trip(self):
+        path = self.db + ".links.bloom"
+        self.assertEqual(linkfilter._path(), path)
+        self._article("https://a.com/1")
+        self.assertEqual(linkfilter.seen_links(["https://a.com/1", "https://a.com/2"]), {"https://a.com/1"})
+        linkfilter.save()
+        self.assertTrue(os.path.exists(path))
+
+        self._article("https://a.com/3")  # 저장 이후 행
+        linkfilter.reset()
+        with mock.patch.object(linkfilter.LinkFilter, "build", side_effect=AssertionError("rebuilt")):
+            seen = linkfilter.seen_links(["https://a.com/1", "https://a.com/3", "https://a.com/4"])
+        self.assertEqual(seen, {"https://a.com/1", "https://a.com/3"})
+
+        loaded = linkfilter.LinkFilter.load(path)
+        self.assertIn("https://a.com/1", loaded.bloom)
+        self.assertEqual(loaded.article_max, NewsArticle.objects.get(link="https://a.com/1").id)
+
+    def test_error_rate_change_discards_file(self):
+        path = self.db + ".links.bloom"
+        self._article("https://a.com/1")
+        linkfilter.seen_links(["https://a.com/1"])
+        linkfilter.save()
+        with override_settings(LINK_BLOOM_ERROR=settings.LINK_BLOOM_ERROR / 10):
+            self.assertIsNone(linkfilter.LinkFilter.load(path))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TTLCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(maxsize=2, ttl=60, clock=self.clock)
+
+    def test_concurrent_identical_keys_fetch_once(self):
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return ["a"]
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get_or_fetch("k", fetch)))
+                   for _ in range(5)]
+        for t in threads:
+            t.start()
+        for _ in range(500):  # 나머지 4개가 진행 중인 fetch 를 기다릴 때까지
+            if self.cache.stats()["shared"] == 4:
+                break
+            time.sleep(0.01)
+        release.set()
+        for t in threads:
+            t.join(5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [["a"]] * 5)
+        stats = self.cache.stats()
+        self.assertEqual((stats["misses"], stats["shared"], stats["hits"]), (1, 4, 0))
+
+    def test_hits_misses_and_ttl(self):
+        calls = []
+        fetch = lambda: calls.append(1) or [len(calls)]
+        self.assertEqual(self.cache.get_or_fetch("k", fetch), [1])
+        self.clock.now += 59
+        self.assertEqual(self.cache.get_or_fetch("k", fetch), [1])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.clock.now += 1  # 만료
+        self.assertEqual(self.cache.get_or_fetch("k", fetch), [2])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        self.assertEqual(self.cache.stats()["hit_ratio"], round(1 / 3, 4))
+
+    def test_lru_eviction(self):
+        for key in ("a", "b"):
+            self.cache.get_or_fetch(key, lambda: [key])
+        self.cache.get_or_fetch("a", lambda: ["x"])  # a 가 최근
+        self.cache.get_or_fetch("c", lambda: ["c"])  # b 가 밀려남
+        self.assertEqual(self.cache.get_or_fetch("a", lambda: ["x"]), ["a"])
+        self.assertEqual(self.cache.get_or_fetch("b", lambda: ["b2"]), ["b2"])
+
+    def test_failure_and_empty_result_are_not_cached(self):
+        def boom():
+            raise httpx.ConnectError("down")
+
+        with self.assertRaises(httpx.ConnectError):
+            self.cache.get_or_fetch("k", boom)
+        self.assertEqual(self.cache.get_or_fetch("k", lambda: []), [])
+        self.assertEqual(self.cache.get_or_fetch("k", lambda: ["ok"]), ["ok"])
+        self.assertEqual(self.cache.misses, 3)
+        self.assertEqual(self.cache.stats()["size"], 1)
+
+
+class LiveFetchTests(SimpleTestCase):
+    """_fetch_live_from_google_news: 업스트림(_google_news_upstream)은 가짜로 바꿔서 검사"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(maxsize=8, ttl=views.LIVE_CACHE_TTL, clock=self.clock)
+        patcher = mock.patch.object(views, "_live_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.urls = []
+        self.error = None
+        self.gate = None
+
+    async def _upstream(self, url):
+        self.urls.append(url)
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(entries=[
+            SimpleNamespace(title="삼성전자 반도체 수출", link="https://a.com/n/1/?utm_source=gn"),
+            SimpleNamespace(title="", link="https://a.com/n/2"),
+        ])
+
+    def _live(self, q):
+        return views._fetch_live_from_google_news(q)
+
+    def _counts(self):
+        return {r: metrics.LIVE_FETCHES.value(r) for r in ("ok", "error", "timeout")}
+
+    def _delta(self, before):
+        after = self._counts()
+        return {r: after[r] - before[r] for r in after if after[r] != before[r]}
+
+    async def test_concurrent_identical_queries_share_one_upstream_call(self):
+        before = self._counts()
+        self.gate = asyncio.Event()
+        with mock.patch.object(views, "_google_news_upstream", self._upstream):
+            tasks = [asyncio.ensure_future(self._live(q)) for q in ("삼성 ", " 삼성", "삼성", "삼성  ")]
+            while self.cache.stats()["shared"] < 3:  # 나머지 3개가 진행 중인 조회에 붙을 때까지
+                await asyncio.sleep(0)
+            self.gate.set()
+            results = await asyncio.gather(*tasks)
+            again = await self._live("삼성")
+        self.assertEqual(len(self.urls), 1)
+        self.assertIn("?q=%EC%82%BC%EC%84%B1&", self.urls[0])
+        items = [{"title": "삼성전자 반도체 수출", "link": "https://a.com/n/1",
+                  "tokens": ("삼성전자", "반도체", "수출")}]
+        self.assertEqual(results, [(items, False)] * 4)
+        self.assertEqual(again, (items, False))
+        stats = self.cache.stats()
+        self.assertEqual((stats["misses"], stats["shared"], stats["hits"]), (1, 3, 1))
+        self.assertEqual(self._delta(before), {"ok": 5})
+
+    async def test_entries_expire_after_ttl(self):
+        with mock.patch.object(views, "_google_news_upstream", self._upstream):
+            await self._live("반도체")
+            self.clock.now += views.LIVE_CACHE_TTL - 1
+            await self._live("반도체")
+            self.assertEqual(len(self.urls), 1)
+            self.clock.now += 1
+            await self._live("반도체")
+        self.assertEqual(len(self.urls), 2)
+
+    async def test_failed_upstream_is_not_cached(self):
+        before = self._counts()
+        self.error = httpx.ConnectError("down")
+        with mock.patch.object(views, "_google_news_upstream", self._upstream):
+            self.assertEqual(await self._live("금리"), ([], True))
+            self.error = None
+            items, partial = await self._live("금리")
+        self.assertFalse(partial)
+        self.assertEqual(len(items), 1)
+        self.assertEqual(len(self.urls), 2)
+        self.assertEqual(self._delta(before), {"error": 1, "ok": 1})
+
+    async def test_timeout_returns_partial_and_keeps_fetching(self):
+        before = self._counts()
+        self.gate = asyncio.Event()
+        with mock.patch.object(views, "_google_news_upstream", self._upstream), \
+                mock.patch.object(views, "LIVE_TIMEOUT", 0.01):
+            self.assertEqual(await self._live("환율"), ([], True))
+            self.gate.set()
+            for _ in range(100):  # shield 로 계속 진행한 조회가 캐시에 들어갈 때까지
+                if self.cache.stats()["size"]:
+                    break
+                await asyncio.sleep(0.01)
+            items, partial = await self._live("환율")
+        self.assertFalse(partial)
+        self.assertEqual(len(items), 1)
+        self.assertEqual(len(self.urls), 1)
+        self.assertEqual(self._delta(before), {"timeout": 1, "ok": 1})
+
+
+def _rss(*titles):
+    items = "".join(f"<item><title>{t}</title><link>https://a.com/{i}</link></item>" for i, t in enumerate(titles))
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'.encode()
+
+
+class FetcherTests(SimpleTestCase):
+    """iter_feeds: httpx.MockTransport 로 업스트림 대신 응답 (핸들러는 수집 스레드의 이벤트 루프에서 실행)"""
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.requests = []   # (host, 요청 시각)
+        self.active = self.peak = 0
+        self.cancelled = 0
+        self.delay = {}      # path -> 응답 지연(초)
+
+    async def _handler(self, request):
+        with self.lock:
+            self.requests.append((request.url.host, time.monotonic()))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay.get(request.url.path, 0.05))
+        except asyncio.CancelledError:
+            with self.lock:
+                self.cancelled += 1
+            raise
+        finally:
+            with self.lock:
+                self.active -= 1
+        if request.url.path == "/etag":
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"ETag": '"v1"'}, content=_rss("etag"))
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, content=_rss(request.url.host, "둘째"))
+
+    def _feeds(self, urls, **kw):
+        kw.setdefault("host_interval", 0)
+        return {r.url: r for r in iter_feeds(urls, transport=httpx.MockTransport(self._handler), **kw)}
+
+    def test_concurrency(self):
+        urls = [f"http://h{i}.test/feed" for i in range(8)]
+        results = self._feeds(urls, concurrency=4)
+        self.assertEqual(sorted(results), sorted(urls))
+        self.assertTrue(all(len(r.entries) == 2 and not r.error for r in results.values()))
+        self.assertEqual(self.peak, 4)
+
+        self.peak = 0
+        self._feeds(urls[:3], concurrency=1)
+        self.assertEqual(self.peak, 1)
+
+    def test_per_host_interval(self):
+        urls = [f"http://same.test/feed?n={i}" for i in range(3)] + ["http://other.test/feed"]
+        self.delay = {"/feed": 0}
+        self._feeds(urls, concurrency=4, host_interval=0.1)
+        same = sorted(t for host, t in self.requests if host == "same.test")
+        self.assertEqual(len(same), 3)
+        for a, b in zip(same, same[1:]):
+            self.assertGreaterEqual(b - a, 0.09)
+        # 다른 호스트는 같은 호스트의 간격을 기다리지 않는다
+        other = next(t for host, t in self.requests if host == "other.test")
+        self.assertLess(other - same[0], 0.09)
+
+    def test_conditional_requests(self):
+        url = "http://h.test/etag"
+        first = self._feeds([url])[url]
+        self.assertEqual((first.status, first.etag, first.unchanged), (200, '"v1"', False))
+        self.assertEqual(len(first.entries), 1)
+
+        state = {"etag": first.etag, "content_hash": first.content_hash}
+        again = self._feeds([url], states={url: state})[url]
+        self.assertEqual((again.status, again.unchanged, again.entries), (304, True, []))
+        self.assertEqual((again.etag, again.content_hash), (first.etag, first.content_hash))
+
+        # ETag 없이 본문 해시만 같아도 파싱하지 않는다
+        plain = "http://h.test/feed"
+        body = self._feeds([plain])[plain]
+        same = self._feeds([plain], states={plain: {"content_hash": body.content_hash}})[plain]
+        self.assertEqual((same.status, same.unchanged, same.entries, same.parse_time), (200, True, [], 0.0))
+
+    def test_bad_feeds_are_reported_per_feed(self):
+        urls = ["http://[bad/feed", "http://h.test/fe\x00ed", "http://h.test/missing", "http://ok.test/feed"]
+        results = self._feeds(urls, concurrency=2)
+        self.assertEqual(sorted(results), sorted(urls))
+        self.assertTrue(results["http://[bad/feed"].error.startswith("ValueError"))
+        self.assertTrue(results["http://h.test/fe\x00ed"].error.startswith("InvalidURL"))
+        self.assertEqual(results["http://h.test/missing"].error, "HTTP 404")
+        self.assertEqual((results["http://ok.test/feed"].error, len(results["http://ok.test/feed"].entries)), ("", 2))
+
+    def test_close_cancels_in_flight_fetches(self):
+        self.delay = {"/slow": 30}
+        urls = ["http://fast.test/feed", "http://a.test/slow", "http://b.test/slow"]
+        t0 = time.monotonic()
+        results = iter_feeds(urls, transport=httpx.MockTransport(self._handler), host_interval=0, concurrency=4)
+        self.assertEqual(next(results).url, "http://fast.test/feed")
+        results.close()
+        self.assertLess(time.monotonic() - t0, 5)
+        self.assertEqual((self.cancelled, self.active), (2, 0))
@@ -0,0 +1,43 @@
+# CrawlerApp/tokenizer.py
+"""
+기사 제목 토크나이저 (views / crawl_news / rollups 공용)
+
+- 한글/영문/숫자 2글자 이상 + 소문자 + 불용어 제거
+- 정규식은 한 번만 컴파일, 같은 제목은 LRU 메모이즈 (RSS 피드마다 같은 제목이 반복됨)
+- DB 저장 형태: extracted_words = 토큰을 공백으로 이은 문자열 (join_tokens / split_tokens)
+  → api_topwords 는 제목을 다시 토큰화하지 않고 저장된 토큰을 그대로 읽는다
+"""
+from collections import Counter
+from functools import lru_cache
+import re
+
+TOKEN_RE = re.compile(r"[가-힣A-Za-z0-9]{2,}")
+
+STOPWORDS = frozenset({
+    "기사", "사진", "영상", "단독", "속보", "전체", "보기",
+    "또", "그리고", "그러나", "하지만",
+})
+
+
+@lru_cache(maxsize=65536)
+def tokenize(title: str) -> tuple:
+    """제목 → 토큰 튜플 (캐시를 공유하므로 불변 튜플로 돌려준다)"""
+    return tuple(w for w in TOKEN_RE.findall(title.lower()) if w not in STOPWORDS)
+
+
+def tokenize_text(text: str) -> list:
+    """기사 본문처럼 긴 텍스트용 (같은 글이 반복되지 않으니 캐시하지 않음)"""
+    return [w for w in TOKEN_RE.findall(text.lower()) if w not in STOPWORDS]
+
+
+def pick_top_word(title: str) -> str:
+    c = Counter(tokenize(title))
+    return c.most_common(1)[0][0] if c else ""
+
+
+def join_tokens(tokens) -> str:
+    return " ".join(tokens)
+
+
+def split_tokens(extracted_words: str) -> list:
+    return (extracted_words or "").split()
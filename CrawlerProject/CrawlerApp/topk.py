@@ -0,0 +1,160 @@
+# CrawlerApp/topk.py
+"""
+상위 단어 스트리밍 요약 (Space-Saving, Metwally et al. 2005)
+
+- 종류(WordDailyCount.TOP / TOKEN) × 구간("all" 전체, "YYYY-MM" 월)마다 카운터 TOPK_CAPACITY(m)개만 유지
+  → 기사 수와 상관없이 메모리/저장 크기 일정, 상위 20개는 저장된 순서대로 앞에서 읽기만 하면 된다
+- ingest 단계에서 롤업(WordDailyCount)과 같은 트랜잭션으로 갱신 (rollups.add_articles)
+  기존 데이터는 `python manage.py rebuild_wordcounts` 가 롤업과 같이 다시 만든다
+- 오차 (N = 그 구간에 들어온 단어 수 합, 가중치 포함)
+  * 추정값은 실제 빈도보다 작지 않고, 넘치는 양은 단어별 error 이하 ≤ min 카운터 ≤ N/m
+  * 실제 빈도가 N/m 보다 큰 단어는 반드시 들어 있다
+  * count - error 가 (k+1)번째 count 이상이면 그 단어는 확실히 상위 k 안 (guaranteed)
+- 저장 형식: 카운트 순으로 정렬한 count/error (uint64 배열) + 단어 ("\\0" 구분 UTF-8), zlib 압축
+"""
+import heapq
+import struct
+import zlib
+from collections import defaultdict
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+from .models import WordDailyCount, WordTopK
+
+ALL = "all"
+_HEADER = struct.Struct("<II")  # 카운터 수, 단어 영역 길이
+
+
+def month_window(day):
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+def resolve_window(window):
+    """'month' → 이번 달 ('YYYY-MM'), 'all' / 'YYYY-MM' 은 그대로"""
+    return month_window(timezone.localdate()) if window == "month" else window
+
+
+class SpaceSaving:
+    """가중치 있는 Space-Saving: 카운트 합은 항상 total 과 같다"""
+
+    def __init__(self, capacity, total=0):
+        self.capacity = capacity
+        self.total = total
+        self.counts = {}  # 단어 -> 추정 빈도 (실제 이상)
+        self.errors = {}  # 단어 -> 최대 과대 추정량
+
+    def __len__(self):
+        return len(self.counts)
+
+    @property
+    def error_bound(self):
+        """어떤 단어든 추정값 - 실제값 ≤ 이 값"""
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def update(self, items):
+        """items: (단어, 가중치) 이터러블. 큰 가중치부터 넣으면 정확도가 조금 낫다"""
+        counts, errors = self.counts, self.errors
+        # 최소 카운터 찾기용 힙: 단어마다 항목 하나, 값이 늘어난 단어는 꺼낼 때 다시 넣는다 (지연 갱신)
+        heap = [(c, w) for w, c in counts.items()]
+        heapq.heapify(heap)
+        for word, n in items:
+            self.total += n
+            if word in counts:
+                counts[word] += n
+            elif len(counts) < self.capacity:
+                counts[word], errors[word] = n, 0
+                heapq.heappush(heap, (n, word))
+            else:
+                while True:
+                    c, w = heap[0]
+                    if counts[w] == c:
+                        break
+                    heapq.heapreplace(heap, (counts[w], w))
+                heapq.heapreplace(heap, (c + n, word))
+                del counts[w], errors[w]
+                counts[word], errors[word] = c + n, c
+
+    def top(self, n=20):
+        """[(단어, 추정 빈도, error), ...] 추정 빈도 내림차순"""
+        ranked = sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
+        return [(w, c, self.errors[w]) for w, c in ranked]
+
+    def guaranteed(self, k=20):
+        """상위 k 안에 드는 것이 확실한 단어 수 (앞에서부터)"""
+        ranked = self.top(k + 1)
+        cutoff = ranked[k][1] if len(ranked) > k else 0
+        n = 0
+        for _, c, e in ranked[:k]:
+            if c - e < cutoff:
+                break
+            n += 1
+        return n
+
+    def to_bytes(self):
+        ranked = self.top(len(self.counts))
+        words = "\0".join(w for w, _, _ in ranked).encode("utf-8")
+        counts = np.array([c for _, c, _ in ranked], dtype="<u8")
+        errors = np.array([e for _, _, e in ranked], dtype="<u8")
+        return zlib.compress(_HEADER.pack(len(ranked), len(words)) + counts.tobytes() + errors.tobytes() + words)
+
+    @classmethod
+    def from_bytes(cls, data, capacity, total):
+        sk = cls(capacity, total)
+        for w, c, e in _decode(data):
+            sk.counts[w], sk.errors[w] = c, e
+        return sk
+
+
+def _decode(data, n=None):
+    """저장 형식 → [(단어, count, error), ...] (n 이 있으면 앞에서 n개만)"""
+    raw = zlib.decompress(bytes(data))
+    size, nwords = _HEADER.unpack_from(raw)
+    off = _HEADER.size
+    counts = np.frombuffer(raw, dtype="<u8", count=size, offset=off)
+    errors = np.frombuffer(raw, dtype="<u8", count=size, offset=off + 8 * size)
+    words_raw = raw[off + 16 * size:off + 16 * size + nwords]
+    k = size if n is None else min(n, size)
+    if not k:
+        return []
+    words = words_raw.split(b"\0", k)[:k] if k < size else words_raw.split(b"\0")
+    return [(w.decode("utf-8"), int(c), int(e)) for w, c, e in zip(words, counts[:k], errors[:k])]
+
+
+def add_counts(counts):
+    """
+    롤업 카운트 Counter{(kind, day, word): n} → 해당 종류의 "all" + 월 요약에 반영
+    (호출 측 트랜잭션 안에서 읽고-고치고-쓴다. SQLite IMMEDIATE 트랜잭션이라 동시 적재와 섞이지 않음)
+    """
+    if not counts:
+        return
+    groups = defaultdict(lambda: defaultdict(int))
+    for (kind, day, word), n in counts.items():
+        groups[(kind, ALL)][word] += n
+        groups[(kind, month_window(day))][word] += n
+    capacity = settings.TOPK_CAPACITY
+    for (kind, window), weights in groups.items():
+        row = WordTopK.objects.filter(kind=kind, window=window).first()
+        if row is None:
+            row = WordTopK(kind=kind, window=window, capacity=capacity)
+            sk = SpaceSaving(capacity)
+        else:
+            sk = SpaceSaving.from_bytes(row.data, row.capacity, row.total)
+        sk.update(sorted(weights.items(), key=lambda kv: -kv[1]))
+        row.total, row.data, row.updated_at = sk.total, sk.to_bytes(), timezone.now()
+        row.save()
+
+
+def load(window, kind=WordDailyCount.TOP):
+    row = WordTopK.objects.filter(kind=kind, window=resolve_window(window)).first()
+    return SpaceSaving.from_bytes(row.data, row.capacity, row.total) if row else None
+
+
+def top_words(window, kind=WordDailyCount.TOP, n=20):
+    """구간 요약의 상위 n개 [(word, cnt), ...]. 요약이 없으면 None (호출 측에서 정확한 롤업으로)"""
+    data = (WordTopK.objects.filter(kind=kind, window=resolve_window(window))
+            .values_list("data", flat=True).first())
+    if data is None:
+        return None
+    return [(w, c) for w, c, _ in _decode(data, n)]
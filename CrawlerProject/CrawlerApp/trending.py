@@ -0,0 +1,120 @@
+# CrawlerApp/trending.py
+"""
+급상승 단어 (시간 버킷 기반 burst 점수)
+
+- ingest 단계에서 제목 토큰을 시간(UTC) 버킷별로 센다 (WordHourlyCount, rollups.add_articles 에서 같이 갱신)
+- compute() : 최근 TRENDING_RECENT_HOURS 시간 vs 그 앞 TRENDING_BASELINE_DAYS 일의 시간당 평균/분산
+  단어별 합계는 SQL GROUP BY 한 번, 점수는 NumPy 로 전체 단어를 한 번에 계산 → TrendingWord 에 순위대로 저장
+  /api/trending 은 그 테이블만 읽는다 (기사 스캔 없음)
+- 점수 (R = 최근 시간 수, B = 기준 시간 수, 기준 구간에서 안 나온 시간은 0으로 침)
+    μ = 기준 합 / B, σ² = 기준 제곱합 / B - μ²
+    expected = μ·R
+    z     = (recent - expected) / sqrt(R·max(σ², μ) + 1)   (포아송 하한 + 1: 기준이 0인 새 단어가 무한대로 튀지 않게)
+    ratio = (recent + 1) / (expected + 1)
+  늘 많이 나오는 단어(나라/회사 이름)는 expected 가 커서 z 가 낮고, 평소보다 몰린 단어만 위로 올라온다
+- 기준 구간보다 오래된 버킷은 compute() 때 지운다
+"""
+import time
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import TrendingWord, WordHourlyCount
+from .tokenizer import tokenize
+
+
+def hour_of(dt):
+    """datetime → 유닉스 시간 기준 시(hour) 번호 (UTC)"""
+    return int(dt.timestamp()) // 3600
+
+
+def _window(now):
+    """→ (기준 구간 시작 hour, 최근 구간 시작 hour, 현재 hour)"""
+    end = hour_of(now)
+    recent = end - settings.TRENDING_RECENT_HOURS + 1
+    return recent - settings.TRENDING_BASELINE_DAYS * 24, recent, end
+
+
+def count_articles(articles, since=None) -> Counter:
+    """NewsArticle 목록 → Counter{(hour, word): n}. since(hour 번호)보다 오래된 기사는 뺀다"""
+    c = Counter()
+    for a in articles:
+        hour = hour_of(a.created_at)
+        if since is not None and hour < since:
+            continue
+        for tok in set(tokenize(a.title)):  # 기사당 한 번 (제목에 두 번 나와도 1)
+            c[(hour, tok)] += 1
+    return c
+
+
+def add_articles(articles):
+    counts = count_articles(articles, since=_window(timezone.now())[0])
+    if not counts:
+        return
+    table = connection.ops.quote_name(WordHourlyCount._meta.db_table)
+    sql = (f'INSERT INTO {table} ("hour", "word", "count") VALUES (%s, %s, %s) '
+           f'ON CONFLICT ("hour", "word") DO UPDATE SET "count" = "count" + excluded."count"')
+    with connection.cursor() as c:
+        c.executemany(sql, [(h, w, n) for (h, w), n in counts.items()])
+
+
+def load_stats(start, recent, end):
+    """
+    → (단어 목록, 최근 합, 기준 합, 기준 제곱합) — 단어별 집계는 DB 에서
+    end(현재 hour) 이후 버킷(미래 날짜로 들어온 기사)은 최근 합에 넣지 않는다
+    """
+    table = connection.ops.quote_name(WordHourlyCount._meta.db_table)
+    sql = (f'SELECT "word", '
+           f'SUM(CASE WHEN "hour" >= %s THEN "count" ELSE 0 END), '
+           f'SUM(CASE WHEN "hour" < %s THEN "count" ELSE 0 END), '
+           f'SUM(CASE WHEN "hour" < %s THEN "count" * "count" ELSE 0 END) '
+           f'FROM {table} WHERE "hour" >= %s AND "hour" <= %s GROUP BY "word"')
+    with connection.cursor() as c:
+        c.execute(sql, [recent, recent, recent, start, end])
+        rows = c.fetchall()
+    if not rows:
+        return [], np.zeros(0), np.zeros(0), np.zeros(0)
+    words, rec, s1, s2 = zip(*rows)
+    return list(words), np.array(rec, dtype=np.float64), np.array(s1, dtype=np.float64), np.array(s2, dtype=np.float64)
+
+
+def scores(recent, base_sum, base_sumsq, recent_hours, base_hours):
+    """단어별 배열 → (z, ratio, expected) 배열 (모든 단어 한 번에)"""
+    mu = base_sum / base_hours
+    var = np.maximum(base_sumsq / base_hours - mu * mu, 0.0)
+    expected = mu * recent_hours
+    z = (recent - expected) / np.sqrt(recent_hours * np.maximum(var, mu) + 1.0)
+    ratio = (recent + 1.0) / (expected + 1.0)
+    return z, ratio, expected
+
+
+def rank(z, recent, min_count, top):
+    """z 내림차순 상위 top 개의 인덱스 (최근 min_count 번 이상, z > 0 인 단어만)"""
+    idx = np.flatnonzero((recent >= min_count) & (z > 0))
+    if len(idx) > top:
+        idx = idx[np.argpartition(-z[idx], top - 1)[:top]]
+    return idx[np.argsort(-z[idx], kind="stable")]
+
+
+def compute(now=None):
+    """급상승 단어를 다시 계산해서 TrendingWord 를 교체 → 통계 dict"""
+    now = now or timezone.now()
+    t0 = time.perf_counter()
+    start, recent_start, end = _window(now)
+    words, recent, s1, s2 = load_stats(start, recent_start, end)
+    t1 = time.perf_counter()
+    z, ratio, expected = scores(recent, s1, s2, end - recent_start + 1, recent_start - start)
+    top = rank(z, recent, settings.TRENDING_MIN_COUNT, settings.TRENDING_TOP)
+    t2 = time.perf_counter()
+    rows = [TrendingWord(rank=i + 1, word=words[j], score=float(z[j]), ratio=float(ratio[j]),
+                         recent=int(recent[j]), expected=float(expected[j]), computed_at=now)
+            for i, j in enumerate(top)]
+    with transaction.atomic():
+        TrendingWord.objects.all().delete()
+        TrendingWord.objects.bulk_create(rows)
+        pruned = WordHourlyCount.objects.filter(hour__lt=start).delete()[0]
+    return {"terms": len(words), "trending": len(rows), "pruned": pruned,
+            "load_s": t1 - t0, "score_s": t2 - t1, "total_s": time.perf_counter() - t0}
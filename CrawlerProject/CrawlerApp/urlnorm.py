@@ -0,0 +1,112 @@
+# CrawlerApp/urlnorm.py
+"""
+기사 링크 정규화 (ingest / crawl_news / 실시간 Google News 조회 공용)
+
+- Google 리다이렉트(google.com/url?q=..., news.google.com/...?url=...)는 원래 주소로 풀고
+  news.google.com/rss/articles/CBMi... 는 ID(base64 protobuf) 안에 원문 주소가 들어 있으면 꺼낸다
+  (새 형식 ID 는 주소가 암호화돼 있어서 Google 주소 그대로 둔다)
+- utm_* / fbclid / gclid 등 추적용 파라미터 제거, 남은 파라미터는 이름순 정렬
+- scheme/host 소문자, 기본 포트 제거, fragment 제거, 끝 슬래시 제거(루트 제외)
+- 같은 기사면 같은 문자열 → link UNIQUE 인덱스와 링크 Bloom 필터(CrawlerApp.linkfilter)의 키
+"""
+import base64
+import binascii
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "gclsrc", "dclid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "ocid", "cmpid", "ref_src",
+})
+TRACKING_PREFIXES = ("utm_",)
+# news.google.com 링크에만 붙는 추적 파라미터
+GOOGLE_NEWS_PARAMS = frozenset({"oc", "hl", "gl", "ceid"})
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+_GOOGLE_ARTICLE_RE = re.compile(r"/articles/([A-Za-z0-9_-]+)")
+_MAX_UNWRAP = 3
+
+
+def _is_google(host):
+    return host == "google.com" or host.startswith("google.") or ".google." in host or host.endswith(".google.com")
+
+
+def _decode_google_news_id(token):
+    """CBMi... 형식 ID → 원문 주소 (필드 4 문자열), 없으면 None"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (binascii.Error, ValueError):
+        return None
+    i = raw.find(b"\x22")  # 필드 4, 길이 구분 타입
+    if i < 0:
+        return None
+    length, shift, i = 0, 0, i + 1
+    while i < len(raw):  # varint 길이
+        b = raw[i]
+        length |= (b & 0x7F) << shift
+        shift += 7
+        i += 1
+        if not b & 0x80:
+            break
+    url = raw[i:i + length]
+    if len(url) != length or not url.startswith((b"http://", b"https://")):
+        return None
+    try:
+        return url.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _unwrap(parts, host):
+    """리다이렉트 주소면 원래 주소, 아니면 None"""
+    if not _is_google(host):
+        return None
+    params = dict(parse_qsl(parts.query))
+    for name in ("url", "q"):
+        target = params.get(name, "")
+        if target.startswith(("http://", "https://")):
+            return target
+    if host == "news.google.com":
+        m = _GOOGLE_ARTICLE_RE.search(parts.path)
+        if m:
+            return _decode_google_news_id(m.group(1))
+    return None
+
+
+def canonical_url(url: str) -> str:
+    """링크 → 정규화한 링크. http(s) 주소가 아니면 앞뒤 공백만 뗀다"""
+    url = (url or "").strip()
+    # 리다이렉트는 _MAX_UNWRAP 번까지만 풀고, 마지막으로 얻은 주소는 풀지 않고 그대로 정규화
+    for depth in range(_MAX_UNWRAP + 1):
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS or not parts.hostname:
+            return url
+        host = parts.hostname.rstrip(".")
+        target = _unwrap(parts, host) if depth < _MAX_UNWRAP else None
+        if not target:
+            break
+        url = target.strip()
+
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or str(port) == DEFAULT_PORTS[scheme] else f"{host}:{port}"
+    if parts.username is not None:
+        netloc = parts.netloc.rpartition("@")[0] + "@" + netloc
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    google_news = host == "news.google.com"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+        and not (google_news and k in GOOGLE_NEWS_PARAMS)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
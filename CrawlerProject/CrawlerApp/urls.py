@@ -3,5 +3,10 @@ from . import views
 urlpatterns = [
     path('', views.index, name='index'),
     path('api/articles', views.api_articles, name='api_articles'),
+    path('api/articles/export', views.api_articles_export, name='api_articles_export'),
     path('api/topwords', views.api_topwords, name='api_topwords'),
+    path('api/wordcloud', views.api_wordcloud, name='api_wordcloud'),
+    path('api/live-cache', views.api_live_cache_stats, name='api_live_cache_stats'),
+    path('api/trending', views.api_trending, name='api_trending'),
+    path('metrics', views.metrics_text, name='metrics'),
 ]
\ No newline at end of file
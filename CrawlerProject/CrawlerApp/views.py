@@ -2,24 +2,52 @@
 from datetime import timedelta
 from collections import Counter
 from urllib.parse import quote_plus
-import re
+import asyncio
+import json
+import ssl
+import weakref
+import certifi
 import feedparser
+import httpx
 
-from django.db.models import Q, Count
-from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.utils import timezone
 
-from .models import NewsArticle
+from . import clouds, metrics
+from .cache import TTLCache
+from .ingest import ingest_articles
+from . import rollups, topk
+from .models import NewsArticle, TrendingWord, WordDailyCount
+from .pagination import ORDERING, InvalidCursor, after_cursor, next_cursor
+from .search import filter_matching, ranked_titles
+from .tokenizer import join_tokens, pick_top_word, split_tokens, tokenize
+from .urlnorm import canonical_url
 
 # 초기 화면용 "최근 N일" 기준
 RECENT_DAYS = 3
 
-# -------------------- helpers --------------------
-STOPWORDS = {
-    "기사","사진","영상","단독","속보","전체","보기","그리고","그러나","하지만",
-}
+# 실시간 Google News 조회 캐시: 검색어당 최대 LIVE_FETCH_LIMIT건을 LIVE_CACHE_TTL초 보관
+LIVE_FETCH_LIMIT = 100
+LIVE_CACHE_TTL = 300
+# 실시간 조회 최대 대기 시간(초). 넘기면 로컬 DB 결과만 응답
+LIVE_TIMEOUT = 3.0
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+# NDJSON 내보내기 때 DB에서 한 번에 읽는 행 수
+EXPORT_CHUNK = 2000
+_live_cache = TTLCache(maxsize=256, ttl=LIVE_CACHE_TTL)
 
+# 워드클라우드 최대 크기(px)와 브라우저 캐시 시간(초). 데이터가 바뀌면 ETag 가 바뀐다
+WORDCLOUD_MAX_SIZE = 2000
+WORDCLOUD_MAX_AGE = 60
+
+# -------------------- helpers --------------------
 def _expand_terms(q: str):
     ql = (q or "").strip().lower()
     if not ql:
@@ -38,30 +66,93 @@ def _expand_terms(q: str):
             terms.update(vals)
     return list(terms)
 
-def _tokenize(title: str):
-    # 한글/영문/숫자 2글자 이상 토큰화 + 소문자 + 불용어 제거
-    toks = [w.lower() for w in re.findall(r"[가-힣A-Za-z0-9]{2,}", title)]
-    return [w for w in toks if w not in STOPWORDS]
+def _normalize_query(q: str) -> str:
+    return " ".join((q or "").lower().split())
 
-def _pick_top_word(title: str):
-    c = Counter(_tokenize(title))
-    return c.most_common(1)[0][0] if c else ""
+# 이벤트 루프별 공유 HTTP 클라이언트 (ASGI 에서는 루프 하나 → 커넥션 풀 재사용,
+# 클라이언트 생성 자체가 SSL 컨텍스트 로딩 때문에 수십 ms 걸린다)
+# WSGI 에서는 async_to_sync 가 요청마다 asyncio.run 으로 새 루프를 만들므로, 루프가 끝날 때 닫아야 한다
+_http_clients = weakref.WeakKeyDictionary()  # 루프 -> (클라이언트, _client_lifetime 제너레이터)
 
-def _fetch_live_from_google_news(q: str, limit: int = 50):
-    """
-    검색 키워드로 Google News RSS를 즉시 조회해서
-    [{'title':..., 'link':..., 'tokens':[...]}] 리스트를 반환
-    """
-    url = f"https://news.google.com/rss/search?q={quote_plus(q)}&hl=ko&gl=KR&ceid=KR:ko"
-    d = feedparser.parse(url)
+async def _client_lifetime(client):
+    """루프 종료 때(loop.shutdown_asyncgens → aclose) finally 에서 클라이언트를 닫는다"""
+    try:
+        yield client
+    finally:
+        # 제너레이터의 finalizer 가 루프를 참조하므로 약한 키라도 직접 지워야 루프가 해제된다
+        _http_clients.pop(asyncio.get_running_loop(), None)
+        await client.aclose()
+
+async def _http_client():
+    loop = asyncio.get_running_loop()
+    entry = _http_clients.get(loop)
+    if entry is None:
+        client = httpx.AsyncClient(
+            timeout=LIVE_TIMEOUT, follow_redirects=True, verify=_SSL_CONTEXT,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        # 루프는 async generator 를 약하게만 들고 있으므로 dict 에 같이 보관
+        entry = _http_clients[loop] = (client, _client_lifetime(client))
+        await entry[1].__anext__()  # 첫 반복에서 루프에 등록됨
+    return entry[0]
+
+async def _google_news_upstream(url: str):
+    """실제 업스트림 호출 (테스트에서는 이 코루틴 함수를 mock)"""
+    with metrics.span("upstream"):
+        r = await (await _http_client()).get(url)
+        r.raise_for_status()
+    # 파싱은 이벤트 루프 밖에서
+    with metrics.span("parse"):
+        return await asyncio.to_thread(feedparser.parse, r.content)
+
+async def _fetch_google_news_items(q: str):
+    url = f"{settings.GOOGLE_NEWS_RSS_URL}?q={quote_plus(q)}&hl=ko&gl=KR&ceid=KR:ko"
+    d = await _google_news_upstream(url)
     items = []
-    for e in (d.entries or [])[:limit]:
+    for e in (d.entries or [])[:LIVE_FETCH_LIMIT]:
         title = getattr(e, "title", "").strip()
-        link = getattr(e, "link", "").strip()
+        link = canonical_url(getattr(e, "link", ""))  # Google News 리다이렉트 → 원문 주소
         if not title or not link:
             continue
-        items.append({"title": title, "link": link, "tokens": _tokenize(title)})
+        items.append({"title": title, "link": link})
+    with metrics.span("tokenize"):
+        for item in items:
+            item["tokens"] = tokenize(item["title"])
     return items
+
+async def _fetch_live_from_google_news(q: str, limit: int = 50):
+    """
+    검색 키워드로 Google News RSS를 즉시 조회해서
+    ([{'title':..., 'link':..., 'tokens':[...]}], partial) 을 반환
+    - 정규화한 검색어 기준 TTL 캐시, 동시에 들어온 같은 검색어는 업스트림 1회만 호출
+    - LIVE_TIMEOUT 안에 못 받으면 ([], True): 호출 측은 로컬 DB 결과만으로 응답
+      (업스트림 요청은 shield 로 계속 진행되어 다음 요청 때 캐시에 남는다)
+    - 캐시된 리스트를 공유하므로 호출 측에서 수정하지 말 것
+    """
+    key = _normalize_query(q)
+    task = asyncio.ensure_future(
+        _live_cache.aget_or_fetch(key, lambda: _fetch_google_news_items(key))
+    )
+    # 타임아웃 뒤에 끝난 작업의 예외가 "never retrieved" 경고로 남지 않도록
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    try:
+        items = await asyncio.wait_for(asyncio.shield(task), LIVE_TIMEOUT)
+    except asyncio.TimeoutError:
+        metrics.LIVE_FETCHES.inc("timeout")
+        return [], True
+    except (httpx.HTTPError, RuntimeError):
+        metrics.LIVE_FETCHES.inc("error")
+        return [], True
+    metrics.LIVE_FETCHES.inc("ok")
+    return items[:limit], False
+
+def _json(data, partial=False, next_cursor=None):
+    resp = JsonResponse(data, safe=False)
+    if partial:
+        resp["X-Live-Partial"] = "1"
+    if next_cursor:
+        resp["X-Next-Cursor"] = next_cursor
+    return resp
 # -------------------------------------------------
 
 
@@ -71,37 +162,39 @@ def index(request):
 
     articles = (
         NewsArticle.objects
-        .filter(Q(created_at__gte=since) | Q(created_at__isnull=True))
+        .filter(created_at__gte=since)
         .order_by("-created_at", "-id")[:20]
     )
 
-    top20 = (
-        NewsArticle.objects
-        .filter(Q(created_at__gte=since) | Q(created_at__isnull=True))
-        .values("top_words")
-        .annotate(cnt=Count("id"))
-        .order_by("-cnt")[:20]
-    )
+    # 일자별 롤업 버킷 합산 (rebuild_wordcounts / ingest 단계에서 유지)
+    top20 = [{"top_words": w, "cnt": n} for w, n in rollups.top_words(RECENT_DAYS)]
 
     return render(request, "index.html", {"articles": articles, "top20": top20})
 
 
-def api_articles(request):
+async def api_articles(request):
     """
-    기사 리스트 API
+    기사 리스트 API (async: 실시간 조회 중에도 워커를 붙잡지 않음)
     - q 없음: 최근 N일 로컬 DB에서 최신 20
+    - cursor: 이전 응답의 X-Next-Cursor 헤더 값 → 그 다음 페이지 (키셋, OFFSET 없음)
     - q 있음: (1) 로컬 DB 전체에서 매칭 + (2) Google News RSS 실시간 조회
               → 링크로 중복 제거 후 최신순 상위 N개 반환
               → 동시에 DB에 없는 실시간 결과는 INSERT(옵션)해 DB도 최신화
+              → 실시간 조회가 LIVE_TIMEOUT을 넘기면 로컬 결과만 + X-Live-Partial: 1
     """
     q = (request.GET.get("q") or "").strip()
     try:
         limit = int(request.GET.get("limit", 20))
     except ValueError:
         limit = 20
+    cursor = request.GET.get("cursor") or ""
 
-    # 1) 기본 쿼리셋
-    qs = NewsArticle.objects.all()
+    # 1) 기본 쿼리셋 (cursor 가 있으면 그 다음 행부터)
+    try:
+        qs = after_cursor(NewsArticle.objects.all(), cursor)
+    except InvalidCursor:
+        return JsonResponse({"error": "invalid cursor"}, status=400)
+    fields = ("id", "title", "link", "created_at")
 
     results = []
     seen_links = set()
@@ -109,97 +202,206 @@ def api_articles(request):
     if not q:
         # 초기: 최근 N일만
         since = timezone.now() - timedelta(days=RECENT_DAYS)
-        qs = qs.filter(Q(created_at__gte=since) | Q(created_at__isnull=True))
-        for row in qs.order_by("-created_at", "-id")[:limit].values("title", "link"):
+        qs = qs.filter(created_at__gte=since)
+        rows = [row async for row in qs.order_by(*ORDERING)[:limit+1].values(*fields)]
+        for row in rows[:limit]:
             results.append({"title": row["title"], "link": row["link"]})
-        return JsonResponse(results, safe=False)
+        return _json(results, next_cursor=next_cursor(rows, limit))
 
-    # q가 있을 때 → DB에서 먼저 긁고
+    # q가 있을 때 → DB에서 먼저 긁고 (FTS5 색인, 없으면 LIKE)
     terms = _expand_terms(q)
-    cond = Q()
-    for t in terms:
-        cond |= (Q(title__icontains=t) |
-                 Q(extracted_words__icontains=t) |
-                 Q(top_words__icontains=t))
-    for row in qs.filter(cond).order_by("-created_at", "-id")[:limit*2].values("title", "link"):
+    matched = await sync_to_async(filter_matching)(qs, terms)  # FTS 테이블 확인이 동기 DB 호출
+    rows = [row async for row in matched.order_by(*ORDERING)[:limit+1].values(*fields)]
+    for row in rows[:limit]:
         if row["link"] not in seen_links:
             seen_links.add(row["link"])
             results.append({"title": row["title"], "link": row["link"]})
 
-    # 부족하면 실시간으로 보강
-    if len(results) < limit:
-        live = _fetch_live_from_google_news(q, limit=limit*2)
+    # 부족하면 실시간으로 보강 (첫 페이지에서만)
+    partial = False
+    if len(results) < limit and not cursor:
+        live, partial = await _fetch_live_from_google_news(q, limit=limit*2)
         now = timezone.now()
+        new_rows = []
         for item in live:
             if item["link"] in seen_links:
                 continue
             seen_links.add(item["link"])
             results.append({"title": item["title"], "link": item["link"]})
+            new_rows.append({
+                "title": item["title"],
+                "link": item["link"],
+                "extracted_words": join_tokens(item["tokens"]),
+                "top_words": pick_top_word(item["title"]),
+                "created_at": now,
+            })
 
-            # (옵션) DB에 즉시 반영해서 다음 검색/초기화 때도 최신 유지
-            try:
-                NewsArticle.objects.create(
-                    title=item["title"],
-                    link=item["link"],
-                    extracted_words=" ".join(item["tokens"]),
-                    top_words=_pick_top_word(item["title"]),
-                    created_at=now,
-                )
-            except Exception:
-                # UNIQUE 제약 등 중복일 수 있으니 조용히 스킵
-                pass
+        # (옵션) DB에 즉시 반영해서 다음 검색/초기화 때도 최신 유지
+        # 이미 있는 링크는 ingest 단계에서 IN 조회 한 번으로 걸러진다
+        try:
+            if new_rows:
+                await sync_to_async(ingest_articles)(new_rows)
+        except DatabaseError:
+            # DB 잠김 등은 검색 응답에 영향 주지 않도록 조용히 스킵
+            pass
 
     # 최신 먼저 보여주기: 방금 넣은 실시간 결과에 현재시간을 부여했으므로
-    return JsonResponse(results[:limit], safe=False)
+    return _json(results[:limit], partial, next_cursor=next_cursor(rows, limit))
+
+
+def _ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False, cls=DjangoJSONEncoder) + "\n"
 
+async def _andjson_lines(rows):
+    async for row in rows:
+        yield json.dumps(row, ensure_ascii=False, cls=DjangoJSONEncoder) + "\n"
 
-def api_topwords(request):
+def api_articles_export(request):
     """
-    상위 단어 TOP20 API
-    - q 없음: 최근 N일 로컬 DB 집계
-    - q 있음: DB 매칭 + 실시간 결과(구글 뉴스)까지 합쳐 제목 토큰으로 집계
-    - days=0 쿼리로 들어오면 날짜 제한 없이 DB를 조회
+    기사 전체 NDJSON 스트리밍 (한 줄에 기사 하나, 최신순)
+    - q: 검색 필터(api_articles 와 같은 매칭), days: 최근 N일만, cursor: 이어받기
+    - .iterator() 로 청크 단위로만 읽어서 아카이브 전체도 메모리 일정
     """
     q = (request.GET.get("q") or "").strip()
+    try:
+        days = int(request.GET.get("days", 0))
+    except ValueError:
+        days = 0
+    try:
+        qs = after_cursor(NewsArticle.objects.all(), request.GET.get("cursor") or "")
+    except InvalidCursor:
+        return JsonResponse({"error": "invalid cursor"}, status=400)
+    if q:
+        qs = filter_matching(qs, _expand_terms(q))
+    if days > 0:
+        since = timezone.now() - timedelta(days=days)
+        qs = qs.filter(created_at__gte=since)
+    rows = qs.order_by(*ORDERING).values("id", "title", "link", "top_words", "created_at")
+
+    # ASGI 에서 동기 이터레이터를 주면 Django 가 전부 list 로 모은 뒤 보내므로 async 로 준다
+    if isinstance(request, ASGIRequest):
+        stream = _andjson_lines(rows.aiterator(chunk_size=EXPORT_CHUNK))
+    else:
+        stream = _ndjson_lines(rows.iterator(chunk_size=EXPORT_CHUNK))
+    return StreamingHttpResponse(stream, content_type="application/x-ndjson; charset=utf-8")
+
+
+async def _top_words(request):
+    """api_topwords / api_wordcloud 공통 집계 → ([[단어, 빈도], ...], partial)"""
+    q = (request.GET.get("q") or "").strip()
     try:
         days = int(request.GET.get("days", RECENT_DAYS))
     except ValueError:
         days = RECENT_DAYS
 
-    # q가 없으면 기존처럼 DB 집계
+    # q가 없으면 일자별 롤업 합산 (by=tokens 면 top_words 대신 전체 토큰 기준)
+    # 전체 기간(days=0)이나 window=month|YYYY-MM 은 스트리밍 요약에서 바로 (요약이 없으면 롤업)
     if not q:
-        qs = NewsArticle.objects.all()
-        if days > 0:
-            since = timezone.now() - timedelta(days=days)
-            qs = qs.filter(Q(created_at__gte=since) | Q(created_at__isnull=True))
-        agg = (
-            qs.values("top_words")
-              .annotate(cnt=Count("id"))
-              .order_by("-cnt")[:20]
-        )
-        return JsonResponse([[row["top_words"], row["cnt"]] for row in agg], safe=False)
+        kind = WordDailyCount.TOKEN if request.GET.get("by") == "tokens" else WordDailyCount.TOP
+        window = request.GET.get("window") or (topk.ALL if days <= 0 else "")
+        top = None
+        if window and settings.TOPK_ENABLED:
+            top = await sync_to_async(topk.top_words)(window, kind=kind)
+        if top is None:
+            top = await sync_to_async(rollups.top_words)(days, kind=kind)
+        return [[w, n] for w, n in top], False
 
     # q가 있으면: DB 매칭 + 실시간 결과 합쳐서 토큰 기준으로 집계
     terms = _expand_terms(q)
-    cond = Q()
-    for t in terms:
-        cond |= (Q(title__icontains=t) |
-                 Q(extracted_words__icontains=t) |
-                 Q(top_words__icontains=t))
 
     tokens = []
-    qs = NewsArticle.objects.all()
-    if days > 0:
-        since = timezone.now() - timedelta(days=days)
-        qs = qs.filter(Q(created_at__gte=since) | Q(created_at__isnull=True))
-    for row in qs.filter(cond).values_list("title", flat=True)[:1000]:
-        tokens.extend(_tokenize(row))
+    since = timezone.now() - timedelta(days=days) if days > 0 else None
+    # 관련도(bm25) 상위 1000개 기사의 저장된 토큰 (제목 재토큰화 없음)
+    for row in await sync_to_async(ranked_titles)(terms, since=since, limit=1000, field="extracted_words"):
+        tokens.extend(split_tokens(row))
 
     # 실시간도 합치기
-    live = _fetch_live_from_google_news(q, limit=100)
+    live, partial = await _fetch_live_from_google_news(q, limit=100)
     for item in live:
         tokens.extend(item["tokens"])
 
     counter = Counter(tokens)
     top = counter.most_common(20)
-    return JsonResponse([[w, int(n)] for w, n in top], safe=False)
\ No newline at end of file
+    return [[w, int(n)] for w, n in top], partial
+
+
+async def api_topwords(request):
+    """
+    상위 단어 TOP20 API
+    - q 없음: 최근 N일 로컬 DB 집계
+    - q 있음: DB 매칭 + 실시간 결과(구글 뉴스)까지 합쳐 제목 토큰으로 집계
+    - days=0 쿼리로 들어오면 날짜 제한 없이 DB를 조회 (q 없으면 전체 기간 스트리밍 요약, CrawlerApp.topk)
+    - window=month | YYYY-MM (q 없을 때): 그 달 요약의 상위 단어 (빈도는 근사, 실제 이상)
+    - by=tokens (q 없을 때): top_words 대신 extracted_words 토큰 빈도
+    """
+    top, partial = await _top_words(request)
+    return _json(top, partial)
+
+
+def _int_param(request, name, default, lo, hi):
+    try:
+        return min(hi, max(lo, int(request.GET.get(name, default))))
+    except ValueError:
+        return default
+
+
+async def api_wordcloud(request):
+    """
+    워드클라우드 이미지 (api_topwords 와 같은 q/days/by 파라미터)
+    - w, h: 크기(px), fmt: png | svg
+    - 같은 단어/가중치/크기면 캐시된 파일을 그대로 반환 (ETag = 내용 주소)
+    """
+    fmt = request.GET.get("fmt", "png")
+    if fmt not in clouds.FORMATS:
+        return JsonResponse({"error": "fmt must be png or svg"}, status=400)
+    width = _int_param(request, "w", 800, 100, WORDCLOUD_MAX_SIZE)
+    height = _int_param(request, "h", 400, 100, WORDCLOUD_MAX_SIZE)
+
+    top, partial = await _top_words(request)
+    if not top:
+        return JsonResponse({"error": "no words"}, status=404)
+    key = clouds.cache_key(top, width, height, fmt)
+    etag = f'"{key}"'
+    if request.headers.get("If-None-Match") == etag:
+        resp = HttpResponseNotModified()  # 내용 주소가 같으면 렌더링/캐시 조회 없이
+    else:
+        try:
+            data, key = await clouds.aget_cloud(top, width, height, fmt, key)
+        except ImportError:
+            return JsonResponse({"error": "wordcloud is not installed"}, status=503)
+        except (OSError, ValueError) as e:
+            # 대부분 WORDCLOUD_FONT_PATH 의 폰트가 없을 때 (OSError: cannot open resource)
+            return JsonResponse({"error": f"wordcloud rendering failed ({type(e).__name__}: {e}); "
+                                          f"check WORDCLOUD_FONT_PATH / WORDCLOUD_MASK"}, status=503)
+        resp = HttpResponse(data, content_type=clouds.FORMATS[fmt])
+    resp["ETag"] = etag
+    resp["Cache-Control"] = f"public, max-age={WORDCLOUD_MAX_AGE}"
+    if partial:
+        resp["X-Live-Partial"] = "1"
+    return resp
+
+
+def api_live_cache_stats(request):
+    """실시간 조회 캐시 hit/miss 카운터"""
+    return JsonResponse(_live_cache.stats())
+
+
+def api_trending(request):
+    """
+    급상승 단어 (compute_trending / crawl_news --trending 이 미리 계산한 결과만 읽음)
+    - limit: 개수 (기본 20, 최대 100)
+    - 응답: [{"word", "score"(z), "ratio", "recent", "expected"}, ...], 계산 시각은 X-Computed-At 헤더
+    """
+    limit = _int_param(request, "limit", 20, 1, 100)
+    rows = list(TrendingWord.objects.order_by("rank")[:limit])
+    resp = _json([{"word": t.word, "score": round(t.score, 2), "ratio": round(t.ratio, 2),
+                   "recent": t.recent, "expected": round(t.expected, 2)} for t in rows])
+    if rows:
+        resp["X-Computed-At"] = rows[0].computed_at.isoformat()
+    return resp
+
+
+def metrics_text(request):
+    """요청 수/지연, 단계별(db·upstream·parse·tokenize·insert) 시간 히스토그램 (Prometheus 텍스트 형식)"""
+    return HttpResponse(metrics.render(), content_type=metrics.CONTENT_TYPE)
\ No newline at end of file
@@ -41,6 +41,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'CrawlerApp.metrics.metrics_middleware',  # 요청/단계별 계측 (맨 앞: 다른 미들웨어 시간까지 포함)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -77,10 +78,29 @@ WSGI_APPLICATION = 'CrawlerProject.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        # 벤치마크/부하 테스트는 CRAWLER_DB_PATH 로 별도 DB 파일을 지정
+        'NAME': os.environ.get('CRAWLER_DB_PATH', BASE_DIR / 'db.sqlite3'),
+        # 요청마다 새로 연결하지 않고 스레드별 연결을 재사용 (0 이면 요청마다 닫음)
+        'CONN_MAX_AGE': int(os.environ.get('SQLITE_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # 쓰기 트랜잭션은 처음부터 쓰기 잠금을 잡는다 → 읽기→쓰기 승격 중 SQLITE_BUSY 로 바로 실패하지 않고
+            # busy_timeout 동안 기다린다
+            'transaction_mode': os.environ.get('SQLITE_TRANSACTION_MODE', 'IMMEDIATE') or None,
+        },
     }
 }
 
+# 연결마다 적용할 SQLite PRAGMA (CrawlerApp.dbtune). 환경 변수를 빈 값으로 주면 그 PRAGMA 는 생략
+SQLITE_PRAGMAS = {
+    'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'wal'),
+    'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'normal'),  # WAL 에서는 NORMAL 도 손상 없음
+    'busy_timeout': os.environ.get('SQLITE_BUSY_TIMEOUT', '5000'),  # ms
+    'cache_size': os.environ.get('SQLITE_CACHE_SIZE', '-65536'),  # 음수 = KiB (64MB)
+    'mmap_size': os.environ.get('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)),
+    'temp_store': os.environ.get('SQLITE_TEMP_STORE', 'memory'),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -123,6 +143,52 @@ STATICFILES_DIRS = [
 ]
 
 
+# Google News 검색 RSS (부하 테스트 때는 bench.fake_rss 주소로 바꿔서 실행)
+GOOGLE_NEWS_RSS_URL = os.environ.get("GOOGLE_NEWS_RSS_URL", "https://news.google.com/rss/search")
+
+
+# /api/wordcloud: 한글 폰트 경로(필수), 마스크 이미지(선택), 렌더링 결과 디스크 캐시 위치/최대 크기
+WORDCLOUD_FONT_PATH = os.environ.get("WORDCLOUD_FONT_PATH", "NanumGothic")
+WORDCLOUD_MASK = os.environ.get("WORDCLOUD_MASK", "")
+WORDCLOUD_CACHE_DIR = os.environ.get("WORDCLOUD_CACHE_DIR", os.path.join(BASE_DIR, "wordcloud_cache"))
+WORDCLOUD_CACHE_MAX_BYTES = int(os.environ.get("WORDCLOUD_CACHE_MAX_BYTES", 200 * 1024 * 1024))
+
+
+# 근사 중복 탐지 (CrawlerApp.neardup): 최근 N일 기사 SimHash 와 해밍 거리 MAX_DISTANCE 이하면 중복으로 묶음
+DEDUP_ENABLED = os.environ.get("DEDUP_ENABLED", "1") != "0"
+DEDUP_MAX_DISTANCE = int(os.environ.get("DEDUP_MAX_DISTANCE", 3))  # 4×16비트 밴드라 3 이하만 정확
+DEDUP_WINDOW_DAYS = int(os.environ.get("DEDUP_WINDOW_DAYS", 7))
+DEDUP_INDEX_TTL = float(os.environ.get("DEDUP_INDEX_TTL", 3600))  # 프로세스별 색인 재적재 주기(초)
+
+
+# 이미 본 링크 Bloom 필터 (CrawlerApp.linkfilter): 예상 링크 수 / 오탐률 / 저장 위치(비우면 DB 파일 옆)
+# VERIFY=1(기본)이면 필터 양성만 DB 로 다시 확인 (오탐으로 새 기사를 버리지 않음)
+# VERIFY=0 은 양성을 확인 없이 버린다: 오탐률만큼 새 기사가 영구히 빠지고, 버린 수는 경고 로그/metrics 로만 남음
+LINK_BLOOM_ENABLED = os.environ.get("LINK_BLOOM_ENABLED", "1") != "0"
+LINK_BLOOM_CAPACITY = int(os.environ.get("LINK_BLOOM_CAPACITY", 1_000_000))
+LINK_BLOOM_ERROR = float(os.environ.get("LINK_BLOOM_ERROR", 0.0001))
+LINK_BLOOM_PATH = os.environ.get("LINK_BLOOM_PATH", "")
+LINK_BLOOM_VERIFY = os.environ.get("LINK_BLOOM_VERIFY", "1") != "0"
+
+
+# 상위 단어 스트리밍 요약 (CrawlerApp.topk): 종류 × 구간(전체/월)마다 카운터 CAPACITY 개, 빈도 오차 ≤ 단어 수 합 / CAPACITY
+TOPK_ENABLED = os.environ.get("TOPK_ENABLED", "1") != "0"
+TOPK_CAPACITY = int(os.environ.get("TOPK_CAPACITY", 2000))
+
+
+# 급상승 단어 (CrawlerApp.trending): 최근 RECENT_HOURS 시간을 그 앞 BASELINE_DAYS 일의 시간당 평균/분산과 비교
+# 최근 MIN_COUNT 건 이상 나온 단어 중 z 점수 상위 TOP 개를 저장 (compute_trending / crawl_news --trending)
+TRENDING_ENABLED = os.environ.get("TRENDING_ENABLED", "1") != "0"
+TRENDING_RECENT_HOURS = int(os.environ.get("TRENDING_RECENT_HOURS", 6))
+TRENDING_BASELINE_DAYS = int(os.environ.get("TRENDING_BASELINE_DAYS", 30))
+TRENDING_MIN_COUNT = int(os.environ.get("TRENDING_MIN_COUNT", 5))
+TRENDING_TOP = int(os.environ.get("TRENDING_TOP", 100))
+
+
+# 계측 (CrawlerApp.metrics): /metrics 는 Prometheus 텍스트 형식, 응답마다 Server-Timing 헤더 (0 이면 헤더 생략)
+METRICS_SERVER_TIMING = os.environ.get("METRICS_SERVER_TIMING", "1") != "0"
+
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -0,0 +1,79 @@
+# bench/body_fetch_bench.py
+"""
+기사 본문 수집 단계 벤치마크 (CrawlerApp.bodies, 로컬 bench.fake_rss 서버)
+
+    python -m bench.body_fetch_bench --pages 2000 --concurrency 1 8 32 64 --latency 0.05
+
+- extract : 본문 추출만 (lxml, 단일 스레드) pages/s
+- fetch   : 동시 요청 수별 pages/s, MB/s (서버 응답 지연 --latency 초를 흉내)
+- memory  : 동시 요청 수별 tracemalloc 최대 사용량, 그 기울기 = 처리 중인 페이지 하나당 메모리
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from bench.fake_rss import make_article, serve
+from CrawlerApp.bodies import extract_text, fetch_bodies
+
+
+def bench_extract(n, paragraphs):
+    pages = [make_article(f"x/{i}", paragraphs) for i in range(min(n, 500))]
+    t0 = time.perf_counter()
+    for i in range(n):
+        extract_text(pages[i % len(pages)])
+    return round(n / (time.perf_counter() - t0), 1)
+
+
+def bench_fetch(base, pages, concurrency, tag):
+    links = [f"{base}/article/{tag}-{concurrency}/{i}" for i in range(pages)]
+    t0 = time.perf_counter()
+    results = fetch_bodies(links, concurrency=concurrency)
+    wall = time.perf_counter() - t0
+    ok = [r for r in results if r.status == 200 and r.text]
+    return {
+        "pages_per_s": round(len(ok) / wall, 1),
+        "mb_per_s": round(sum(r.nbytes for r in ok) / wall / 1e6, 2),
+        "errors": len(results) - len(ok),
+    }
+
+
+def bench_memory(base, pages, concurrency):
+    links = [f"{base}/article/mem-{concurrency}/{i}" for i in range(pages)]
+    tracemalloc.start()
+    base_mem = tracemalloc.get_traced_memory()[0]
+    fetch_bodies(links, concurrency=concurrency)
+    peak = tracemalloc.get_traced_memory()[1] - base_mem
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--pages", type=int, default=2000)
+    p.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    p.add_argument("--latency", type=float, default=0.05)
+    p.add_argument("--memory-pages", type=int, default=300)
+    p.add_argument("--paragraphs", type=int, default=8, help="기사 한 건의 문단 수 (페이지 크기)")
+    a = p.parse_args()
+
+    server, base = serve(latency=a.latency, paragraphs=a.paragraphs)
+    try:
+        page_kb = round(len(make_article("x/0", a.paragraphs)) / 1024, 1)
+        fetch, peak = {}, {}
+        for c in a.concurrency:
+            fetch[c] = bench_fetch(base, a.pages if c > 1 else min(a.pages, 200), c, "run")
+            peak[c] = bench_memory(base, a.memory_pages, c)
+    finally:
+        server.shutdown()
+    lo = min(peak)
+    memory = {c: {"peak_kb": round(kb, 1),
+                  "per_inflight_kb": round((kb - peak[lo]) / (c - lo), 1) if c > lo else None}
+              for c, kb in peak.items()}
+    print(json.dumps({"pages": a.pages, "latency": a.latency, "page_kb": page_kb,
+                      "extract_pages_per_s": bench_extract(2000, a.paragraphs), "fetch": fetch, "memory": memory},
+                     ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
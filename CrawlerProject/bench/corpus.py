@@ -0,0 +1,135 @@
+# bench/corpus.py
+"""
+합성 한국어 뉴스 코퍼스 (NewsArticle 10k / 100k / 1M 행)
+
+    python -m bench.corpus --rows 100000 --out /tmp/crawler_bench/corpus_100000.sqlite3
+
+- 빈 DB 에 migrate → executemany 로 적재 (FTS 트리거가 검색 색인도 같이 채움) → rebuild_wordcounts
+- 제목: 분야별 한국어 어휘 + 영문 약어/고유명사 + 숫자, 가끔 [속보]/[단독] 머리말, " - 언론사" 꼬리
+  단어 빈도는 지프 분포 (상위 단어 집계가 실제처럼 한쪽으로 쏠리게)
+- created_at 은 최근 --days 일에 고르게, 링크는 언론사 도메인별로 고유
+- 같은 --rows / --seed 면 같은 코퍼스
+"""
+import argparse
+import os
+import random
+import time
+from datetime import timedelta
+
+TOPICS = {
+    "정치": ["대통령", "국회", "여당", "야당", "국정감사", "총선", "개헌", "법안", "장관", "청문회",
+           "대변인", "의원", "탄핵", "예산안", "외교", "안보", "북한", "통일부", "지지율", "여론조사"],
+    "경제": ["금리", "환율", "물가", "증시", "코스피", "코스닥", "부동산", "전세", "대출", "수출",
+           "무역수지", "한국은행", "기준금리", "성장률", "실적", "영업이익", "투자", "채권", "원달러", "유가"],
+    "사회": ["경찰", "검찰", "법원", "재판", "사고", "화재", "교육부", "수능", "대학", "병원",
+           "의대", "노조", "파업", "출산율", "고령화", "복지", "날씨", "폭우", "미세먼지", "지하철"],
+    "IT": ["반도체", "인공지능", "스마트폰", "클라우드", "데이터센터", "배터리", "전기차", "자율주행", "로봇", "보안",
+           "해킹", "플랫폼", "게임", "메타버스", "통신", "5G", "6G", "칩", "파운드리", "HBM"],
+    "세계": ["미국", "중국", "일본", "유럽", "러시아", "우크라이나", "중동", "이스라엘", "백악관", "연준",
+           "관세", "무역전쟁", "정상회담", "G7", "UN", "NATO", "대선", "트럼프", "시진핑", "엔화"],
+}
+ENGLISH = ["AI", "GPU", "Samsung", "SK하이닉스", "LG", "Apple", "Google", "NVIDIA", "OpenAI", "Tesla",
+           "Meta", "Microsoft", "Amazon", "TSMC", "Intel", "K-pop", "BTS", "ChatGPT", "IPO", "ETF"]
+VERBS = ["발표", "확대", "추진", "논란", "급등", "급락", "전망", "우려", "합의", "출시",
+         "강화", "검토", "돌파", "회복", "둔화", "개최", "공개", "선정", "지원", "경고"]
+PREFIXES = ["[속보]", "[단독]", "[종합]", "[포토]"]
+PUBLISHERS = {
+    "연합뉴스": "www.yna.co.kr", "조선일보": "www.chosun.com", "중앙일보": "www.joongang.co.kr",
+    "동아일보": "www.donga.com", "한겨레": "www.hani.co.kr", "경향신문": "www.khan.co.kr",
+    "매일경제": "www.mk.co.kr", "한국경제": "www.hankyung.com", "전자신문": "www.etnews.com",
+    "ZDNet Korea": "zdnet.co.kr", "KBS": "news.kbs.co.kr", "MBC": "imnews.imbc.com",
+}
+
+
+def _zipf_cum(n, s=1.1):
+    cum, total = [], 0.0
+    for rank in range(1, n + 1):
+        total += 1.0 / rank ** s
+        cum.append(total)
+    return cum
+
+
+class TitleGenerator:
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.topics = list(TOPICS)
+        self.words = {t: ws + ENGLISH for t, ws in TOPICS.items()}
+        self.cum = {t: _zipf_cum(len(ws)) for t, ws in self.words.items()}
+        self.verb_cum = _zipf_cum(len(VERBS))
+        self.publishers = list(PUBLISHERS)
+
+    def __call__(self):
+        """→ (제목, 언론사)"""
+        rng = self.rng
+        topic = rng.choice(self.topics)
+        words = rng.choices(self.words[topic], cum_weights=self.cum[topic], k=rng.randint(3, 7))
+        parts = words + rng.choices(VERBS, cum_weights=self.verb_cum, k=1)
+        if rng.random() < 0.3:
+            parts.insert(rng.randrange(len(parts)), f"{rng.randint(1, 12)}월" if rng.random() < 0.5
+                         else f"{rng.randint(1, 99)}%")
+        if rng.random() < 0.1:
+            parts.insert(0, rng.choice(PREFIXES))
+        publisher = rng.choice(self.publishers)
+        return f"{' '.join(parts)} - {publisher}", publisher
+
+
+def generate(rows, days=30, seed=0, chunk=10000, simhash=True, log=print):
+    """현재 설정의 DB(CRAWLER_DB_PATH)에 rows 개 기사를 넣는다 (migrate 는 호출한 쪽에서)"""
+    from django.core.management import call_command
+    from django.db import connection, transaction
+    from django.utils import timezone
+
+    from CrawlerApp import neardup
+    from CrawlerApp.models import NewsArticle
+    from CrawlerApp.tokenizer import join_tokens, pick_top_word, tokenize
+
+    gen = TitleGenerator(seed)
+    rng = random.Random(seed + 1)
+    now = timezone.now()
+    span = days * 86400
+    table = NewsArticle._meta.db_table
+    sql = (f'INSERT INTO "{table}" ("title", "link", "extracted_words", "top_words", "created_at", "simhash") '
+           f'VALUES (%s, %s, %s, %s, %s, %s)')
+    t0 = time.perf_counter()
+    with transaction.atomic(), connection.cursor() as c:
+        for start in range(0, rows, chunk):
+            batch = []
+            for i in range(start, min(rows, start + chunk)):
+                title, publisher = gen()
+                tokens = tokenize(title)
+                sig = neardup.simhash(title) if simhash else 0
+                created = now - timedelta(seconds=rng.random() * span)
+                batch.append((title, f"https://{PUBLISHERS[publisher]}/article/{seed}/{i:08d}", join_tokens(tokens),
+                              pick_top_word(title), connection.ops.adapt_datetimefield_value(created),
+                              neardup.to_signed(sig) if sig else None))
+            c.executemany(sql, batch)
+            log(f"  {min(rows, start + chunk):,} / {rows:,} rows ({time.perf_counter() - t0:.1f}s)")
+    tokenize.cache_clear()
+    call_command("rebuild_wordcounts", verbosity=0)
+    log(f"  rollups rebuilt ({time.perf_counter() - t0:.1f}s)")
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--rows", type=int, default=10000)
+    p.add_argument("--out", required=True, help="만들 SQLite 파일 (있으면 덮어씀)")
+    p.add_argument("--days", type=int, default=30)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--no-simhash", action="store_true", help="SimHash 계산 생략 (1M 행 생성 시간 단축)")
+    a = p.parse_args()
+
+    for suffix in ("", "-wal", "-shm", ".links.bloom"):
+        if os.path.exists(a.out + suffix):
+            os.remove(a.out + suffix)
+    os.environ["CRAWLER_DB_PATH"] = a.out
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "CrawlerProject.settings")
+    import django
+    django.setup()
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+    generate(a.rows, a.days, a.seed, simhash=not a.no_simhash)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# bench/fake_rss.py
+"""
+로컬 가짜 RSS 서버 (crawl_news 동시 수집 / 부하 테스트용)
+
+    python -m bench.fake_rss --port 8765 --feeds 300 --items 30 --latency 0.2 --write-feeds feeds.txt
+    python manage.py crawl_news --feeds feeds.txt --concurrency 32 --sleep 0 --limit 100000
+
+/feed/<n>  : n번째 피드 (항목 링크는 피드마다 고유)
+/search?q= : Google News 검색 RSS 흉내
+/article/<key>/<i> : 기사 HTML (메뉴/스크립트/푸터 잡음 + 본문, crawl_news --bodies 용)
+/redirect/<key>/<i> : 302 → /article/<key>/<i>
+응답은 키마다 고정이고 ETag를 달아서 조건부 요청(304)도 확인할 수 있다.
+"""
+import argparse
+import hashlib
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape
+
+WORDS = ["반도체", "인공지능", "삼성전자", "정부", "국회", "경제", "환율", "금리", "스마트폰",
+         "클라우드", "게임", "수출", "AI", "배터리", "전기차", "서울", "미국", "중국", "증시", "날씨"]
+
+
+def make_title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 7)))
+
+
+def make_rss(key: str, items: int, base: str) -> bytes:
+    rng = random.Random(key)
+    now = formatdate(1700000000 + rng.randint(0, 86400), usegmt=True)
+    body = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<rss version="2.0"><channel>',
+        f"<title>fake {escape(key)}</title><link>{base}</link><description>fake</description>",
+    ]
+    for i in range(items):
+        link = f"{base}/article/{escape(key)}/{i}"
+        body.append(
+            f"<item><title>{escape(make_title(rng))}</title><link>{link}</link>"
+            f"<guid>{link}</guid><pubDate>{now}</pubDate></item>"
+        )
+    body.append("</channel></rss>")
+    return "\n".join(body).encode("utf-8")
+
+
+def make_article(key: str, paragraphs: int = 8) -> bytes:
+    rng = random.Random("article-" + key)
+    title = make_title(rng)
+    body = "\n".join(
+        f"<p>{escape(' '.join(make_title(rng) for _ in range(rng.randint(4, 8))))}.</p>" for _ in range(paragraphs)
+    )
+    menu = "".join(f'<li><a href="/section/{i}">{w}</a></li>' for i, w in enumerate(WORDS))
+    return f"""<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{escape(title)}</title>
+<script>var ad = {{"slot": "{key}", "words": "{' '.join(WORDS)}"}};</script><style>body{{margin:0}}</style></head>
+<body><header><nav><ul>{menu}</ul></nav></header>
+<div class="wrap"><aside><h3>많이 본 뉴스</h3><ul>{menu}</ul></aside>
+<div id="newsct"><h2>{escape(title)}</h2><div id="dic_area">{body}</div></div></div>
+<footer>Copyright fake news. 무단 전재 및 재배포 금지</footer></body></html>""".encode("utf-8")
+
+
+class FakeRSSHandler(BaseHTTPRequestHandler):
+    items = 30
+    latency = 0.0
+    paragraphs = 8
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        u = urlsplit(self.path)
+        if self.latency:
+            time.sleep(self.latency)
+        base = f"http://{self.headers.get('Host', 'localhost')}"
+        if u.path.startswith("/feed/"):
+            body = make_rss(u.path.rsplit("/", 1)[-1], self.items, base)
+        elif u.path == "/search":
+            q = parse_qs(u.query).get("q", [""])[0]
+            body = make_rss("search-" + q, self.items, base)
+        elif u.path.startswith("/redirect/"):
+            self.send_response(302)
+            self.send_header("Location", u.path.replace("/redirect/", "/article/", 1))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        elif u.path.startswith("/article/"):
+            body = make_article(u.path[len("/article/"):], self.paragraphs)
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        ctype = "text/html" if u.path.startswith("/article/") else "application/rss+xml"
+        self.send_header("Content-Type", f"{ctype}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeRSSServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # 부하 테스트 때 accept 대기열이 병목이 되지 않도록
+
+    def handle_error(self, request, client_address):
+        pass  # 클라이언트 타임아웃으로 끊긴 연결(BrokenPipe) 등은 무시
+
+
+def serve(port=0, items=30, latency=0.0, paragraphs=8):
+    """백그라운드 스레드로 서버를 띄우고 (server, base_url)을 반환"""
+    handler = type("Handler", (FakeRSSHandler,), {"items": items, "latency": latency, "paragraphs": paragraphs})
+    server = FakeRSSServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--feeds", type=int, default=300)
+    p.add_argument("--items", type=int, default=30)
+    p.add_argument("--latency", type=float, default=0.0)
+    p.add_argument("--write-feeds", default="")
+    a = p.parse_args()
+
+    server, base = serve(a.port, a.items, a.latency)
+    if a.write_feeds:
+        with open(a.write_feeds, "w", encoding="utf-8") as f:
+            f.writelines(f"{base}/feed/{i}\n" for i in range(a.feeds))
+    print(f"fake RSS on {base} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# bench/load_views.py
+"""
+WSGI(gunicorn 스레드) vs ASGI(uvicorn) 부하 테스트
+
+실시간 조회가 느린 상황을 bench.fake_rss(--latency)로 만들고
+서로 다른 검색어로 /api/articles?q=... 를 동시에 날려 처리량/지연을 비교한다.
+
+    python -m bench.load_views --requests 400 --concurrency 200 --latency 1.0
+
+gunicorn, uvicorn 이 설치되어 있어야 한다. DB는 db.sqlite3 복사본을 쓴다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from bench.fake_rss import serve
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+SERVERS = {
+    "wsgi": lambda port, workers, threads: [
+        sys.executable, "-m", "gunicorn", "CrawlerProject.wsgi:application",
+        "-b", f"127.0.0.1:{port}", "-w", str(workers), "--threads", str(threads),
+    ],
+    "asgi": lambda port, workers, threads: [
+        sys.executable, "-m", "uvicorn", "CrawlerProject.asgi:application",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers),
+        "--log-level", "warning",
+    ],
+}
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_ready(base, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{base}/api/live-cache", timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {base} did not start")
+
+
+async def _load(base, requests, concurrency, tag):
+    sem = asyncio.Semaphore(concurrency)
+    latencies, partial, errors = [], 0, 0
+
+    async with httpx.AsyncClient(timeout=60.0, limits=httpx.Limits(max_connections=concurrency)) as client:
+        async def one(i):
+            nonlocal partial, errors
+            async with sem:
+                t0 = time.perf_counter()
+                try:
+                    r = await client.get(f"{base}/api/articles", params={"q": f"{tag}{i}", "limit": 20})
+                except httpx.HTTPError:
+                    errors += 1
+                    return
+                latencies.append(time.perf_counter() - t0)
+                if r.status_code != 200:
+                    errors += 1
+                elif r.headers.get("X-Live-Partial"):
+                    partial += 1
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        wall = time.perf_counter() - t0
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "wall_s": round(wall, 3),
+        "req_per_s": round(requests / wall, 1),
+        "p50_ms": round(pct(0.50) * 1000, 1),
+        "p95_ms": round(pct(0.95) * 1000, 1),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 1) if latencies else 0.0,
+        "partial": partial,
+        "errors": errors,
+    }
+
+
+def run(kind, args, rss_base, db_path):
+    port = _free_port()
+    env = dict(os.environ, GOOGLE_NEWS_RSS_URL=f"{rss_base}/search", CRAWLER_DB_PATH=db_path,
+               DJANGO_SETTINGS_MODULE="CrawlerProject.settings")
+    proc = subprocess.Popen(SERVERS[kind](port, args.workers, args.threads), cwd=PROJECT_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        base = f"http://127.0.0.1:{port}"
+        _wait_ready(base)
+        return asyncio.run(_load(base, args.requests, args.concurrency, tag=f"{kind}-"))
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--requests", type=int, default=400)
+    p.add_argument("--concurrency", type=int, default=200)
+    p.add_argument("--latency", type=float, default=1.0, help="가짜 RSS 응답 지연(초)")
+    p.add_argument("--workers", type=int, default=1)
+    p.add_argument("--threads", type=int, default=8, help="gunicorn 워커당 스레드 수")
+    p.add_argument("--only", choices=sorted(SERVERS), default=None)
+    args = p.parse_args()
+
+    rss, rss_base = serve(items=30, latency=args.latency)
+    tmp = tempfile.mkdtemp(prefix="crawler-load-")
+    try:
+        db_path = os.path.join(tmp, "db.sqlite3")
+        shutil.copy(PROJECT_DIR / "db.sqlite3", db_path)
+        subprocess.run([sys.executable, "manage.py", "migrate", "-v0"], cwd=PROJECT_DIR, check=True,
+                       env=dict(os.environ, CRAWLER_DB_PATH=db_path))
+        results = {k: run(k, args, rss_base, db_path) for k in SERVERS if args.only in (None, k)}
+    finally:
+        rss.shutdown()
+        shutil.rmtree(tmp, ignore_errors=True)
+    print(json.dumps({"upstream_latency_s": args.latency, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
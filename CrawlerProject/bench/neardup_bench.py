@@ -0,0 +1,86 @@
+# bench/neardup_bench.py
+"""
+근사 중복 색인 벤치마크 (SimHashIndex)
+
+    python -m bench.neardup_bench --sizes 100000 1000000 --queries 20000
+
+- build  : 무작위 64비트 서명 n개로 색인을 만드는 시간
+- query  : 절반은 색인 안 서명에서 1~max_distance 비트를 뒤집은 값(심어 둔 중복), 절반은 무작위 값
+           → lookups/s, 심은 중복 재현율, 무작위 질의 오탐 수
+- add    : 색인에 하나씩 추가하는 속도 (ingest 후 remember 경로)
+- simhash: 가짜 제목 서명 계산 속도 (titles/s)
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from bench.fake_rss import make_title
+from CrawlerApp.neardup import SimHashIndex, simhash
+
+
+def _flip(sig, bits, rng):
+    for b in rng.sample(range(64), bits):
+        sig ^= 1 << b
+    return sig
+
+
+def run(n, queries, max_distance, seed=0):
+    gen = np.random.default_rng(seed)
+    rng = random.Random(seed)
+    sigs = gen.integers(0, 2 ** 64, size=n, dtype=np.uint64)
+
+    t0 = time.perf_counter()
+    index = SimHashIndex.build(sigs, np.arange(n), max_distance)
+    build = time.perf_counter() - t0
+
+    planted = [(int(i), _flip(int(sigs[i]), rng.randint(1, max_distance), rng))
+               for i in gen.integers(0, n, size=queries // 2)]
+    noise = [int(x) for x in gen.integers(0, 2 ** 64, size=queries - len(planted), dtype=np.uint64)]
+
+    t0 = time.perf_counter()
+    hits = sum(1 for i, q in planted if (r := index.query(q)) is not None and r[0] == i)
+    false_hits = sum(1 for q in noise if index.query(q) is not None)
+    lookup = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i, q in enumerate(noise):
+        index.add(q, n + i)
+    add = time.perf_counter() - t0
+
+    return {
+        "n": n,
+        "build_s": round(build, 3),
+        "lookups_per_s": round(queries / lookup),
+        "recall": round(hits / len(planted), 4),
+        "false_hits": false_hits,
+        "adds_per_s": round(len(noise) / add),
+    }
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000])
+    p.add_argument("--queries", type=int, default=20000)
+    p.add_argument("--max-distance", type=int, default=3)
+    p.add_argument("--titles", type=int, default=20000)
+    a = p.parse_args()
+
+    rng = random.Random(0)
+    titles = [f"{make_title(rng)} - 뉴스{i % 97}" for i in range(a.titles)]
+    t0 = time.perf_counter()
+    for t in titles:
+        simhash(t)
+    rate = a.titles / (time.perf_counter() - t0)
+    print(f"simhash                  : {rate:>12,.0f} titles/s")
+
+    for n in a.sizes:
+        r = run(n, a.queries, a.max_distance)
+        print(f"n={r['n']:>10,}  build {r['build_s']:>7.3f}s  "
+              f"query {r['lookups_per_s']:>9,}/s  recall {r['recall']:.4f}  "
+              f"false {r['false_hits']}  add {r['adds_per_s']:>9,}/s")
+
+
+if __name__ == "__main__":
+    main()
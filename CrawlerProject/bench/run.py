@@ -0,0 +1,251 @@
+# bench/run.py
+"""
+재현 가능한 벤치마크 묶음 → JSON (커밋 간 비교용)
+
+    python -m bench.run --sizes 10000 100000 --out bench-$(git rev-parse --short HEAD).json
+    python -m bench.run --sizes 10000 --baseline bench-old.json
+
+- 크기별 합성 코퍼스(bench.corpus)를 --cache-dir 에 한 번 만들어 두고 재사용 (크기/시드가 파일 이름)
+  재사용할 때 migrate 하고, 새 마이그레이션이 적용됐으면 롤업/요약도 rebuild_wordcounts 로 다시 만든다
+- 측정마다 코퍼스 복사본 + 별도 프로세스 (이전 측정의 캐시/연결이 섞이지 않게)
+  Google News 검색과 crawl_news 피드는 같은 프로세스 안의 가짜 RSS 서버(bench.fake_rss)로 돌린다
+- 측정 항목
+  index / api_articles (q 없음, q 있음) / api_topwords (days 여러 개, window=month, q 있음)
+    : 요청 지연 median·p95·min (ms)
+  api_trending : 요청 지연 (compute_trending 1회 시간은 compute_trending 항목)
+  crawl_news : 가짜 피드 전체 수집 1회 (items/s, 새 기사 / 유사 중복으로 묶인 수)
+  tokenize   : 코퍼스 제목 토큰화 tokens/s (cold = 캐시 없이, warm = 캐시 적중)
+- --baseline 을 주면 같은 항목끼리 비율(새/이전)을 stderr 에 출력
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE = os.path.join(tempfile.gettempdir(), "crawler_bench")
+SEARCH_TERMS = ["반도체", "금리", "AI", "대통령", "부동산", "NVIDIA"]
+TOPWORDS_DAYS = (0, 1, 3, 7, 30)
+
+
+def _ms(samples):
+    samples = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 2),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 2),
+        "min_ms": round(samples[0] * 1000, 2),
+        "n": len(samples),
+    }
+
+
+def _timed(fn, repeat, warmup=2):
+    for i in range(warmup):
+        fn(i)
+    samples = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - t0)
+    return _ms(samples)
+
+
+def worker(repeat, feeds, items):
+    """CRAWLER_DB_PATH 의 코퍼스 복사본으로 측정하고 dict 반환"""
+    from bench.fake_rss import serve
+
+    server, base = serve(items=items)
+    os.environ["GOOGLE_NEWS_RSS_URL"] = f"{base}/search"
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "CrawlerProject.settings")
+    import django
+    django.setup()
+    from django.core.management import call_command
+    from django.test import Client, override_settings
+
+    from bench.tokenize_bench import _run
+    from CrawlerApp.models import ArticleDuplicate, NewsArticle
+    from CrawlerApp.tokenizer import tokenize
+
+    client = Client()
+    out = {}
+
+    def get(path):
+        def fn(i):
+            r = client.get(path(i) if callable(path) else path)
+            assert r.status_code == 200, (r.status_code, r.content[:200])
+        return fn
+
+    t0 = time.perf_counter()
+    call_command("compute_trending", stdout=io.StringIO())
+    out["compute_trending"] = {"seconds": round(time.perf_counter() - t0, 3)}
+
+    term = lambda i: SEARCH_TERMS[i % len(SEARCH_TERMS)]
+    with override_settings(ALLOWED_HOSTS=["*"]):
+        out["index"] = _timed(get("/"), repeat)
+        out["api_articles"] = _timed(get("/api/articles?limit=20"), repeat)
+        # 검색어별 첫 요청은 실시간 결과 적재까지 포함 → 워밍업을 검색어 수만큼
+        out["api_articles_q"] = _timed(get(lambda i: f"/api/articles?limit=20&q={term(i)}"), repeat,
+                                       warmup=len(SEARCH_TERMS))
+        for d in TOPWORDS_DAYS:
+            out[f"api_topwords_days{d}"] = _timed(get(f"/api/topwords?days={d}"), repeat)
+        out["api_topwords_month"] = _timed(get("/api/topwords?window=month&by=tokens"), repeat)
+        out["api_topwords_q"] = _timed(get(lambda i: f"/api/topwords?days=7&q={term(i)}"), repeat,
+                                       warmup=len(SEARCH_TERMS))
+        out["api_trending"] = _timed(get("/api/trending"), repeat)
+
+    feeds_file = os.path.join(os.path.dirname(os.environ["CRAWLER_DB_PATH"]), "feeds.txt")
+    with open(feeds_file, "w", encoding="utf-8") as f:
+        f.writelines(f"{base}/feed/{i}\n" for i in range(feeds))
+    before = NewsArticle.objects.count(), ArticleDuplicate.objects.count()
+    t0 = time.perf_counter()
+    call_command("crawl_news", feeds=feeds_file, limit=feeds * items, concurrency=8, sleep=0,
+                 stdout=io.StringIO(), stderr=io.StringIO())
+    seconds = time.perf_counter() - t0
+    server.shutdown()
+    out["crawl_news"] = {"feeds": feeds, "items": feeds * items,
+                         "inserted": NewsArticle.objects.count() - before[0],
+                         "near_duplicates": ArticleDuplicate.objects.count() - before[1],
+                         "seconds": round(seconds, 3), "items_per_s": round(feeds * items / seconds, 1)}
+
+    titles = list(NewsArticle.objects.order_by("id").values_list("title", flat=True)[:20000])
+    cold = _run(tokenize.__wrapped__, titles, 3)
+    tokenize.cache_clear()
+    for t in titles:
+        tokenize(t)
+    out["tokenize"] = {"titles": len(titles), "cold_tokens_per_s": round(cold),
+                       "warm_tokens_per_s": round(_run(tokenize, titles, 3))}
+    return out
+
+
+def _manage(db, *args):
+    env = dict(os.environ, CRAWLER_DB_PATH=db, LINK_BLOOM_PATH=db + ".links.bloom")
+    return subprocess.run([sys.executable, "manage.py", *args], cwd=PROJECT_DIR, env=env,
+                          capture_output=True, text=True, check=True).stdout
+
+
+def _checkpoint(db):
+    with sqlite3.connect(db) as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    for suffix in ("-wal", "-shm", ".links.bloom"):
+        if os.path.exists(db + suffix):
+            os.remove(db + suffix)
+
+
+def _corpus(size, cache_dir, seed):
+    path = os.path.join(cache_dir, f"corpus_{size}_s{seed}.sqlite3")
+    if not os.path.exists(path):
+        print(f"generating {size:,}-row corpus → {path}", file=sys.stderr)
+        tmp = path + ".tmp"
+        subprocess.run([sys.executable, "-m", "bench.corpus", "--rows", str(size), "--seed", str(seed),
+                        "--out", tmp], cwd=PROJECT_DIR, check=True, stdout=sys.stderr)
+        _checkpoint(tmp)
+        os.replace(tmp, path)
+    elif "Applying" in _manage(path, "migrate"):
+        # 이전 커밋에서 만든 코퍼스: 새 테이블(롤업/요약)을 현재 코드로 다시 채운다
+        print(f"corpus {path} migrated, rebuilding rollups", file=sys.stderr)
+        _manage(path, "rebuild_wordcounts")
+        _checkpoint(path)
+    return path
+
+
+def run_size(size, a):
+    corpus = _corpus(size, a.cache_dir, a.seed)
+    work = tempfile.mkdtemp(prefix="crawler_bench_")
+    try:
+        db = os.path.join(work, "db.sqlite3")
+        shutil.copy(corpus, db)
+        env = dict(os.environ, CRAWLER_DB_PATH=db, LINK_BLOOM_PATH=db + ".links.bloom")
+        cmd = [sys.executable, "-m", "bench.run", "--worker", "--repeat", str(a.repeat),
+               "--feeds", str(a.feeds), "--items", str(a.items)]
+        proc = subprocess.run(cmd, cwd=PROJECT_DIR, env=env, stdout=subprocess.PIPE, text=True, check=True)
+        return json.loads(proc.stdout.strip().splitlines()[-1])
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def _meta(a):
+    import django
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=PROJECT_DIR,
+                                    capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = "", False
+    return {
+        "commit": commit, "dirty": dirty, "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(), "django": django.get_version(), "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(), "cpus": os.cpu_count(),
+        "repeat": a.repeat, "seed": a.seed, "feeds": a.feeds, "items": a.items,
+    }
+
+
+def _metrics(result):
+    """{크기: {항목: 값}} → {(크기, 항목, 지표): 값} (비교용으로 평탄화)"""
+    flat = {}
+    for size, benches in result["sizes"].items():
+        for name, values in benches.items():
+            for key in ("median_ms", "items_per_s", "cold_tokens_per_s", "warm_tokens_per_s"):
+                if key in values:
+                    flat[(size, name, key)] = values[key]
+    return flat
+
+
+def compare(new, old, stream=sys.stderr):
+    before = _metrics(old)
+    print(f"vs {old['meta'].get('commit') or '?'} (ratio = new/old; ms 는 낮을수록, /s 는 높을수록 좋음)",
+          file=stream)
+    for key, value in _metrics(new).items():
+        if before.get(key):
+            size, name, metric = key
+            print(f"  {size:>8} {name:<22} {metric:<18} {before[key]:>12,} → {value:>12,}"
+                  f"  ({value / before[key]:.2f}x)", file=stream)
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000],
+                   help="코퍼스 크기 (행 수). 1000000 은 첫 생성에 몇 분 걸린다")
+    p.add_argument("--repeat", type=int, default=30, help="요청 항목별 측정 횟수")
+    p.add_argument("--feeds", type=int, default=100, help="crawl_news 가짜 피드 수")
+    p.add_argument("--items", type=int, default=30, help="피드당 기사 수")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--cache-dir", default=DEFAULT_CACHE, help="생성한 코퍼스를 보관할 디렉터리")
+    p.add_argument("--out", default="", help="결과 JSON 파일 (없으면 stdout)")
+    p.add_argument("--baseline", default="", help="비교할 이전 결과 JSON")
+    p.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    a = p.parse_args()
+
+    if a.worker:
+        print(json.dumps(worker(a.repeat, a.feeds, a.items)))
+        return
+
+    os.makedirs(a.cache_dir, exist_ok=True)
+    result = {"meta": _meta(a), "sizes": {}}
+    for size in a.sizes:
+        print(f"running {size:,} rows ...", file=sys.stderr)
+        result["sizes"][str(size)] = run_size(size, a)
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if a.out:
+        with open(a.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if a.baseline:
+        with open(a.baseline, encoding="utf-8") as f:
+            compare(result, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
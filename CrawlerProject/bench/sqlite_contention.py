@@ -0,0 +1,161 @@
+# bench/sqlite_contention.py
+"""
+크롤링(대량 쓰기) 중 읽기 지연 벤치마크
+
+    python -m bench.sqlite_contention --seconds 20 --readers 4 --batch 500
+
+db.sqlite3 복사본에 프로필마다 두 프로세스를 띄운다.
+  - writer : crawl_news 처럼 ingest_articles 로 가짜 기사를 배치 단위로 계속 적재
+  - reader : 스레드 여러 개가 초기 화면 쿼리(최근 20건) + 제목 검색을 반복 (요청 경계마다 close_old_connections)
+프로필
+  - legacy : 예전 설정 (rollback journal, synchronous=FULL, PRAGMA 없음, 요청마다 새 연결, DEFERRED 트랜잭션)
+  - tuned  : settings 기본값 (WAL, synchronous=NORMAL, busy_timeout, cache/mmap, 연결 재사용, IMMEDIATE)
+결과: 읽기 p50/p95/p99/최대 지연, "database is locked" 등 오류 수, 쓰기 rows/s
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+PROFILES = {
+    "legacy": {
+        "SQLITE_JOURNAL_MODE": "delete", "SQLITE_SYNCHRONOUS": "full", "SQLITE_BUSY_TIMEOUT": "",
+        "SQLITE_CACHE_SIZE": "", "SQLITE_MMAP_SIZE": "", "SQLITE_TEMP_STORE": "",
+        "SQLITE_CONN_MAX_AGE": "0", "SQLITE_TRANSACTION_MODE": "",
+    },
+    "tuned": {},
+}
+SEARCH_TERMS = ["정부", "경제", "반도체", "서울", "AI", "금리"]
+
+
+def _setup():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "CrawlerProject.settings")
+    import django
+    django.setup()
+
+
+def _percentile(values, q):
+    return values[min(len(values) - 1, int(len(values) * q))] if values else None
+
+
+def writer(seconds, batch):
+    _setup()
+    from django.db import OperationalError
+    from bench.fake_rss import make_title
+    from CrawlerApp.ingest import ingest_articles
+    from CrawlerApp.tokenizer import join_tokens, pick_top_word, tokenize
+
+    rng = random.Random(os.getpid())
+    rows = errors = n = 0
+    deadline = time.monotonic() + seconds
+    t0 = time.perf_counter()
+    while time.monotonic() < deadline:
+        items = []
+        for _ in range(batch):
+            title = f"{make_title(rng)} {n}"
+            items.append({"title": title, "link": f"https://bench.example/{os.getpid()}/{n}",
+                          "extracted_words": join_tokens(tokenize(title)), "top_words": pick_top_word(title)})
+            n += 1
+        try:
+            rows += len(ingest_articles(items))
+        except OperationalError:
+            errors += 1
+    return {"rows": rows, "rows_per_s": round(rows / (time.perf_counter() - t0), 1), "errors": errors}
+
+
+def reader(seconds, threads):
+    _setup()
+    from django.db import OperationalError, close_old_connections
+    from CrawlerApp.models import NewsArticle
+    from CrawlerApp.search import filter_matching
+
+    latencies, errors = [], []
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def loop(i):
+        mine, failed = [], 0
+        while time.monotonic() < deadline:
+            t0 = time.perf_counter()
+            try:
+                list(NewsArticle.objects.order_by("-created_at", "-id")[:20].values("title", "link"))
+                qs = filter_matching(NewsArticle.objects.all(), [SEARCH_TERMS[i % len(SEARCH_TERMS)]])
+                list(qs.order_by("-created_at", "-id")[:20].values("title", "link"))
+                mine.append(time.perf_counter() - t0)
+            except OperationalError:
+                failed += 1
+            close_old_connections()  # 요청 끝 (CONN_MAX_AGE=0 이면 연결을 닫음)
+            i += 1
+        with lock:
+            latencies.extend(mine)
+            errors.append(failed)
+
+    ts = [threading.Thread(target=loop, args=(i,)) for i in range(threads)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    latencies.sort()
+    ms = lambda v: None if v is None else round(v * 1000, 2)
+    return {
+        "reads": len(latencies),
+        "reads_per_s": round(len(latencies) / seconds, 1),
+        "p50_ms": ms(_percentile(latencies, 0.50)),
+        "p95_ms": ms(_percentile(latencies, 0.95)),
+        "p99_ms": ms(_percentile(latencies, 0.99)),
+        "max_ms": ms(latencies[-1] if latencies else None),
+        "errors": sum(errors),
+    }
+
+
+def _spawn(role, args, env):
+    cmd = [sys.executable, "-m", "bench.sqlite_contention", "--role", role,
+           "--seconds", str(args.seconds), "--readers", str(args.readers), "--batch", str(args.batch)]
+    return subprocess.Popen(cmd, cwd=PROJECT_DIR, env=env, stdout=subprocess.PIPE, text=True)
+
+
+def run(profile, args, tmp):
+    db_path = os.path.join(tmp, f"{profile}.sqlite3")
+    shutil.copy(PROJECT_DIR / "db.sqlite3", db_path)
+    env = dict(os.environ, CRAWLER_DB_PATH=db_path, LINK_BLOOM_PATH=db_path + ".bloom", **PROFILES[profile])
+    subprocess.run([sys.executable, "manage.py", "migrate", "-v0"], cwd=PROJECT_DIR, env=env, check=True)
+    procs = {"writer": _spawn("writer", args, env), "reader": _spawn("reader", args, env)}
+    return {role: json.loads(p.communicate()[0]) for role, p in procs.items()}
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--role", choices=["writer", "reader"])
+    p.add_argument("--seconds", type=float, default=20)
+    p.add_argument("--readers", type=int, default=4)
+    p.add_argument("--batch", type=int, default=500)
+    p.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    a = p.parse_args()
+
+    if a.role == "writer":
+        print(json.dumps(writer(a.seconds, a.batch)))
+        return
+    if a.role == "reader":
+        print(json.dumps(reader(a.seconds, a.readers)))
+        return
+
+    tmp = tempfile.mkdtemp(prefix="sqlite_contention_")
+    try:
+        results = {name: run(name, a, tmp) for name in a.profiles}
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print(json.dumps({"seconds": a.seconds, "readers": a.readers, "batch": a.batch, "results": results},
+                     ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
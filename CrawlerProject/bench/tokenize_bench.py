@@ -0,0 +1,61 @@
+# bench/tokenize_bench.py
+"""
+제목 토크나이저 마이크로 벤치마크 (tokens/sec)
+
+    python -m bench.tokenize_bench --titles 20000 --repeat 5
+
+before : 예전 views._tokenize (호출마다 re.findall + 리스트 두 번)
+cold   : CrawlerApp.tokenizer.tokenize, 캐시 비운 상태 (컴파일된 정규식만 효과)
+warm   : 같은 제목을 다시 토큰화 (api_topwords / 피드 재수집처럼 반복되는 경우)
+"""
+import argparse
+import random
+import re
+import time
+
+from bench.fake_rss import make_title
+from CrawlerApp.tokenizer import STOPWORDS, tokenize
+
+
+def legacy_tokenize(title):
+    toks = [w.lower() for w in re.findall(r"[가-힣A-Za-z0-9]{2,}", title)]
+    return [w for w in toks if w not in STOPWORDS]
+
+
+def _run(fn, titles, repeat):
+    best = float("inf")
+    n_tokens = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        n_tokens = sum(len(fn(t)) for t in titles)
+        best = min(best, time.perf_counter() - t0)
+    return n_tokens / best
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--titles", type=int, default=20000)
+    p.add_argument("--repeat", type=int, default=5)
+    a = p.parse_args()
+
+    rng = random.Random(0)
+    titles = [f"{make_title(rng)} - 뉴스{i % 97}" for i in range(a.titles)]
+
+    before = _run(legacy_tokenize, titles, a.repeat)
+
+    def cold(t):
+        return tokenize.__wrapped__(t)
+    after_cold = _run(cold, titles, a.repeat)
+
+    tokenize.cache_clear()
+    for t in titles:
+        tokenize(t)
+    after_warm = _run(tokenize, titles, a.repeat)
+
+    print(f"before (views._tokenize) : {before:>12,.0f} tokens/s")
+    print(f"after, cold cache         : {after_cold:>12,.0f} tokens/s  ({after_cold / before:.2f}x)")
+    print(f"after, warm cache         : {after_warm:>12,.0f} tokens/s  ({after_warm / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
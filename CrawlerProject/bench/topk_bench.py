@@ -0,0 +1,121 @@
+# bench/topk_bench.py
+"""
+상위 단어 스트리밍 요약(CrawlerApp.topk.SpaceSaving) 정확도 / 메모리 벤치마크 (DB 없음)
+
+    python -m bench.topk_bench --articles 200000 --vocab 200000 --capacities 100 500 2000 5000
+
+- 토큰 스트림: 기사당 --tokens 개, 앞쪽은 bench.corpus 어휘(자주 나오는 실제 단어), 뒤는 한글 음절로 만든
+  긴 꼬리 단어. 순위 r 의 확률 ∝ 1/r^s (--zipf)
+- ingest 처럼 --batch 기사 단위로 묶어 가중치 업데이트
+- 정답은 collections.Counter 전체 → most_common(k)
+결과(JSON): capacity 별 상위 k 재현율, 순서 일치, 보장된 순위 수, 상위 k 추정 빈도의 최대/평균 상대 오차,
+           관측 최대 과대 추정 vs 이론 상한(N/m), 저장 크기(zlib) vs 정확한 Counter 크기, 업데이트 tokens/s
+"""
+import argparse
+import json
+import os
+import time
+import zlib
+from collections import Counter
+
+import numpy as np
+
+from bench.corpus import ENGLISH, TOPICS, VERBS
+
+
+def make_vocab(n, seed=0):
+    head = list(dict.fromkeys([w for ws in TOPICS.values() for w in ws] + ENGLISH + VERBS))
+    rng = np.random.default_rng(seed)
+    tail, seen = [], set(head)
+    while len(head) + len(tail) < n:
+        size = rng.integers(2, 5)
+        w = "".join(chr(0xAC00 + int(c)) for c in rng.integers(0, 11172, size))
+        if w not in seen:
+            seen.add(w)
+            tail.append(w)
+    return head + tail
+
+
+def make_stream(articles, tokens, vocab, s, seed=0):
+    """→ 기사별 토큰 인덱스 배열 (articles × tokens)"""
+    rng = np.random.default_rng(seed + 1)
+    p = 1.0 / np.arange(1, len(vocab) + 1) ** s
+    cum = np.cumsum(p / p.sum())
+    return np.searchsorted(cum, rng.random((articles, tokens)))
+
+
+def exact_size(counter):
+    """정확한 Counter 를 같은 방식(단어 + uint64 카운트, zlib)으로 저장했을 때 크기"""
+    words = "\0".join(counter).encode("utf-8")
+    return len(zlib.compress(words + np.fromiter(counter.values(), dtype="<u8").tobytes()))
+
+
+def run(capacity, batches, exact, k):
+    from CrawlerApp.topk import SpaceSaving
+
+    sk = SpaceSaving(capacity)
+    t0 = time.perf_counter()
+    for weights in batches:
+        sk.update(weights)
+    elapsed = time.perf_counter() - t0
+
+    truth = exact.most_common(k)
+    true_top = {w for w, _ in truth}
+    est = sk.top(k)
+    errs = [abs(c - exact[w]) / exact[w] for w, c, _ in est]
+    over = max(sk.counts[w] - exact[w] for w in sk.counts)
+    return {
+        "capacity": capacity,
+        "recall": round(len(true_top & {w for w, _, _ in est}) / k, 4),
+        "same_order": [w for w, _, _ in est] == [w for w, _ in truth],
+        "guaranteed": sk.guaranteed(k),
+        "max_rel_error": round(max(errs), 5),
+        "mean_rel_error": round(sum(errs) / len(errs), 5),
+        "max_overestimate": over,
+        "bound_n_over_m": round(sk.total / capacity, 1),
+        "bytes": len(sk.to_bytes()),
+        "tokens_per_s": round(sk.total / elapsed),
+    }
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--articles", type=int, default=200000)
+    p.add_argument("--tokens", type=int, default=8, help="기사당 토큰 수")
+    p.add_argument("--vocab", type=int, default=200000)
+    p.add_argument("--zipf", type=float, default=1.05)
+    p.add_argument("--batch", type=int, default=500, help="업데이트 한 번에 묶을 기사 수 (ingest BATCH_SIZE)")
+    p.add_argument("--capacities", type=int, nargs="+", default=[100, 250, 500, 1000, 2000, 5000])
+    p.add_argument("-k", type=int, default=20)
+    p.add_argument("--seed", type=int, default=0)
+    a = p.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "CrawlerProject.settings")
+    import django
+    django.setup()  # CrawlerApp.topk 가 모델을 import
+
+    vocab = make_vocab(a.vocab, a.seed)
+    stream = make_stream(a.articles, a.tokens, vocab, a.zipf, a.seed)
+    batches = []
+    for i in range(0, a.articles, a.batch):
+        ids, n = np.unique(stream[i:i + a.batch], return_counts=True)
+        order = np.argsort(-n, kind="stable")
+        batches.append([(vocab[j], int(c)) for j, c in zip(ids[order], n[order])])
+
+    t0 = time.perf_counter()
+    exact = Counter()
+    for weights in batches:
+        for w, c in weights:
+            exact[w] += c
+    exact_s = time.perf_counter() - t0
+
+    print(json.dumps({
+        "articles": a.articles, "tokens": int(stream.size), "vocab": a.vocab, "distinct": len(exact),
+        "zipf": a.zipf, "k": a.k,
+        "exact": {"counters": len(exact), "bytes": exact_size(exact), "tokens_per_s": round(stream.size / exact_s)},
+        "sketch": [run(m, batches, exact, a.k) for m in a.capacities],
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
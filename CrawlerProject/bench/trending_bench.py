@@ -0,0 +1,151 @@
+# bench/trending_bench.py
+"""
+급상승 단어 재계산(CrawlerApp.trending) 벤치마크
+
+    python -m bench.trending_bench --terms 100000 --days 30 --bursts 50
+
+- kernel : 단어 × 시간 카운트 행렬 (--terms × (--days·24 + 최근 시간)), 단어별 시간당 평균은 지프 분포
+           청크 단위로 만든 행렬에서 최근 합/기준 합/제곱합 축약 + trending.scores + trending.rank 시간만 잰다
+- db     : 같은 분포를 시간마다 --articles-per-hour 기사 × --tokens 토큰으로 뽑아 WordHourlyCount 에 넣고
+           trending.compute() (GROUP BY 적재 + 점수 + TrendingWord 교체) 전체 시간을 잰다
+- 두 경우 모두 --bursts 개 단어(중간 빈도)에 최근 구간에만 평소의 --burst-factor 배를 더해서
+  상위 --bursts 개 안에 몇 개가 잡히는지(recall)도 같이 본다
+결과는 JSON
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+
+def _rates(terms, s, per_hour):
+    """단어별 시간당 평균 (합이 per_hour)"""
+    p = 1.0 / np.arange(1, terms + 1) ** s
+    return p / p.sum() * per_hour
+
+
+def _bursts(terms, n, rng):
+    # 상위 1% 는 늘 많이 나오는 단어라 제외, 중간 빈도에서 고른다
+    lo = max(n, terms // 100)
+    return rng.choice(np.arange(lo, min(terms, lo * 20)), size=n, replace=False)
+
+
+def kernel(a, rng):
+    from CrawlerApp import trending
+
+    R, B = a.recent_hours, a.days * 24
+    rates = _rates(a.terms, a.zipf, a.articles_per_hour * a.tokens)
+    burst = _bursts(a.terms, a.bursts, rng)
+    recent = np.zeros(a.terms)
+    s1 = np.zeros(a.terms)
+    s2 = np.zeros(a.terms)
+    reduce_s = 0.0
+    for lo in range(0, a.terms, a.chunk):
+        hi = min(a.terms, lo + a.chunk)
+        m = rng.poisson(rates[lo:hi, None], size=(hi - lo, B + R)).astype(np.float64)
+        sel = burst[(burst >= lo) & (burst < hi)] - lo
+        m[sel, B:] += rng.poisson(rates[lo:hi][sel, None] * a.burst_factor + 1, size=(len(sel), R))
+        t0 = time.perf_counter()
+        base = m[:, :B]
+        recent[lo:hi] = m[:, B:].sum(axis=1)
+        s1[lo:hi] = base.sum(axis=1)
+        s2[lo:hi] = np.einsum("ij,ij->i", base, base)
+        reduce_s += time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    z, ratio, expected = trending.scores(recent, s1, s2, R, B)
+    top = trending.rank(z, recent, a.min_count, a.bursts)
+    score_s = time.perf_counter() - t0
+    return {
+        "terms": a.terms, "hours": B + R,
+        "reduce_ms": round(reduce_s * 1000, 1), "score_rank_ms": round(score_s * 1000, 2),
+        "total_ms": round((reduce_s + score_s) * 1000, 1),
+        "burst_recall": round(len(set(top) & set(burst)) / a.bursts, 3),
+    }
+
+
+def db(a, rng):
+    from django.core.management import call_command
+    from django.db import connection, transaction
+    from django.utils import timezone
+
+    from CrawlerApp import trending
+    from CrawlerApp.models import TrendingWord, WordHourlyCount
+
+    call_command("migrate", verbosity=0)
+    R, B = a.recent_hours, a.days * 24
+    rates = _rates(a.terms, a.zipf, a.articles_per_hour * a.tokens)
+    cum = np.cumsum(rates / rates.sum())
+    burst = _bursts(a.terms, a.bursts, rng)
+    now = timezone.now()
+    end = trending.hour_of(now)
+    first = end - R + 1 - B
+
+    t0 = time.perf_counter()
+    table = connection.ops.quote_name(WordHourlyCount._meta.db_table)
+    sql = f'INSERT INTO {table} ("hour", "word", "count") VALUES (%s, %s, %s)'
+    nnz = 0
+    with transaction.atomic(), connection.cursor() as c:
+        for h in range(first, end + 1):
+            ids, n = np.unique(np.searchsorted(cum, rng.random(a.articles_per_hour * a.tokens)),
+                               return_counts=True)
+            counts = dict(zip(ids.tolist(), n.tolist()))
+            if h > end - R:
+                for j, extra in zip(burst.tolist(), rng.poisson(rates[burst] * a.burst_factor + 1).tolist()):
+                    counts[j] = counts.get(j, 0) + extra
+            c.executemany(sql, [(h, f"w{j}", n) for j, n in counts.items()])
+            nnz += len(counts)
+    fill_s = time.perf_counter() - t0
+
+    best = min((trending.compute(now) for _ in range(a.repeat)), key=lambda s: s["total_s"])
+    found = {int(w[1:]) for w in TrendingWord.objects.order_by("rank")[:a.bursts].values_list("word", flat=True)}
+    return {
+        "terms": best["terms"], "rows": nnz, "hours": B + R, "fill_s": round(fill_s, 2),
+        "load_ms": round(best["load_s"] * 1000, 1), "score_ms": round(best["score_s"] * 1000, 2),
+        "total_ms": round(best["total_s"] * 1000, 1),
+        "burst_recall": round(len(found & set(burst.tolist())) / a.bursts, 3),
+    }
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--terms", type=int, default=100000)
+    p.add_argument("--days", type=int, default=30, help="기준 구간 일수")
+    p.add_argument("--recent-hours", type=int, default=6)
+    p.add_argument("--zipf", type=float, default=1.05)
+    p.add_argument("--articles-per-hour", type=int, default=200, help="db 모드의 시간당 기사 수")
+    p.add_argument("--tokens", type=int, default=8, help="기사당 제목 토큰 수")
+    p.add_argument("--bursts", type=int, default=50)
+    p.add_argument("--burst-factor", type=float, default=5.0)
+    p.add_argument("--min-count", type=int, default=5)
+    p.add_argument("--chunk", type=int, default=5000, help="kernel 모드에서 한 번에 만드는 단어 수")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--modes", nargs="+", default=["kernel", "db"], choices=["kernel", "db"])
+    p.add_argument("--seed", type=int, default=0)
+    a = p.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="trending_bench_")
+    os.environ["CRAWLER_DB_PATH"] = os.path.join(tmp, "db.sqlite3")
+    os.environ["LINK_BLOOM_PATH"] = os.path.join(tmp, "links.bloom")
+    os.environ["TRENDING_RECENT_HOURS"] = str(a.recent_hours)
+    os.environ["TRENDING_BASELINE_DAYS"] = str(a.days)
+    os.environ["TRENDING_MIN_COUNT"] = str(a.min_count)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "CrawlerProject.settings")
+    import django
+    django.setup()
+
+    out = {"recent_hours": a.recent_hours, "days": a.days, "bursts": a.bursts, "burst_factor": a.burst_factor}
+    try:
+        for mode in a.modes:
+            out[mode] = (kernel if mode == "kernel" else db)(a, np.random.default_rng(a.seed))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print(json.dumps(out, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,103 @@
 from flask import Flask, render_template, request, jsonify
 import mysql.connector
+from mysql.connector import errorcode, pooling
+import os
+import threading
+import time
 import urllib.parse
 
 app = Flask(__name__)
 
+# DB 접속 정보 / 풀 크기 (환경 변수로 변경 가능, MYSQL_POOL_SIZE=0 이면 요청마다 새 연결)
+DB_CONFIG = {
+    "host": os.environ.get("MYSQL_HOST", "localhost"),
+    "port": int(os.environ.get("MYSQL_PORT", "3306")),
+    "user": os.environ.get("MYSQL_USER", "root"),
+    "password": os.environ.get("MYSQL_PASSWORD", "1234"),
+    "database": os.environ.get("MYSQL_DATABASE", "news_db"),
+    "autocommit": True,  # 풀에 돌아간 연결이 예전 스냅샷을 계속 보지 않도록
+}
+POOL_SIZE = int(os.environ.get("MYSQL_POOL_SIZE", "8"))
+POOL_TIMEOUT = float(os.environ.get("MYSQL_POOL_TIMEOUT", "5"))  # 풀이 비었을 때 기다리는 최대 초
+
+# 상위 단어 응답 캐시: 크롤러가 keywords_links 를 쓸 때마다 crawl_version 을 올리면 무효화된다.
+# 버전 확인 쿼리도 VERSION_CHECK_INTERVAL 초에 한 번만 한다 (0 이면 매 요청)
+TOP_WORDS_CACHE = os.environ.get("TOP_WORDS_CACHE", "1") != "0"
+VERSION_CHECK_INTERVAL = float(os.environ.get("TOP_WORDS_VERSION_CHECK", "2"))
+
+# news_data.title 에 FULLTEXT(ngram) 인덱스가 있으면 MATCH ... AGAINST 로 검색 (schema.sql)
+_fulltext = os.environ.get("SEARCH_FULLTEXT", "1") != "0"
+NGRAM_TOKEN_SIZE = 2
+
+_pool = None
+_pool_lock = threading.Lock()
+
+_top_words_cache = {}  # category -> (version, rows)
+_version = (0.0, None)  # (확인 시각, 버전)
+_cache_lock = threading.Lock()
+
+
+class BlockingPool(pooling.MySQLConnectionPool):
+    """
+    빈 풀에서 get_connection 이 바로 PoolError 를 내지 않고, 연결이 반납(add_connection)될 때까지
+    timeout 초 동안 기다린다 (Condition 으로 깨움, 폴링 없음)
+    """
+
+    def __init__(self, *args, **kwargs):
+        # 부모 __init__ 이 add_connection 으로 풀을 채우므로 먼저 만든다
+        self._returned = threading.Condition()
+        self._returns = 0
+        super().__init__(*args, **kwargs)
+
+    def add_connection(self, cnx=None):
+        super().add_connection(cnx)
+        with self._returned:
+            self._returns += 1
+            self._returned.notify()
+
+    def get_connection(self, timeout=0.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._returned:
+                seen = self._returns
+            try:
+                return super().get_connection()
+            except pooling.PoolError:
+                remaining = deadline - time.monotonic()
+                # 시도와 대기 사이에 반납된 경우는 카운터가 바뀌어 있어 바로 다시 시도
+                with self._returned:
+                    if remaining <= 0 or not self._returned.wait_for(lambda: self._returns != seen, remaining):
+                        raise
+
+
 def get_db_connection():
-    connection = mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="1234",
-        database="news_db"
-    )
-    return connection
+    """풀에서 연결을 하나 꺼낸다 (비어 있으면 POOL_TIMEOUT 초까지 대기). close() 하면 풀로 돌아간다."""
+    global _pool
+    if POOL_SIZE <= 0:
+        return mysql.connector.connect(**DB_CONFIG)
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BlockingPool(pool_name="crawler", pool_size=POOL_SIZE,
+                                     pool_reset_session=False, **DB_CONFIG)
+    return _pool.get_connection(timeout=POOL_TIMEOUT)
+
+
+def current_version(cursor):
+    global _version
+    checked_at, version = _version
+    now = time.monotonic()
+    if version is not None and now - checked_at < VERSION_CHECK_INTERVAL:
+        return version
+    try:
+        cursor.execute("SELECT version FROM crawl_version WHERE id = 1")
+        row = cursor.fetchone()
+        version = row[0] if row else 0
+    except mysql.connector.Error:
+        version = 0  # crawl_version 테이블이 아직 없음
+    _version = (now, version)
+    return version
+
 
 @app.route('/')
 def index():
@@ -21,32 +107,61 @@ def index():
 def get_top_words(category):
     category = urllib.parse.unquote(category)  # 디코딩 추가
     connection = get_db_connection()
-    cursor = connection.cursor()
-    
-    cursor.execute("""
-        SELECT keyword, COUNT(*) as freq 
-        FROM keywords_links 
-        WHERE category = %s 
-        GROUP BY keyword 
-        ORDER BY freq DESC 
-        LIMIT 20
-    """, (category,))
-    
-    top_words = cursor.fetchall()
-    cursor.close()
-    connection.close()
+    try:
+        cursor = connection.cursor()
+        version = current_version(cursor) if TOP_WORDS_CACHE else None
+        if version is not None:
+            with _cache_lock:
+                cached = _top_words_cache.get(category)
+            if cached and cached[0] == version:
+                cursor.close()
+                return jsonify(cached[1])
+
+        cursor.execute("""
+            SELECT keyword, COUNT(*) as freq
+            FROM keywords_links
+            WHERE category = %s
+            GROUP BY keyword
+            ORDER BY freq DESC
+            LIMIT 20
+        """, (category,))
+
+        top_words = cursor.fetchall()
+        cursor.close()
+    finally:
+        connection.close()
+
+    if version is not None:
+        with _cache_lock:
+            _top_words_cache[category] = (version, top_words)
     return jsonify(top_words)
 
 @app.route('/search', methods=['POST'])
 def search():
+    global _fulltext
     word = request.json['word']
     connection = get_db_connection()
-    cursor = connection.cursor()
-    cursor.execute("SELECT title, link FROM news_data WHERE title LIKE %s", ("%" + word + "%",))
-    links = cursor.fetchall()
-    cursor.close()
-    connection.close()
+    try:
+        cursor = connection.cursor()
+        links = None
+        if _fulltext and len(word) >= NGRAM_TOKEN_SIZE and '"' not in word:
+            try:
+                # ngram 인덱스에서 구문 검색 = 부분 문자열 검색 (LIKE 와 같은 결과, 풀스캔 없음)
+                cursor.execute("SELECT title, link FROM news_data WHERE MATCH(title) AGAINST (%s IN BOOLEAN MODE)",
+                               (f'"{word}"',))
+                links = cursor.fetchall()
+            except mysql.connector.Error as e:
+                if e.errno != errorcode.ER_FT_MATCHING_KEY_NOT_FOUND:
+                    raise  # 연결 끊김/타임아웃 등은 이번 요청만 실패 (FULLTEXT 는 계속 사용)
+                links = None  # FULLTEXT 인덱스가 없음 → 이후로는 LIKE 만
+                _fulltext = False
+        if links is None:
+            cursor.execute("SELECT title, link FROM news_data WHERE title LIKE %s", ("%" + word + "%",))
+            links = cursor.fetchall()
+        cursor.close()
+    finally:
+        connection.close()
     return jsonify([{"title": link[0], "link": link[1]} for link in links])
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True)
@@ -0,0 +1,91 @@
+"""
+app.py 처리량 벤치마크 (로컬 MySQL/MariaDB 필요)
+
+    python bench_app.py --requests 2000 --concurrency 16
+
+같은 프로세스에서 app 을 스레드 서버로 띄우고 설정을 바꿔 가며 req/s 를 잰다.
+  - no-pool      : 요청마다 새 연결 (예전 방식)
+  - pool         : 연결 풀
+  - pool+cache   : 연결 풀 + 상위 단어 응답 캐시
+DB 접속 정보는 app.py 와 같은 환경 변수(MYSQL_HOST, MYSQL_USER, ...)를 쓴다.
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import make_server
+
+import app as webapp
+
+CATEGORIES = ["정치", "경제", "사회", "생활/문화", "세계", "IT/과학"]
+WORDS = ["정부", "대통령", "경제", "금리", "반도체", "AI", "서울", "미국"]
+
+# 이름: (연결 풀 사용, 상위 단어 캐시 사용)
+VARIANTS = {
+    "no-pool": (False, False),
+    "pool": (True, False),
+    "pool+cache": (True, True),
+}
+
+
+def configure(pool_size, cache):
+    webapp.POOL_SIZE = pool_size
+    webapp.TOP_WORDS_CACHE = cache
+    webapp._pool = None  # pool_name 이 같아도 새로 만든다
+    webapp._top_words_cache.clear()
+    webapp._version = (0.0, None)
+
+
+def request_once(base, i):
+    if i % 4 == 3:  # 4번에 1번은 검색
+        body = json.dumps({"word": WORDS[i % len(WORDS)]}).encode()
+        req = urllib.request.Request(f"{base}/search", data=body, headers={"Content-Type": "application/json"})
+    else:
+        req = urllib.request.Request(f"{base}/get_top_words/{urllib.parse.quote(CATEGORIES[i % len(CATEGORIES)])}")
+    t0 = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=30) as r:
+        r.read()
+    return time.perf_counter() - t0
+
+
+def run(base, requests, concurrency):
+    with ThreadPoolExecutor(concurrency) as ex:
+        list(ex.map(lambda i: request_once(base, i), range(concurrency)))  # 워밍업
+        t0 = time.perf_counter()
+        latencies = sorted(ex.map(lambda i: request_once(base, i), range(requests)))
+        wall = time.perf_counter() - t0
+    return {
+        "req_per_s": round(requests / wall, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95)] * 1000, 2),
+    }
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--requests", type=int, default=2000)
+    p.add_argument("--concurrency", type=int, default=16)
+    p.add_argument("--pool-size", type=int, default=8)
+    args = p.parse_args()
+
+    server = make_server("127.0.0.1", 0, webapp.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    results = {}
+    try:
+        for name, (pooled, cache) in VARIANTS.items():
+            configure(args.pool_size if pooled else 0, cache)
+            results[name] = run(base, args.requests, args.concurrency)
+    finally:
+        server.shutdown()
+    print(json.dumps({"requests": args.requests, "concurrency": args.concurrency, "results": results},
+                     ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
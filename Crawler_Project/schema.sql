@@ -0,0 +1,17 @@
+-- Crawler_Project/schema.sql
+-- app.py 가 쓰는 인덱스/버전 테이블 (news_db 에 한 번 실행)
+--   mysql -u root -p news_db < schema.sql
+
+-- /get_top_words: WHERE category = ? GROUP BY keyword → 인덱스만으로 처리
+CREATE INDEX idx_keywords_links_category_keyword ON keywords_links (category, keyword);
+
+-- /search: 제목 부분 문자열 검색을 ngram FULLTEXT 로 (MySQL 5.7.6+, ngram_token_size 기본값 2)
+-- MariaDB 는 ngram 파서가 없으므로 이 줄은 건너뛰고 SEARCH_FULLTEXT=0 으로 실행 (LIKE 검색)
+ALTER TABLE news_data ADD FULLTEXT INDEX ft_news_data_title (title) WITH PARSER ngram;
+
+-- 크롤러가 keywords_links 를 새로 쓸 때마다 version 을 올린다 → app.py 의 상위 단어 캐시 무효화
+CREATE TABLE IF NOT EXISTS crawl_version (
+    id TINYINT PRIMARY KEY,
+    version BIGINT NOT NULL
+);
+INSERT IGNORE INTO crawl_version (id, version) VALUES (1, 0);
@@ -0,0 +1,142 @@
+"""
+Selenium fallback 용 헤드리스 브라우저 풀
+
+- headless Chrome N개를 띄워 두고 카테고리/실행 간에 재사용
+- 이미지·폰트·CSS 요청은 차단 (목록 HTML만 필요)
+- time.sleep 대신 li.sa_item._LAZY_LOADING_WRAP 개수가 늘어날 때까지 명시적 대기
+- 카테고리를 세션들에 나눠서 동시에 수집하고, 전체/페이지별 소요 시간을 기록
+
+사용:
+    with BrowserPool(size=3) as pool:
+        results = pool.crawl(categories, clicks=9)   # {카테고리: [(제목, 링크), ...]}
+        print(pool.report())
+"""
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+from naver_section import parse_items
+
+LIST_URL = "https://news.naver.com/main/main.naver?mode=LSD&mid=shm&sid1={sid}"
+ITEM_SELECTOR = "li.sa_item._LAZY_LOADING_WRAP"
+MORE_SELECTOR = "a.section_more_inner._CONTENT_LIST_LOAD_MORE_BUTTON"
+
+# 네트워크 단에서 막을 리소스
+BLOCKED_URLS = ["*.css", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+                "*.woff", "*.woff2", "*.ttf", "*.otf"]
+
+
+def make_driver(headless=True, driver_path=None):
+    opts = webdriver.ChromeOptions()
+    if headless:
+        opts.add_argument("--headless=new")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+    })
+    driver = webdriver.Chrome(service=ChromeService(driver_path or ChromeDriverManager().install()), options=opts)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    return driver
+
+
+def _item_count(driver):
+    return len(driver.find_elements("css selector", ITEM_SELECTOR))
+
+
+def crawl_category(driver, sid, clicks=9, timeout=10.0):
+    """
+    한 카테고리: 목록 열기 + 더보기 clicks번 (항목 수가 늘어날 때까지 대기)
+    반환: [(제목, 링크), ...], [페이지별 소요 초]
+    """
+    timings = []
+    wait = WebDriverWait(driver, timeout)
+
+    t0 = time.perf_counter()
+    driver.get(LIST_URL.format(sid=sid))
+    wait.until(lambda d: _item_count(d) > 0)
+    timings.append(time.perf_counter() - t0)
+
+    for _ in range(clicks):
+        t0 = time.perf_counter()
+        before = _item_count(driver)
+        buttons = driver.find_elements("css selector", MORE_SELECTOR)
+        if not buttons:
+            break
+        driver.execute_script("arguments[0].click();", buttons[0])
+        try:
+            wait.until(lambda d: _item_count(d) > before)
+        except TimeoutException:
+            break  # 더 불러올 기사가 없음
+        timings.append(time.perf_counter() - t0)
+
+    return parse_items(driver.page_source), timings
+
+
+class BrowserPool:
+    def __init__(self, size=2, headless=True, timeout=10.0):
+        self.size = max(1, size)
+        self.timeout = timeout
+        driver_path = ChromeDriverManager().install()  # 한 번만 받아 두고 세션마다 재사용
+        with ThreadPoolExecutor(self.size) as ex:
+            self.drivers = list(ex.map(lambda _: make_driver(headless, driver_path), range(self.size)))
+        self._idle = queue.Queue()
+        for d in self.drivers:
+            self._idle.put(d)
+        self.page_times = {}
+        self.wall_time = 0.0
+
+    def _crawl_one(self, category, sid, clicks):
+        driver = self._idle.get()
+        try:
+            items, timings = crawl_category(driver, sid, clicks, self.timeout)
+        except WebDriverException as e:
+            print(f"[browser] {category}: {type(e).__name__}: {e.msg}")
+            items, timings = [], []
+        finally:
+            self._idle.put(driver)
+        self.page_times[category] = timings
+        return category, items
+
+    def crawl(self, categories, clicks=9):
+        """카테고리를 세션들에 나눠서 동시에 수집"""
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(self.size) as ex:
+            done = dict(ex.map(lambda kv: self._crawl_one(kv[0], kv[1], clicks), categories.items()))
+        self.wall_time = time.perf_counter() - t0
+        return {c: done[c] for c in categories}
+
+    def report(self):
+        lines = [f"Browser crawl: {len(self.page_times)} categories, {self.size} sessions, {self.wall_time:.2f}s"]
+        for category, timings in self.page_times.items():
+            if timings:
+                avg = sum(timings) / len(timings)
+                lines.append(f"  {category}: {len(timings)} pages, total {sum(timings):.2f}s, "
+                             f"avg {avg:.2f}s, max {max(timings):.2f}s")
+            else:
+                lines.append(f"  {category}: failed")
+        return "\n".join(lines)
+
+    def close(self):
+        for d in self.drivers:
+            try:
+                d.quit()
+            except WebDriverException:
+                pass
+        self.drivers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
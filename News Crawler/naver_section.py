@@ -0,0 +1,216 @@
+"""
+네이버 뉴스 섹션 크롤러 (HTTP 우선)
+
+- 브라우저 없이 섹션 목록 페이지와 "기사 더보기" 엔드포인트를 직접 호출
+- httpx.AsyncClient 하나를 커넥션 풀로 공유하고 카테고리들을 동시에 수집
+- lxml 로 파싱 (parse_* 함수는 HTML 문자열만 받으므로 저장해 둔 HTML로 바로 확인 가능)
+- HTTP로 한 건도 못 가져온 카테고리만 헤드리스 브라우저 풀로 다시 시도 (fallback=True, browser_pool.py)
+
+사용:
+    results = crawl(categories, pages=10)   # {카테고리: [(제목, 링크), ...]}
+
+    python naver_section.py --pages 3       # 카테고리별 건수/소요 시간 출력
+    python naver_section.py --save-fixtures tests/fixtures   # 테스트용 섹션/더보기 응답 저장 (경제)
+"""
+import argparse
+import asyncio
+import atexit
+import json
+import os
+import time
+
+import httpx
+from lxml import html as lxml_html
+
+SECTION_URL = "https://news.naver.com/section/{sid}"
+# "기사 더보기" 버튼이 부르는 템플릿 엔드포인트 (JSON 안에 렌더링된 HTML 조각이 들어 있음)
+MORE_URL = "https://news.naver.com/section/template/{template}"
+DEFAULT_TEMPLATE = "SECTION_ARTICLE_LIST"
+
+# 카테고리별 네이버 뉴스 섹션 ID
+CATEGORIES = {
+    "정치": "100",
+    "경제": "101",
+    "사회": "102",
+    "생활/문화": "103",
+    "세계": "104",
+    "IT/과학": "105"
+}
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/124.0 Safari/537.36")
+
+_ITEM_XPATH = "//li[contains(concat(' ', normalize-space(@class), ' '), ' sa_item ')]"
+_TITLE_XPATH = ".//strong[contains(concat(' ', normalize-space(@class), ' '), ' sa_text_strong ')]"
+
+
+def parse_items(page_html):
+    """목록 HTML → [(제목, 링크), ...] (li.sa_item 기준, 원래 스크립트와 같은 추출 규칙)"""
+    if not page_html or not page_html.strip():
+        return []
+    doc = lxml_html.fromstring(page_html)
+    items = []
+    for li in doc.xpath(_ITEM_XPATH):
+        strong = li.xpath(_TITLE_XPATH)
+        links = li.xpath(".//a[@href]/@href")
+        if not strong or not links:
+            continue
+        title = strong[0].text_content().strip()
+        if title:
+            items.append((title, links[0]))
+    return items
+
+
+def parse_cursor(page_html):
+    """다음 페이지 커서 → (템플릿 ID, 커서) 또는 None"""
+    if not page_html or not page_html.strip():
+        return None
+    doc = lxml_html.fromstring(page_html)
+    for el in doc.xpath("//*[@data-cursor]"):
+        cursor = el.get("data-cursor")
+        if cursor:
+            return el.get("data-template-id") or DEFAULT_TEMPLATE, cursor
+    return None
+
+
+def parse_more(payload, template=DEFAULT_TEMPLATE):
+    """더보기 응답(JSON) → 목록 HTML 조각"""
+    data = json.loads(payload)
+    rendered = data.get("renderedComponent") or {}
+    return rendered.get(template) or next(iter(rendered.values()), "")
+
+
+def more_params(sid, page_no, cursor):
+    return {"sid": sid, "sid2": "", "cluid": "", "pageNo": page_no, "date": "", "next": cursor}
+
+
+async def crawl_section(client, sid, pages=10):
+    """섹션 1페이지 + 더보기 (pages - 1)번 → 중복 제거된 [(제목, 링크), ...]"""
+    r = await client.get(SECTION_URL.format(sid=sid))
+    r.raise_for_status()
+    seen, items = set(), []
+
+    def add(found):
+        # 같은 페이지 안에서도 헤드라인과 목록에 같은 기사가 겹쳐 나온다
+        new = []
+        for t, l in found:
+            if l not in seen:
+                seen.add(l)
+                new.append((t, l))
+        items.extend(new)
+        return new
+
+    add(parse_items(r.text))
+    cur = parse_cursor(r.text)
+    for page_no in range(2, pages + 1):
+        if cur is None:
+            break
+        template, cursor = cur
+        r = await client.get(MORE_URL.format(template=template), params=more_params(sid, page_no, cursor))
+        r.raise_for_status()
+        fragment = parse_more(r.text, template)
+        if not add(parse_items(fragment)):
+            break
+        cur = parse_cursor(fragment)
+        if cur is None or cur[1] == cursor:
+            break
+    return items
+
+
+async def crawl_all(categories, pages=10, concurrency=6, timeout=10.0, transport=None):
+    """
+    모든 카테고리를 동시에 수집
+    반환: {카테고리: [(제목, 링크), ...]}, {카테고리: 에러 메시지}
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    sem = asyncio.Semaphore(concurrency)
+    results, errors = {}, {}
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True,
+                                 headers={"User-Agent": USER_AGENT}, transport=transport) as client:
+        async def one(category, sid):
+            async with sem:
+                try:
+                    results[category] = await crawl_section(client, sid, pages)
+                except (httpx.HTTPError, ValueError) as e:
+                    results[category] = []
+                    errors[category] = f"{type(e).__name__}: {e}"
+
+        await asyncio.gather(*(one(c, s) for c, s in categories.items()))
+    return {c: results[c] for c in categories}, errors
+
+
+async def save_fixtures(out_dir, sid="101", timeout=10.0):
+    """섹션 1페이지 HTML + 첫 더보기 JSON 을 그대로 저장 (tests/test_naver_section.py 가 읽는 파일)"""
+    os.makedirs(out_dir, exist_ok=True)
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True,
+                                 headers={"User-Agent": USER_AGENT}) as client:
+        r = await client.get(SECTION_URL.format(sid=sid))
+        r.raise_for_status()
+        with open(os.path.join(out_dir, f"naver_section_{sid}.html"), "w", encoding="utf-8") as f:
+            f.write(r.text)
+        cur = parse_cursor(r.text)
+        if cur is None:
+            raise ValueError("section page has no data-cursor")
+        template, cursor = cur
+        r = await client.get(MORE_URL.format(template=template), params=more_params(sid, 2, cursor))
+        r.raise_for_status()
+        with open(os.path.join(out_dir, f"naver_more_{sid}_p2.json"), "w", encoding="utf-8") as f:
+            f.write(r.text)
+
+
+_browser_pool = None
+
+
+def crawl_with_selenium(categories, clicks=9, browsers=2):
+    """브라우저 경로 (헤드리스 Chrome 풀). HTTP 수집이 막혔을 때만 쓴다.
+    풀은 프로세스 안에서 한 번만 띄우고 이후 호출에서도 재사용한다."""
+    global _browser_pool
+    from browser_pool import BrowserPool
+
+    if _browser_pool is None or _browser_pool.size < min(browsers, len(categories)):
+        if _browser_pool is not None:
+            _browser_pool.close()
+        _browser_pool = BrowserPool(size=min(browsers, len(categories)))
+        atexit.register(_browser_pool.close)
+    results = _browser_pool.crawl(categories, clicks)
+    print(_browser_pool.report())
+    return results
+
+
+def crawl(categories, pages=10, concurrency=6, timeout=10.0, fallback=True, browsers=2):
+    """동기 진입점. HTTP로 비어 있는 카테고리는 fallback=True 면 Selenium 으로 다시 수집"""
+    t0 = time.perf_counter()
+    results, errors = asyncio.run(crawl_all(categories, pages, concurrency, timeout))
+    for category, err in errors.items():
+        print(f"[http] {category}: {err}")
+    print(f"HTTP crawl: {sum(map(len, results.values()))} items in {time.perf_counter() - t0:.2f}s")
+
+    missing = {c: categories[c] for c, items in results.items() if not items}
+    if missing and fallback:
+        print(f"Falling back to Selenium for: {', '.join(missing)}")
+        results.update(crawl_with_selenium(missing, clicks=pages - 1, browsers=browsers))
+    return results
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--pages", type=int, default=10, help="카테고리당 페이지 수 (1 + 더보기 횟수)")
+    p.add_argument("--concurrency", type=int, default=6)
+    p.add_argument("--no-fallback", action="store_true")
+    p.add_argument("--browsers", type=int, default=2, help="fallback 때 띄울 헤드리스 브라우저 수")
+    p.add_argument("--save-fixtures", metavar="DIR", help="수집 대신 테스트 fixture 를 DIR 에 저장")
+    args = p.parse_args()
+
+    if args.save_fixtures:
+        asyncio.run(save_fixtures(args.save_fixtures))
+        return
+
+    results = crawl(CATEGORIES, args.pages, args.concurrency, fallback=not args.no_fallback,
+                    browsers=args.browsers)
+    for category, items in results.items():
+        print(f"{category}: {len(items)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Okt 배치 토큰화 벤치마크: 워커 수별 titles/sec
+
+    python okt_bench.py --titles titles.txt --workers 0 1 2 4 8
+
+--titles 를 주지 않으면 합성 제목을 만든다. 분석 자체를 재려고 디스크 캐시는 끈다.
+워커 풀 기동(JVM 로딩) 시간은 startup_s 로 따로 보여준다.
+"""
+import argparse
+import json
+import random
+import time
+
+from okt_tokenizer import OktTokenizer
+
+WORDS = ["정부", "대통령", "국회", "경제", "금리", "반도체", "삼성전자", "배터리", "수출", "물가", "부동산", "서울",
+         "AI", "인공지능", "스타트업", "투자", "증시", "환율", "기업", "노조", "선거", "외교", "미국", "중국", "일본",
+         "발표", "논란", "확대", "추진", "전망", "급등", "하락", "협상", "규제", "지원", "개발", "출시", "공개"]
+
+
+def synthetic_titles(n, seed=0):
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(5, 10))) + f" … {i}" for i in range(n)]
+
+
+def run(titles, workers, chunk_size):
+    t0 = time.perf_counter()
+    with OktTokenizer(workers=workers, cache_path=None, chunk_size=chunk_size) as tok:
+        tok.warmup()
+        t1 = time.perf_counter()
+        tok.tokenize_many(titles)
+        t2 = time.perf_counter()
+    return {
+        "workers": workers,
+        "titles": len(titles),
+        "startup_s": round(t1 - t0, 3),
+        "elapsed_s": round(t2 - t1, 3),
+        "titles_per_s": round(len(titles) / (t2 - t1), 1),
+    }
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--titles", help="제목 파일 (한 줄에 하나)")
+    p.add_argument("-n", type=int, default=5000, help="합성 제목 수")
+    p.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+    p.add_argument("--chunk", type=int, default=64)
+    args = p.parse_args()
+
+    if args.titles:
+        with open(args.titles, encoding="utf-8") as f:
+            titles = [ln.strip() for ln in f if ln.strip()]
+    else:
+        titles = synthetic_titles(args.n)
+
+    results = [run(titles, w, args.chunk) for w in args.workers]
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
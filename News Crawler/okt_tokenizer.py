@@ -0,0 +1,152 @@
+"""
+Okt 형태소 분석 배치 서비스
+
+- 워커 프로세스마다 Okt(JVM)를 한 번만 띄워 두고 재사용 (ProcessPoolExecutor)
+- 명사 추출 → 불용어 제거 → 특수문자/숫자 제거를 한 번의 루프로 처리
+- 결과는 제목 해시 기준 디스크 캐시(SQLite)에 저장해서 이미 분석한 제목은 다시 돌리지 않음
+
+사용:
+    with OktTokenizer(workers=4) as tok:
+        filtered = tok.tokenize_many(titles)   # ["명사 명사 ...", ...] (입력 순서 유지)
+
+Windows 에서는 워커가 메인 모듈을 다시 import 하므로
+호출하는 스크립트는 반드시 if __name__ == "__main__": 안에서 실행해야 한다.
+"""
+import hashlib
+import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+# 추가로 제거할 불용어
+CUSTOM_STOPWORDS = ["뉴스", "기사", "제목", "…", "“", "”", ":", "-", "...", "외", "총", "일보", "특집", "되다", "보다", "높이다", "나서다", "하다", "막다", "열다", "이기다", "노리다", "달다",
+                    "이끌다", "지나치다", "강화하다", "억", "조", "뚝", "감", "은", "는", "이", "가"]
+
+# 한글과 영문을 제외한 모든 문자 (특수문자 제거 + 숫자 제거를 한 번에)
+pattern = re.compile(r'[^가-힣a-zA-Z]')
+
+DEFAULT_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "okt_cache.sqlite3")
+
+# 워커 프로세스 전역 (초기화 때 한 번만 생성)
+_okt = None
+_stop = frozenset()
+
+
+def english_stopwords():
+    from nltk.corpus import stopwords
+    return set(stopwords.words('english'))
+
+
+def _init_worker(stop):
+    global _okt, _stop
+    from konlpy.tag import Okt
+    _okt = Okt()
+    _okt.pos("워밍업", stem=True)  # JVM / 사전 로딩을 여기서 끝내 둔다
+    _stop = stop
+
+
+def filter_tokens(tokens, stop):
+    """okt.pos 결과 → 명사만, 불용어 제거, 한글/영문 외 문자 제거 (단일 패스)"""
+    out = []
+    for word, pos in tokens:
+        if pos != 'Noun' or word in stop:
+            continue
+        word = pattern.sub('', word)
+        if word:
+            out.append(word)
+    return ' '.join(out)
+
+
+def _analyze_chunk(titles):
+    return [filter_tokens(_okt.pos(t, stem=True), _stop) for t in titles]
+
+
+def title_key(title):
+    return hashlib.sha1(title.encode("utf-8")).hexdigest()
+
+
+class TokenCache:
+    """제목 해시 → 필터링된 토큰 문자열 (SQLite 파일 하나)"""
+
+    def __init__(self, path=DEFAULT_CACHE):
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS okt_tokens (h TEXT PRIMARY KEY, tokens TEXT NOT NULL)")
+
+    def get_many(self, keys, chunk=900):
+        found = {}
+        keys = list(keys)
+        for i in range(0, len(keys), chunk):
+            part = keys[i:i + chunk]
+            q = "SELECT h, tokens FROM okt_tokens WHERE h IN (%s)" % ",".join("?" * len(part))
+            found.update(self.db.execute(q, part).fetchall())
+        return found
+
+    def put_many(self, items):
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO okt_tokens (h, tokens) VALUES (?, ?)", items)
+
+    def close(self):
+        self.db.close()
+
+
+class OktTokenizer:
+    def __init__(self, workers=None, cache_path=DEFAULT_CACHE, chunk_size=64, stopwords=None):
+        """
+        workers: 워커 프로세스 수 (None 이면 CPU 수, 0 이면 현재 프로세스에서 직접 분석)
+        cache_path: None 이면 디스크 캐시 없이 매번 분석
+        """
+        self.workers = os.cpu_count() if workers is None else workers
+        self.chunk_size = chunk_size
+        stop = english_stopwords() if stopwords is None else set(stopwords)
+        self.stop = frozenset(stop | set(CUSTOM_STOPWORDS))
+        self.cache = TokenCache(cache_path) if cache_path else None
+        self.pool = None
+        if self.workers > 0:
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.stop,))
+        else:
+            _init_worker(self.stop)
+        self.analyzed = self.cached = 0
+
+    def warmup(self):
+        """워커 프로세스를 전부 미리 띄운다 (Okt/JVM 로딩 시간을 첫 배치에서 빼기)"""
+        if self.pool is not None:
+            list(self.pool.map(_analyze_chunk, [["워밍업"]] * self.workers))
+
+    def _analyze(self, titles):
+        if not titles:
+            return []
+        if self.pool is None:
+            return _analyze_chunk(titles)
+        chunks = [titles[i:i + self.chunk_size] for i in range(0, len(titles), self.chunk_size)]
+        return [r for part in self.pool.map(_analyze_chunk, chunks) for r in part]
+
+    def tokenize_many(self, titles):
+        keys = [title_key(t) for t in titles]
+        known = self.cache.get_many(set(keys)) if self.cache else {}
+
+        # 캐시에 없는 제목만 (중복 제거해서) 분석
+        todo = {}
+        for k, t in zip(keys, titles):
+            if k not in known and k not in todo:
+                todo[k] = t
+        results = self._analyze(list(todo.values()))
+        fresh = dict(zip(todo.keys(), results))
+        if self.cache and fresh:
+            self.cache.put_many(fresh.items())
+
+        self.analyzed += len(fresh)
+        self.cached += len(titles) - len(fresh)
+        known.update(fresh)
+        return [known[k] for k in keys]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,129 @@
+# tests/test_naver_section.py
+"""
+naver_section 파싱/페이지 넘김 테스트 (저장해 둔 HTML/JSON fixture, 네트워크 없음)
+
+    cd "News Crawler" && python -m pytest -q tests
+fixture 갱신: python naver_section.py --save-fixtures tests/fixtures
+"""
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+import httpx
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import naver_section  # noqa: E402
+
+FIXTURES = os.path.join(HERE, "fixtures")
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+SECTION = fixture("naver_section_101.html")
+MORE = fixture("naver_more_101_p2.json")
+
+
+def run_crawl(handler, pages):
+    """MockTransport 로 crawl_section 실행 → (결과, 받은 요청 목록)"""
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(record)) as client:
+            return await naver_section.crawl_section(client, "101", pages)
+
+    return asyncio.run(go()), requests
+
+
+def section_or(more_handler):
+    def handler(request):
+        if request.url.path == "/section/101":
+            return httpx.Response(200, text=SECTION)
+        return more_handler(request)
+    return handler
+
+
+class ParseTest(unittest.TestCase):
+    def test_parse_items(self):
+        items = naver_section.parse_items(SECTION)
+        # 헤드라인 2 + 목록 4 (광고 li 는 제목/링크가 없어 빠짐, 중복 제거는 crawl_section 에서)
+        self.assertEqual(len(items), 6)
+        self.assertEqual(items[0], ("한은, 기준금리 3.25%로 0.25%p 인하…38개월 만의 전환",
+                                    "https://n.news.naver.com/mnews/article/015/0005060001"))
+        self.assertEqual(items[1][0], "삼성전자 3분기 영업익 9조1000억…반도체 부진")  # 앞뒤 공백 제거
+        self.assertTrue(all(link.startswith("https://n.news.naver.com/") for _, link in items))
+
+    def test_parse_items_empty(self):
+        self.assertEqual(naver_section.parse_items(""), [])
+        self.assertEqual(naver_section.parse_items("<html><body></body></html>"), [])
+
+    def test_parse_cursor(self):
+        self.assertEqual(naver_section.parse_cursor(SECTION), ("SECTION_ARTICLE_LIST", "2024101814053112345"))
+        self.assertIsNone(naver_section.parse_cursor("<ul><li class='sa_item'></li></ul>"))
+        self.assertIsNone(naver_section.parse_cursor(""))
+
+    def test_parse_more(self):
+        fragment = naver_section.parse_more(MORE)
+        self.assertEqual([l.rsplit("/", 1)[1] for _, l in naver_section.parse_items(fragment)],
+                         ["0005860005", "0005100006", "0005250007"])
+        self.assertEqual(naver_section.parse_cursor(fragment), ("SECTION_ARTICLE_LIST", "2024101813412267890"))
+        # 템플릿 이름이 다르면 첫 조각
+        self.assertEqual(naver_section.parse_more(MORE, "OTHER"), fragment)
+        self.assertEqual(naver_section.parse_more('{"renderedComponent": {}}'), "")
+
+
+class CrawlSectionTest(unittest.TestCase):
+    def test_pagination_params(self):
+        items, reqs = run_crawl(section_or(lambda r: httpx.Response(200, text=MORE)), pages=2)
+        self.assertEqual(len(reqs), 2)
+        more = reqs[1].url
+        self.assertEqual(more.path, "/section/template/SECTION_ARTICLE_LIST")
+        self.assertEqual(more.params["sid"], "101")
+        self.assertEqual(more.params["pageNo"], "2")
+        self.assertEqual(more.params["next"], "2024101814053112345")
+        # 1페이지 5개(헤드라인과 겹치는 1개 제외) + 더보기 새 기사 2개
+        self.assertEqual(len(items), 7)
+        self.assertEqual(len({l for _, l in items}), 7)
+
+    def test_stops_when_no_new_items(self):
+        # 더보기가 계속 같은 응답 → 3페이지에서 새 기사가 없어 멈춘다
+        items, reqs = run_crawl(section_or(lambda r: httpx.Response(200, text=MORE)), pages=10)
+        self.assertEqual(len(reqs), 3)
+        self.assertEqual(len(items), 7)
+
+    def test_stops_when_cursor_missing(self):
+        data = json.loads(MORE)
+        frag = data["renderedComponent"]["SECTION_ARTICLE_LIST"]
+        data["renderedComponent"]["SECTION_ARTICLE_LIST"] = frag.replace('data-cursor="2024101813412267890"', "")
+        items, reqs = run_crawl(section_or(lambda r: httpx.Response(200, json=data)), pages=10)
+        self.assertEqual(len(reqs), 2)
+        self.assertEqual(len(items), 7)
+
+    def test_stops_when_cursor_repeats(self):
+        data = json.loads(MORE)
+        frag = data["renderedComponent"]["SECTION_ARTICLE_LIST"]
+        data["renderedComponent"]["SECTION_ARTICLE_LIST"] = frag.replace("2024101813412267890", "2024101814053112345")
+        items, reqs = run_crawl(section_or(lambda r: httpx.Response(200, json=data)), pages=10)
+        self.assertEqual(len(reqs), 2)
+
+    def test_pages_limit(self):
+        _, reqs = run_crawl(section_or(lambda r: httpx.Response(200, text=MORE)), pages=1)
+        self.assertEqual(len(reqs), 1)
+
+    def test_http_error(self):
+        with self.assertRaises(httpx.HTTPStatusError):
+            run_crawl(section_or(lambda r: httpx.Response(500)), pages=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+카테고리별 증분 TF-IDF 키워드 엔진
+
+- 카테고리 / 날짜별로 문서-단어 빈도 행렬(CSR)을 디스크에 저장 (tfidf_state/<카테고리>/YYYY-MM-DD.npz)
+- 새 제목만 그날 버킷에 덧붙인다 (이미 넣은 제목은 키 해시로 걸러냄)
+  키 해시는 마지막으로 들어온 날짜와 같이 저장 (seen.npy / seen_day.npy)
+- prune: 보관 기간이 지난 날짜 버킷과, 그 기간 동안 한 번도 다시 들어오지 않은 키 해시를 지운다
+- 상위 단어는 최근 N일 버킷을 합친 희소 행렬에서 바로 계산 (toarray 없음)
+- 점수는 TfidfVectorizer 기본값과 같은 방식: 소문자화, 2글자 이상 토큰, smooth idf, 문서별 L2 정규화 후 합산
+
+사용:
+    engine = KeywordEngine()
+    engine.add("정치", filtered_titles, keys=links)          # 오늘 버킷에 추가
+    engine.top_terms("정치", days=30, k=20, max_features=20)   # [(단어, 점수), ...]
+    engine.prune("정치", keep_days=30)                          # 디스크 상태 크기 유지
+"""
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from datetime import date, timedelta
+
+import numpy as np
+from scipy import sparse
+
+# TfidfVectorizer 기본 token_pattern
+TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tfidf_state")
+
+
+def _safe_name(category):
+    return re.sub(r'[\\/:*?"<>|]', "_", category)
+
+
+def _key_hash(key):
+    return int.from_bytes(hashlib.sha1(key.encode("utf-8")).digest()[:8], "little")
+
+
+def tfidf_scores(X):
+    """문서-단어 빈도 행렬 → 단어별 TF-IDF 합 (희소 행렬 그대로 계산)"""
+    n = X.shape[0]
+    df = np.bincount(X.indices, minlength=X.shape[1])
+    idf = np.log((1 + n) / (1 + df)) + 1
+    W = X.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(W.multiply(W).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    W = sparse.diags(1.0 / norms) @ W
+    return np.asarray(W.sum(axis=0)).ravel()
+
+
+def top_k(scores, k):
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.array([], dtype=int)
+    idx = np.argpartition(-scores, k - 1)[:k]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+class KeywordEngine:
+    def __init__(self, root=DEFAULT_DIR):
+        self.root = root
+        self._vocabs = {}  # category -> (words list, {word: index})
+
+    def _dir(self, category):
+        path = os.path.join(self.root, _safe_name(category))
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _vocab(self, category):
+        if category not in self._vocabs:
+            path = os.path.join(self._dir(category), "vocab.json")
+            words = []
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    words = json.load(f)
+            self._vocabs[category] = (words, {w: i for i, w in enumerate(words)})
+        return self._vocabs[category]
+
+    def _save_vocab(self, category):
+        words, _ = self._vocab(category)
+        path = os.path.join(self._dir(category), "vocab.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(words, f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+    def _day_path(self, category, day):
+        return os.path.join(self._dir(category), f"{day.isoformat()}.npz")
+
+    def _load_day(self, category, day, width):
+        path = self._day_path(category, day)
+        if not os.path.exists(path):
+            return None
+        X = sparse.load_npz(path).tocsr()
+        X.resize((X.shape[0], width))  # 그 뒤로 늘어난 단어 열은 0
+        return X
+
+    def _seen(self, category):
+        """→ (정렬된 키 해시, 해시별 마지막으로 들어온 날짜 ordinal). 날짜 파일이 없던 예전 상태는 오늘로 본다"""
+        path = os.path.join(self._dir(category), "seen.npy")
+        if not os.path.exists(path):
+            return np.array([], dtype=np.uint64), np.array([], dtype=np.int32)
+        hashes = np.load(path)
+        day_path = os.path.join(self._dir(category), "seen_day.npy")
+        if os.path.exists(day_path):
+            days = np.load(day_path)
+            if len(days) == len(hashes):
+                return hashes, days
+        return hashes, np.full(len(hashes), date.today().toordinal(), dtype=np.int32)
+
+    def _save_seen(self, category, hashes, days):
+        d = self._dir(category)
+        for name, arr in (("seen.npy", hashes), ("seen_day.npy", days)):
+            with open(os.path.join(d, name + ".tmp"), "wb") as f:
+                np.save(f, arr)
+            os.replace(os.path.join(d, name + ".tmp"), os.path.join(d, name))
+
+    def add(self, category, filtered_titles, day=None, keys=None):
+        """
+        filtered_titles: 공백으로 구분된 토큰 문자열 목록 (OktTokenizer.tokenize_many 결과)
+        keys: 중복 판단용 키 (링크 등). 주면 이전에 넣은 키는 건너뛴다.
+        반환: 새로 추가된 문서 수
+        """
+        day = day or date.today()
+        docs = list(filtered_titles)
+        if keys is not None:
+            seen, seen_day = self._seen(category)
+            hashes = np.array([_key_hash(k) for k in keys], dtype=np.uint64)
+            _, first = np.unique(hashes, return_index=True)  # 이번 배치 안의 중복도 제거
+            fresh = np.zeros(len(hashes), dtype=bool)
+            fresh[first] = True
+            fresh &= ~np.isin(hashes, seen)
+            docs = [d for d, ok in zip(docs, fresh) if ok]
+            # 이번에 들어온 키(새 키 + 다시 본 키)는 마지막 날짜를 day 로 → prune 이 아직 쓰이는 키를 지우지 않게
+            merged = np.union1d(seen, hashes)
+            days = np.empty(len(merged), dtype=np.int32)
+            days[np.searchsorted(merged, seen)] = seen_day
+            days[np.searchsorted(merged, hashes)] = day.toordinal()
+            if len(merged) != len(seen) or not np.array_equal(days, seen_day):
+                self._save_seen(category, merged, days)
+        if not docs:
+            return 0
+
+        words, index = self._vocab(category)
+        indptr, indices, data = [0], [], []
+        for doc in docs:
+            for word, cnt in Counter(TOKEN_RE.findall(doc.lower())).items():
+                col = index.get(word)
+                if col is None:
+                    col = index[word] = len(words)
+                    words.append(word)
+                indices.append(col)
+                data.append(cnt)
+            indptr.append(len(indices))
+        X = sparse.csr_matrix((np.array(data, dtype=np.int32), indices, indptr), shape=(len(docs), len(words)))
+
+        old = self._load_day(category, day, len(words))
+        if old is not None:
+            X = sparse.vstack([old, X], format="csr")
+        self._save_vocab(category)
+        sparse.save_npz(self._day_path(category, day), X)
+        return len(docs)
+
+    def window(self, category, days=30, today=None):
+        """최근 days일 버킷을 합친 문서-단어 빈도 행렬"""
+        today = today or date.today()
+        words, _ = self._vocab(category)
+        mats = [m for m in (self._load_day(category, today - timedelta(d), len(words)) for d in range(days))
+                if m is not None]
+        if not mats:
+            return sparse.csr_matrix((0, len(words)), dtype=np.int32)
+        return sparse.vstack(mats, format="csr")
+
+    def top_terms(self, category, days=30, k=20, max_features=None, today=None):
+        """
+        최근 days일 기준 TF-IDF 합 상위 k개 → [(단어, 점수), ...]
+        max_features: TfidfVectorizer(max_features=...)처럼 전체 빈도 상위 단어만 남기고 계산
+        """
+        X = self.window(category, days, today)
+        if X.shape[0] == 0:
+            return []
+        words, _ = self._vocab(category)
+        cols = np.arange(X.shape[1])
+        if max_features and max_features < X.shape[1]:
+            cols = top_k(np.asarray(X.sum(axis=0)).ravel().astype(float), max_features)
+            X = X[:, cols]
+        scores = tfidf_scores(X)
+        return [(words[cols[i]], float(scores[i])) for i in top_k(scores, k) if scores[i] > 0]
+
+    def prune(self, category, keep_days=30, today=None):
+        """
+        keep_days 보다 오래된 날짜 버킷 삭제 + 그동안 한 번도 다시 들어오지 않은 키 해시 삭제
+        (add 에 매번 전체 링크를 넘기면 아직 DB 에 있는 링크는 계속 남는다 → seen 크기는 입력 크기로 제한)
+        """
+        cutoff = (today or date.today()) - timedelta(keep_days)
+        for name in os.listdir(self._dir(category)):
+            stem, ext = os.path.splitext(name)
+            if ext == ".npz" and stem < cutoff.isoformat():
+                os.remove(os.path.join(self._dir(category), name))
+        seen, seen_day = self._seen(category)
+        keep = seen_day >= cutoff.toordinal()
+        if not keep.all():
+            self._save_seen(category, seen[keep], seen_day[keep])